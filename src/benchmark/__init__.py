@@ -0,0 +1,5 @@
+from .corpus_generator import SyntheticCorpusGenerator
+
+__all__ = [
+    "SyntheticCorpusGenerator",
+]
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memoised pinyin layer in CNUtils against plain dragonmapper on a CJ3 key set.
+
+    python -m benchmark.cj3_transcription                     # resources/CJ3/index/index_d.tsv if present
+    python -m benchmark.cj3_transcription --index path/to/index_d.tsv
+    python -m benchmark.cj3_transcription --pages 20000       # synthetic CJ3-like key set
+
+Per page, every key is classified twice (numbered / unnumbered pinyin, as map_pinyin_to_hanzi
+does) and every pinyin reading is converted to zhuyin (as CJ3Parser does). Both sides are
+checked for identical results first. Exits with 1 on any mismatch.
+"""
+import sys
+import random
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import dragonmapper.transcriptions as dt
+
+from utils.lang import CNUtils
+
+DEFAULT_INDEX = Path(__file__).parent.parent.parent / "resources/CJ3/index/index_d.tsv"
+HANZI = "中国人大学生汉语词典你好我们他们时候工作问题朋友老师电话东西地方意思"
+
+
+def load_index_pages(index_path: Path) -> List[List[str]]:
+    pages: Dict[str, List[str]] = {}
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            for page in parts[1:]:
+                pages.setdefault(page, []).append(parts[0])
+    return list(pages.values())
+
+
+def build_synthetic_pages(page_count: int, seed: int) -> List[List[str]]:
+    """Hanzi, numbered, accented and toneless pinyin keys per page, with Zipf-like syllable reuse"""
+    rng = random.Random(seed)
+    syllables = [s for s in dt._PINYIN_MAP if s != "Pinyin"]
+    weights = [1 / (rank + 1) for rank in range(len(syllables))]
+
+    pages = []
+    for _ in range(page_count):
+        count = rng.choices([1, 2, 3, 4], weights=[3, 6, 2, 1])[0]
+        numbered = "".join(s + str(rng.randint(1, 5)) for s in rng.choices(syllables, weights=weights, k=count))
+        accented = dt.numbered_to_accented(numbered)
+        hanzi = "".join(rng.choice(HANZI) for _ in range(count))
+        pages.append([hanzi, numbered, accented, "".join(c for c in numbered if not c.isdigit())])
+    return pages
+
+
+def classify(pages: List[List[str]], is_pinyin: Callable[[str], bool]) -> List[Tuple[List[str], List[str]]]:
+    results = []
+    for keys in pages:
+        numbered = [k for k in keys if is_pinyin(k) and any(c.isdigit() for c in k)]
+        unnumbered = [k for k in keys if is_pinyin(k) and not any(c.isdigit() for c in k)]
+        results.append((numbered, unnumbered))
+    return results
+
+
+def convert(readings: List[str], to_zhuyin: Callable[[str], str]) -> List[str]:
+    results = []
+    for reading in readings:
+        try:
+            results.append(to_zhuyin(reading.lower()))
+        except ValueError:
+            results.append(None)
+    return results
+
+
+def timed(function: Callable, *args) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark memoised pinyin classification and zhuyin conversion")
+    parser.add_argument("--index", type=str, default=None, help="CJ3 index_d.tsv (defaults to the resources copy)")
+    parser.add_argument("--pages", type=int, default=20000, help="Synthetic pages when no index is available")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic key set")
+    args = parser.parse_args()
+
+    index_path = Path(args.index) if args.index else DEFAULT_INDEX
+    if index_path.exists():
+        pages = load_index_pages(index_path)
+        source = str(index_path)
+    else:
+        pages = build_synthetic_pages(args.pages, args.seed)
+        source = f"synthetic ({args.pages} pages)"
+
+    keys = sum(len(page) for page in pages)
+    readings = [key for page in pages for key in page if not CNUtils.is_hanzi(key)]
+    print(f"Key set: {source}, {len(pages)} pages, {keys} keys, {len(readings)} pinyin readings")
+
+    CNUtils.clear_cache()
+    before_classify, expected_classes = timed(classify, pages, dt.is_pinyin)
+    after_classify, classes = timed(classify, pages, CNUtils.is_pinyin)
+    before_convert, expected_zhuyin = timed(convert, readings, dt.to_zhuyin)
+    after_convert, zhuyin = timed(convert, readings, CNUtils.to_zhuyin)
+
+    print(f"\n{'stage':<28}{'dragonmapper s':>16}{'memoised s':>12}{'speedup':>9}")
+    print("-" * 65)
+    for name, before, after in (("is_pinyin (2x per key)", before_classify, after_classify),
+                                ("to_zhuyin (per reading)", before_convert, after_convert)):
+        print(f"{name:<28}{before:>16.3f}{after:>12.3f}{before / after:>8.1f}x")
+    print(f"\nCached: {len(CNUtils._is_pinyin_cache)} keys, {len(CNUtils._syllable_zhuyin_cache)} syllables")
+
+    mismatched_classes = sum(1 for a, b in zip(expected_classes, classes) if a != b)
+    mismatched_zhuyin = [(r, a, b) for r, a, b in zip(readings, expected_zhuyin, zhuyin) if a != b]
+    if mismatched_classes or mismatched_zhuyin:
+        print(f"Mismatches: {mismatched_classes} pages classified differently, "
+              f"{len(mismatched_zhuyin)} readings converted differently (e.g. {mismatched_zhuyin[:3]})")
+        return 1
+
+    print("Results identical to dragonmapper")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+import os
+import json
+import random
+from xml.sax.saxutils import escape
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import jaconv
+
+
+# Kanji with a few readings each; enough variety for compounds, variant spellings and okurigana
+KANJI_READINGS: Dict[str, List[str]] = {
+    "日": ["にち", "ひ"], "本": ["ほん", "もと"], "人": ["じん", "ひと"], "大": ["だい", "おお"],
+    "学": ["がく", "まな"], "生": ["せい", "い"], "年": ["ねん", "とし"], "中": ["ちゅう", "なか"],
+    "国": ["こく", "くに"], "語": ["ご", "かた"], "時": ["じ", "とき"], "行": ["こう", "い"],
+    "見": ["けん", "み"], "会": ["かい", "あ"], "手": ["しゅ", "て"], "気": ["き"],
+    "心": ["しん", "こころ"], "山": ["さん", "やま"], "川": ["せん", "かわ"], "水": ["すい", "みず"],
+    "火": ["か", "ひ"], "花": ["か", "はな"], "風": ["ふう", "かぜ"], "雨": ["う", "あめ"],
+    "道": ["どう", "みち"], "言": ["げん", "い"], "書": ["しょ", "か"], "読": ["どく", "よ"],
+    "話": ["わ", "はな"], "思": ["し", "おも"], "知": ["ち", "し"], "明": ["めい", "あか"],
+    "暗": ["あん", "くら"], "物": ["ぶつ", "もの"], "事": ["じ", "こと"], "家": ["か", "いえ"],
+    "海": ["かい", "うみ"], "空": ["くう", "そら"], "新": ["しん", "あたら"], "古": ["こ", "ふる"],
+    "長": ["ちょう", "なが"], "高": ["こう", "たか"], "白": ["はく", "しろ"], "黒": ["こく", "くろ"],
+    "青": ["せい", "あお"], "赤": ["せき", "あか"], "音": ["おん", "おと"], "声": ["せい", "こえ"],
+    "力": ["りょく", "ちから"], "金": ["きん", "かね"], "石": ["せき", "いし"], "木": ["もく", "き"],
+    "森": ["しん", "もり"], "村": ["そん", "むら"], "町": ["ちょう", "まち"], "鉄": ["てつ"],
+    "茶": ["ちゃ"], "湯": ["とう", "ゆ"], "雪": ["せつ", "ゆき"], "月": ["げつ", "つき"],
+}
+
+# Kanji that share a reading, used for variant spellings (e.g. 陰/影)
+VARIANT_KANJI: Dict[str, str] = {
+    "花": "華", "見": "観", "思": "想", "話": "咄", "暗": "闇", "家": "宅",
+    "道": "路", "声": "聲", "国": "國", "気": "氣", "学": "學", "鉄": "鐵",
+}
+
+OKURIGANA = ["く", "む", "る", "う", "す", "い", "つ"]
+PARTICLES = ["ノ", "ヲ", "ニ", "ガ"]
+FILLER_KANA = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん"
+SECTION_TAGS = ["meaning", "sense", "note", "example"]
+
+# Page key-count distribution measured on a real Monokakido index (keys per page -> share)
+KEY_COUNT_WEIGHTS: List[Tuple[int, float]] = [(1, 0.04), (2, 0.84), (3, 0.11), (4, 0.01), (5, 0.005)]
+# Idiom items carry a prefix set of kanji and katakana keys, usually 5-8
+IDIOM_KEY_WEIGHTS: List[Tuple[int, float]] = [(3, 0.02), (4, 0.05), (5, 0.55), (6, 0.1), (7, 0.12), (8, 0.07), (9, 0.03)]
+
+TAG_MAP = {
+    "meaning": "div",
+    "sense": "div",
+    "example": "div",
+    "note": "div",
+    "head": "div",
+    "subitem": "div",
+    "num": "span",
+    "headword": "span",
+}
+
+
+class SyntheticCorpusGenerator:
+    """
+    Generates a Monokakido-style dictionary (XML pages, index_d.tsv, idiom/jukugo prefix
+    indexes, index.json, a tag map and a matching JMdict term bank) under
+    base_dir/resources, in the layout PathManager expects.
+    """
+
+    def __init__(self, base_dir: str, dict_type: str = "BENCH", page_count: int = 2000,
+                 idiom_ratio: float = 0.04, seed: int = 0):
+        self.base_dir = Path(base_dir)
+        self.dict_type = dict_type
+        self.page_count = page_count
+        self.idiom_ratio = idiom_ratio
+        self.random = random.Random(seed)
+        self.seed = seed
+
+        self.dict_root = self.base_dir / "resources" / dict_type
+        self.pages_dir = self.dict_root / "pages"
+        self.index_dir = self.dict_root / "index"
+        self.jmdict_dir = self.base_dir / "resources" / "JMDICT"
+        self.tag_map_path = self.dict_root / "mapping" / "tag_map.json"
+
+        self.kanji_list = list(KANJI_READINGS.keys())
+
+
+    def generate(self) -> Dict[str, int]:
+        """Write the corpus and return its size statistics"""
+        for folder in (self.pages_dir, self.index_dir, self.jmdict_dir, self.tag_map_path.parent, self.dict_root / "assets"):
+            os.makedirs(folder, exist_ok=True)
+
+        index_lines: List[str] = []
+        idiom_lines: List[str] = []
+        jukugo_lines: List[str] = []
+        jmdict_terms: Dict[str, str] = {}
+        stats = {"pages": 0, "keys": 0, "idiom_items": 0, "idiom_keys": 0, "bytes": 0}
+
+        for page_number in range(1, self.page_count + 1):
+            page_id = f"{page_number:010d}"
+            reading_keys, kanji_keys = self._make_page_keys()
+
+            idiom = None
+            if self.random.random() < self.idiom_ratio:
+                idiom = self._make_idiom()
+                for key in idiom[0] + idiom[1]:
+                    idiom_lines.append(f"{key}\t{page_id}-001")
+                stats["idiom_items"] += 1
+                stats["idiom_keys"] += len(idiom[0]) + len(idiom[1])
+
+            for key in reading_keys + kanji_keys:
+                index_lines.append(f"{key}\t{page_id}")
+            for kanji, reading in zip(kanji_keys, reading_keys * len(kanji_keys)):
+                jmdict_terms.setdefault(kanji, reading)
+                if sum(1 for c in kanji if c in KANJI_READINGS) > 1:
+                    jukugo_lines.append(f"{kanji}\t{page_id}-000")
+
+            xml = self._make_page_xml(page_id, reading_keys, kanji_keys, idiom)
+            with open(self.pages_dir / f"{page_id}.xml", "w", encoding="utf-8") as f:
+                f.write(xml)
+
+            stats["pages"] += 1
+            stats["keys"] += len(reading_keys) + len(kanji_keys)
+            stats["bytes"] += len(xml.encode("utf-8"))
+
+        self._write_lines(self.index_dir / "index_d.tsv", index_lines)
+        self._write_lines(self.index_dir / "idiom_prefix.tsv", idiom_lines)
+        self._write_lines(self.index_dir / "jyukugo_prefix.tsv", jukugo_lines)
+        self._write_index_json()
+        self._write_jmdict(jmdict_terms)
+
+        with open(self.tag_map_path, "w", encoding="utf-8") as f:
+            json.dump(TAG_MAP, f, ensure_ascii=False, indent=2)
+
+        return stats
+
+
+    def _weighted_choice(self, weights: List[Tuple[int, float]]) -> int:
+        values, probabilities = zip(*weights)
+        return self.random.choices(values, weights=probabilities, k=1)[0]
+
+
+    def _make_word(self, max_length: int = 3) -> Tuple[str, str]:
+        length = self.random.randint(1, max_length)
+        chars = self.random.sample(self.kanji_list, length)
+        return "".join(chars), "".join(self.random.choice(KANJI_READINGS[c]) for c in chars)
+
+
+    def _variant_spelling(self, kanji: str) -> str:
+        variant = "".join(VARIANT_KANJI.get(c, c) for c in kanji)
+        if variant != kanji:
+            return variant
+        return kanji + self.random.choice(self.kanji_list)
+
+
+    def _make_page_keys(self) -> Tuple[List[str], List[str]]:
+        """Keys that match_kana_with_kanji pairs without needing manual input"""
+        key_count = self._weighted_choice(KEY_COUNT_WEIGHTS)
+        kanji, reading = self._make_word()
+
+        if key_count == 1:
+            return [reading], []
+
+        if key_count == 4:
+            # Two conjugated forms: 暗む/くらむ, 暗す/くらす
+            stem = self.random.choice(self.kanji_list)
+            stem_reading = KANJI_READINGS[stem][-1]
+            first, second = self.random.sample(OKURIGANA, 2)
+            return [stem_reading + first, stem_reading + second], [stem + first, stem + second]
+
+        kanji_forms = [kanji]
+        while len(kanji_forms) < key_count - 1:
+            variant = self._variant_spelling(kanji_forms[-1])
+            if variant in kanji_forms:
+                break
+            kanji_forms.append(variant)
+
+        return [reading], kanji_forms
+
+
+    def _make_idiom(self) -> Tuple[List[str], List[str]]:
+        """Prefix keys of an idiom, e.g. 花 / 花ニ / 花ニ嵐 and ハナ / ハナニ / ハナニアラシ"""
+        key_count = self._weighted_choice(IDIOM_KEY_WEIGHTS)
+        first_kanji, first_reading = self._make_word(2)
+        second_kanji, second_reading = self._make_word(2)
+        particle = self.random.choice(PARTICLES)
+
+        first_reading = jaconv.hira2kata(first_reading)
+        second_reading = jaconv.hira2kata(second_reading)
+
+        kanji_keys = [first_kanji + particle + second_kanji, first_kanji, first_kanji + particle,
+                      first_reading + particle + second_kanji, second_kanji]
+        reading_keys = [first_reading + particle + second_reading, first_reading, first_reading + particle, second_reading]
+
+        reading_count = max(1, key_count // 3)
+        return kanji_keys[:key_count - reading_count], reading_keys[:reading_count]
+
+
+    def _make_text(self, min_length: int = 8, max_length: int = 40) -> str:
+        """Running text mixing kana and kanji, with occasional ruby"""
+        parts = []
+        length = self.random.randint(min_length, max_length)
+        while sum(len(p) for p in parts) < length:
+            roll = self.random.random()
+            if roll < 0.15:
+                kanji = self.random.choice(self.kanji_list)
+                parts.append(f"<ruby>{kanji}<rt>{self.random.choice(KANJI_READINGS[kanji])}</rt></ruby>")
+            elif roll < 0.55:
+                parts.append(self._make_word()[0])
+            else:
+                parts.append("".join(self.random.choices(FILLER_KANA, k=self.random.randint(1, 4))))
+        return "".join(parts) + "。"
+
+
+    def _make_section(self, depth: int) -> str:
+        tag = self.random.choice(SECTION_TAGS)
+        content = [self._make_text()]
+
+        if tag == "sense":
+            content.insert(0, f"<num>{self.random.randint(1, 9)}</num>")
+        if tag == "example":
+            content = [f"「{self._make_text(6, 20)}」"]
+        if self.random.random() < 0.1:
+            content.append(f"<a href=\"{self._make_word()[0]}\">{self._make_word()[0]}</a>")
+
+        if depth > 0:
+            for _ in range(self.random.randint(0, 3)):
+                content.append(self._make_section(depth - 1))
+
+        return f"<{tag}>{''.join(content)}</{tag}>"
+
+
+    def _make_page_xml(self, page_id: str, reading_keys: List[str], kanji_keys: List[str], idiom) -> str:
+        headword = escape(reading_keys[0])
+        spelling = f"<span class=\"表記\">【{'・'.join(kanji_keys)}】</span>" if kanji_keys else ""
+        sections = "".join(self._make_section(self.random.randint(1, 4)) for _ in range(self.random.randint(1, 4)))
+
+        subitem = ""
+        if idiom:
+            kanji_keys, _ = idiom
+            subitem = (
+                f"<subitem id=\"{page_id}-001\"><headword>{escape(max(kanji_keys, key=len))}</headword>"
+                f"{self._make_section(2)}</subitem>"
+            )
+
+        return (
+            "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n"
+            f"<entry id=\"{page_id}\"><head><headword class=\"見出\">{headword}</headword>{spelling}</head>"
+            f"{sections}{subitem}</entry>\n"
+        )
+
+
+    def _write_index_json(self) -> None:
+        index_data = {
+            "title": f"{self.dict_type} synthetic benchmark",
+            "format": 3,
+            "revision": f"{self.dict_type.lower()};synthetic",
+            "description": f"Synthetic Monokakido corpus, {self.page_count} pages, seed {self.seed}"
+        }
+        with open(self.index_dir / "index.json", "w", encoding="utf-8") as f:
+            json.dump(index_data, f, ensure_ascii=False, indent=4)
+
+
+    def _write_jmdict(self, terms: Dict[str, str]) -> None:
+        entries = [[term, reading, "", "n", 0, [term], i, ""] for i, (term, reading) in enumerate(terms.items(), 1)]
+        with open(self.jmdict_dir / "term_bank_1.json", "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+
+
+    @staticmethod
+    def _write_lines(path: Path, lines: List[str]) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for line in lines:
+                f.write(line + "\n")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for KanaUtils against jaconv.
+
+    python -m benchmark.kana_conversion
+    python -m benchmark.kana_conversion --keys 200000 --distinct 5000
+
+Times a stream of repeated short keys, as the parsers see them, in both directions.
+Parity with jaconv over the kana blocks is checked by test/test_kana_utils.py.
+"""
+import sys
+import random
+import argparse
+import timeit
+
+import jaconv
+
+from utils.lang import KanaUtils
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time KanaUtils against jaconv")
+    parser.add_argument("--keys", type=int, default=100000, help="Conversions in the timed key stream")
+    parser.add_argument("--distinct", type=int, default=3000, help="Distinct keys in the stream")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs (best is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    kana = [chr(code) for code in range(0x3041, 0x3097)] + [chr(code) for code in range(0x30A1, 0x30F7)] + ["ー"]
+    distinct = ["".join(rng.choice(kana) for _ in range(rng.randint(2, 8))) for _ in range(args.distinct)]
+    stream = [rng.choice(distinct) for _ in range(args.keys)]
+
+    def best(function) -> float:
+        return min(timeit.repeat(lambda: [function(key) for key in stream], number=1, repeat=args.repeat)) / len(stream)
+
+    print(f"{'conversion':<24}{'jaconv µs':>11}{'KanaUtils µs':>14}{'speedup':>9}")
+    print("-" * 58)
+    for name in ("kata2hira", "hira2kata"):
+        before = best(getattr(jaconv, name))
+        KanaUtils.clear_cache()
+        after = best(getattr(KanaUtils, name))
+        print(f"{name:<24}{before * 1e6:>11.3f}{after * 1e6:>14.3f}{before / after:>8.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the text helpers moved onto utils.lang.patterns.
+
+    python -m benchmark.regex_helpers
+    python -m benchmark.regex_helpers --samples 5000 --repeat 7 --output regex.json
+
+Each helper is timed against a copy of its previous implementation (raw pattern strings,
+per-call pattern building, chained re.sub) on a seeded synthetic sample, after checking
+that both return the same result for every sample. Exits with 1 on any mismatch.
+"""
+import sys
+import json
+import random
+import argparse
+import timeit
+from typing import Any, Callable, Dict, List
+
+import regex as re
+
+from utils.lang import CNUtils, KanjiUtils
+from parsers.RGKO12.rgko12_parser import RGKO12Parser
+from parsers.TISMKANJI.tismkanji_utils import TismKanjiUtils
+from utils.lang import patterns
+
+HIRAGANA = [chr(c) for c in range(0x3041, 0x3097)]
+KATAKANA = [chr(c) for c in range(0x30A1, 0x30FB)] + ["ー"]
+KANJI = list("日本語漢字辞書解読見出熟語意味用例参考活関連敬哀悲愛額突虫糊鸒斯髻")
+OTHER = list("abcxyzAB019 　、。・「」【】〖〗△［］（）()")
+
+
+# ----- Previous implementations ----- #
+
+def legacy_is_hanzi(text: str) -> bool:
+    pattern = '|'.join([
+        r'\p{Han}', r'\p{InCJK_Compatibility_Ideographs}', r'\p{InCJK_Compatibility_Ideographs_Supplement}',
+        r'\p{InCJK_Unified_Ideographs_Extension_A}', r'\p{InCJK_Unified_Ideographs_Extension_B}',
+        r'\p{InCJK_Unified_Ideographs_Extension_C}', r'\p{InCJK_Unified_Ideographs_Extension_D}',
+        r'\p{InCJK_Unified_Ideographs_Extension_E}', r'\p{InCJK_Unified_Ideographs_Extension_F}',
+        r'\p{InCJK_Unified_Ideographs_Extension_G}', r'\p{InCJK_Unified_Ideographs_Extension_H}',
+        r'\p{InCJK_Unified_Ideographs_Extension_I}', r'\p{InCJK_Radicals_Supplement}',
+        r'\p{InKangxi_Radicals}', r'\p{InIdeographic_Description_Characters}'
+    ])
+    return bool(re.search(f'({pattern})', text))
+
+
+def legacy_normalize_pinyin(text: str) -> str:
+    text = re.sub(r'\d', '', text)
+    text = re.sub(r'\s+', '', text)
+    text = text.lower()
+    text = re.sub(r'[^a-z0-9]', '', text)
+    return text.replace('v', 'u')
+
+
+def legacy_is_katakana(char: str) -> bool:
+    return bool(re.fullmatch(r'[ー\p{Katakana}\p{Block: Katakana_Phonetic_Extensions}]', char))
+
+
+def legacy_is_hiragana(char: str) -> bool:
+    return bool(re.fullmatch(r'[\p{Hiragana}\U0001B11F\U0001B120\U0001B121\U0001B122]', char))
+
+
+def legacy_clean_reading(reading: str) -> str:
+    return re.sub(r'[^ー\p{Hiragana}\p{Katakana}\p{Block: Kana_Extended_A}\p{Block: Kana_Extended_B}\p{Block: Kana_Supplement}\p{Block: Katakana_Phonetic_Extensions}]', "", reading)
+
+
+def legacy_clean_headword(head_word: str) -> str:
+    return re.sub(r'[^・\p{Unified_Ideograph}ー\p{Hiragana}\p{Katakana}\p{Block: Kana_Extended_A}\p{Block: Kana_Extended_B}\p{Block: Kana_Supplement}\p{Block: Katakana_Phonetic_Extensions}]', "", head_word)
+
+
+def legacy_jukugo_clean_headword(headword: str) -> str:
+    for char in ('【', '】', '〗', '〖', '△', '［', '］'):
+        headword = re.sub(char, '', headword)
+    return headword
+
+
+def legacy_tsukaiwake_entries(index_str: str) -> List[Any]:
+    exclude_patterns = [r'\{RB:活:かつ\}', r'\{RB:用:よう\}', r'\{RB:関:かん\}', r'\{RB:連:れん\}',
+                        r'\{RB:敬:けい\}', r'\{RB:語:ご\}', r'\{RB:参:さん\}', r'\{RB:考:こう\}']
+    for pattern in exclude_patterns:
+        index_str = re.sub(pattern, '', index_str)
+
+    pairs = []
+    for variant in index_str.split('・'):
+        if not variant.strip():
+            continue
+        rb_tags = re.findall(r'\{RB:([^:]+):([^}]+)\}', variant)
+        if not rb_tags:
+            pairs.append((variant, variant))
+            continue
+        remaining_text = re.sub(r'\{RB:[^}]+\}', '', variant)
+        pairs.append((''.join(k for k, _ in rb_tags) + remaining_text, ''.join(r for _, r in rb_tags) + remaining_text))
+    return pairs
+
+
+def legacy_replace_furigana_pattern(pattern, text: str) -> str:
+    for match in pattern.finditer(text):
+        start, _ = match.span()
+        full_text, kanji, furigana = match.group(0), match.group("kanji"), match.group("furigana")
+        preceding_char = text[start - 1] if start > 0 else ""
+        if start == 0 or TismKanjiUtils.PUNCTUATION_PATTERN.search(preceding_char) or preceding_char == '\n':
+            text = re.sub(full_text, kanji + f'({furigana})', text)
+        else:
+            text = re.sub(full_text, "、" + kanji + f'({furigana})', text)
+    return text
+
+
+def legacy_definition_furigana(definition: str) -> List[str]:
+    text = legacy_replace_furigana_pattern(re.compile(r'^(?<furigana>\p{Katakana}+)(?<kanji>\p{Han}+)'), definition)
+    text = legacy_replace_furigana_pattern(re.compile(r'[「・](?<kanji>\p{Han}+(?:・\p{Han}+)?)(?<furigana>\p{Katakana}+(?:・\p{Katakana}+)?)(?:」)?'), text)
+    return [match.group(0) for match in re.compile(r'([^()]+)\(([^)]+)\)').finditer(text)]
+
+
+def definition_furigana(definition: str) -> List[str]:
+    # The pattern stage of TismKanjiParser.create_definition_element
+    text = TismKanjiUtils.replace_furigana_pattern(patterns.LEADING_FURIGANA_PATTERN, definition)
+    text = TismKanjiUtils.replace_furigana_pattern(patterns.QUOTED_FURIGANA_PATTERN, text)
+    return [match.group(0) for match in patterns.PARENTHESISED_FURIGANA_PATTERN.finditer(text)]
+
+
+# ----- Samples ----- #
+
+def random_text(rng: random.Random, pools: List[List[str]], min_len: int = 1, max_len: int = 12) -> str:
+    return "".join(rng.choice(rng.choice(pools)) for _ in range(rng.randint(min_len, max_len)))
+
+
+def build_samples(count: int, seed: int) -> Dict[str, List[str]]:
+    rng = random.Random(seed)
+    mixed = [HIRAGANA, KATAKANA, KANJI, OTHER]
+    syllables = ["zhong1", "guo2", "ni3", "hao3", "lv4", "nü3", "Xue2 sheng", "ＡＢ", "１２"]
+
+    def rb_index() -> str:
+        labels = ["{RB:活:かつ}", "{RB:用:よう}", "{RB:参:さん}", "{RB:考:こう}"]
+        variants = []
+        for _ in range(rng.randint(1, 3)):
+            parts = [f"{{RB:{rng.choice(KANJI)}:{random_text(rng, [HIRAGANA], 1, 3)}}}" for _ in range(rng.randint(0, 2))]
+            variants.append("".join(parts) + random_text(rng, [HIRAGANA], 1, 3))
+        return rng.choice(labels) * rng.randint(0, 1) + "・".join(variants)
+
+    def definition() -> str:
+        forms = [
+            random_text(rng, [KATAKANA], 2, 4) + random_text(rng, [KANJI], 1, 2) + "。",
+            "「" + random_text(rng, [KANJI], 1, 2) + random_text(rng, [KATAKANA], 2, 4) + "」",
+            random_text(rng, [KANJI], 1, 3) + "(" + random_text(rng, [HIRAGANA], 2, 4) + ")",
+            random_text(rng, mixed, 3, 10),
+        ]
+        return "".join(rng.choice(forms) for _ in range(rng.randint(1, 4)))
+
+    return {
+        "text": [random_text(rng, mixed) for _ in range(count)],
+        "chars": [rng.choice(rng.choice(mixed)) for _ in range(count)],
+        "pinyin": [" ".join(rng.choice(syllables) for _ in range(rng.randint(1, 3))) for _ in range(count)],
+        "jukugo": ["【" + random_text(rng, [KANJI, ["△", "［", "］", "〖", "〗"]], 1, 5) + "】" for _ in range(count)],
+        "rb_index": [rb_index() for _ in range(count)],
+        "definitions": [definition() for _ in range(count)],
+    }
+
+
+# (helper name, sample set, previous implementation, current implementation)
+HELPERS = [
+    ("CNUtils.is_hanzi", "text", legacy_is_hanzi, CNUtils.is_hanzi),
+    ("CNUtils.normalize_pinyin", "pinyin", legacy_normalize_pinyin, CNUtils.normalize_pinyin),
+    ("KanjiUtils.is_katakana", "chars", legacy_is_katakana, KanjiUtils.is_katakana),
+    ("KanjiUtils.is_hiragana", "chars", legacy_is_hiragana, KanjiUtils.is_hiragana),
+    ("KanjiUtils.clean_reading", "text", legacy_clean_reading, KanjiUtils.clean_reading),
+    ("KanjiUtils.clean_headword", "text", legacy_clean_headword, KanjiUtils.clean_headword),
+    ("KJT jukugo clean_headword", "jukugo", legacy_jukugo_clean_headword,
+     lambda headword: headword.translate(patterns.JUKUGO_HEADWORD_STRIP_TABLE)),
+    ("RGKO12Parser.get_tsukaiwake_entries", "rb_index", legacy_tsukaiwake_entries, RGKO12Parser.get_tsukaiwake_entries),
+    ("TismKanji definition furigana", "definitions", legacy_definition_furigana, definition_furigana),
+]
+
+
+def run_helper(name: str, samples: List[str], before: Callable, after: Callable, repeat: int) -> Dict[str, Any]:
+    mismatches = [sample for sample in samples if before(sample) != after(sample)]
+
+    def time_function(function: Callable) -> float:
+        # Best of repeat, per call
+        runs = timeit.repeat(lambda: [function(sample) for sample in samples], number=1, repeat=repeat)
+        return min(runs) / len(samples)
+
+    before_time = time_function(before)
+    after_time = time_function(after)
+    return {
+        "helper": name,
+        "before_us": round(before_time * 1e6, 3),
+        "after_us": round(after_time * 1e6, 3),
+        "speedup": round(before_time / after_time, 2) if after_time else 0.0,
+        "mismatches": mismatches[:5],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmark the precompiled-pattern text helpers")
+    parser.add_argument("--samples", type=int, default=2000, help="Samples per helper")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per helper (best is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the samples")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    samples = build_samples(args.samples, args.seed)
+    results = [run_helper(name, samples[sample_set], before, after, args.repeat)
+               for name, sample_set, before, after in HELPERS]
+
+    print(f"{'helper':<40}{'before µs':>11}{'after µs':>11}{'speedup':>9}")
+    print("-" * 71)
+    for result in results:
+        flag = "  MISMATCH" if result["mismatches"] else ""
+        print(f"{result['helper']:<40}{result['before_us']:>11.2f}{result['after_us']:>11.2f}{result['speedup']:>8.1f}x{flag}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    failed = [result for result in results if result["mismatches"]]
+    for result in failed:
+        print(f"{result['helper']}: results differ for {result['mismatches']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of MonokakidoParser on a synthetic corpus.
+
+    python -m benchmark.run_benchmark --pages 2000 --seed 0
+    python -m benchmark.run_benchmark --compare benchmark_results/<earlier run>.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any
+
+from config import DictionaryConfig, PathManager
+from utils import FileUtils, Instrumentation
+from index import IndexRegistry
+from benchmark.corpus_generator import SyntheticCorpusGenerator
+
+RESULTS_DIR = Path(__file__).parent.parent.parent / "benchmark_results"
+
+
+def create_benchmark_config(dict_type: str) -> DictionaryConfig:
+    return DictionaryConfig(
+        dict_name=f"{dict_type} benchmark",
+        rev_name=dict_type.lower(),
+        dict_type=dict_type,
+        parser_module="parsers.Monokakido.parser",
+        parser_class_name="MonokakidoParser",
+        expression_element="subitem",
+        ignored_elements={"entry-index", "key"},
+        normalization_tag_name="headword",
+        normalization_class_name="見出",
+    )
+
+
+def run_benchmark(base_dir: str, pages: int, idiom_ratio: float, seed: int, batch_size: int) -> Dict[str, Any]:
+    dict_type = "BENCH"
+
+    generate_start = time.perf_counter()
+    generator = SyntheticCorpusGenerator(base_dir, dict_type, page_count=pages, idiom_ratio=idiom_ratio, seed=seed)
+    corpus_stats = generator.generate()
+    generate_time = time.perf_counter() - generate_start
+
+    config = create_benchmark_config(dict_type)
+    paths = PathManager(base_dir).get_paths(config)
+    config.set_paths(paths)
+    config.validate_required_paths()
+    config.tag_map_path = str(generator.tag_map_path)
+
+    IndexRegistry.clear()
+    Instrumentation.enable()
+    start_time = time.perf_counter()
+
+    parser = config.get_parser_class()(config)
+    parser.batch_size = batch_size
+    parser.parse()
+    parser.export(paths["output_path"])
+
+    file_paths = FileUtils.gather_files(
+        paths["term_bank_folder"], paths["assets_folder"], paths["index_json_path"], paths["output_path"]
+    )
+    FileUtils.zip_dictionary(file_paths, config.dict_name, paths["base_dir"], paths["output_path"])
+
+    end_to_end = time.perf_counter() - start_time
+    report = Instrumentation.get_report(config.dict_name)
+    Instrumentation.disable()
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": {
+            "pages": pages,
+            "idiom_ratio": idiom_ratio,
+            "seed": seed,
+            "batch_size": batch_size,
+            "generate_seconds": round(generate_time, 4),
+            **corpus_stats
+        },
+        "end_to_end_seconds": round(end_to_end, 4),
+        "pages_per_second": round(pages / end_to_end, 2) if end_to_end else 0.0,
+        "entries": parser.entries_processed,
+        "stages": report["stages"],
+        "counters": report["counters"],
+    }
+
+
+def compare_results(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+    print(f"\n{'stage':<24}{'before':>10}{'after':>10}{'change':>10}")
+    print("-" * 54)
+
+    rows = [("end_to_end", previous["end_to_end_seconds"], current["end_to_end_seconds"])]
+    for stage in current["stages"]:
+        if stage in previous["stages"]:
+            rows.append((stage, previous["stages"][stage]["seconds"], current["stages"][stage]["seconds"]))
+
+    for name, before, after in rows:
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{name:<24}{before:>10.2f}{after:>10.2f}{change:>+9.1f}%")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Monokakido pipeline on a synthetic corpus")
+    parser.add_argument("--pages", type=int, default=2000, help="Number of synthetic pages")
+    parser.add_argument("--idiom-ratio", type=float, default=0.04,
+                        help="Share of pages with an idiom subitem (idioms need the full Sudachi dictionary)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the corpus")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Parser batch size")
+    parser.add_argument("--work-dir", type=str, default=None, help="Keep the corpus and output in this directory")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Result JSON path")
+    parser.add_argument("--compare", type=str, default=None, help="Earlier result JSON to compare against")
+    args = parser.parse_args()
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="monokakido_bench_")
+    try:
+        result = run_benchmark(work_dir, args.pages, args.idiom_ratio, args.seed, args.batch_size)
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    output_path = Path(args.output) if args.output else RESULTS_DIR / f"bench_{datetime.now():%Y%m%d_%H%M%S}.json"
+    os.makedirs(output_path.parent, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    print(f"\n{result['corpus']['pages']} pages, {result['entries']} entries in {result['end_to_end_seconds']:.2f}s "
+          f"({result['pages_per_second']:.1f} pages/s)")
+    Instrumentation.print_summary({"wall_time": result["end_to_end_seconds"], "stages": result["stages"], "counters": {}})
+    print(f"Results written to: {output_path}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare_results(json.load(f), result)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
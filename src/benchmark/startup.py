@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Startup-time audit for the CLI paths and for loading each dictionary's parser class.
+
+    python -m benchmark.startup
+    python -m benchmark.startup --runs 10 --output startup.json
+
+Every path is run in a fresh interpreter; the median wall time is compared against its
+target, and the heavy language libraries that were imported are listed. Exits with 1
+when a target is missed or a library is loaded by a path that shouldn't need it.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Dict, Any, List
+
+import yaml
+
+SOURCE_ROOT = Path(__file__).parent.parent
+
+# Libraries that should only load on first use by the strategy or parser that needs them
+HEAVY_MODULES = ["sudachipy", "jamdict", "dragonmapper", "bs4", "tqdm", "regex"]
+
+# Median wall time targets (seconds), interpreter startup included
+CLI_TARGETS = {
+    "--list": 0.15,
+    "--help": 0.15,
+    "argument error": 0.15,
+}
+PARSER_IMPORT_TARGET = 0.40
+
+# Heavy libraries a parser class may import up front; sudachipy and jamdict are always deferred
+PARSER_ALLOWED_MODULES = {"bs4", "tqdm", "regex"}
+PARSER_EXTRA_ALLOWED = {
+    "cj3": {"dragonmapper"},
+}
+
+CLI_ARGS = {
+    "--list": ["--list"],
+    "--help": ["--help"],
+    "argument error": [],
+}
+
+PROBE = """
+import sys, json
+{body}
+print(json.dumps({{"loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+PARSER_BODY = """
+from pathlib import Path
+from config import DictionaryConfig
+configs = DictionaryConfig.load_configs(Path("config/dictionaries.yaml"))
+configs[{key!r}].get_parser_class()
+"""
+
+MAIN_BODY = """
+sys.argv = ["main.py"] + {args!r}
+import main
+try:
+    main.main()
+except SystemExit:
+    pass
+"""
+
+
+def run_probe(body: str, runs: int) -> Dict[str, Any]:
+    code = PROBE.format(body=body, heavy=HEAVY_MODULES)
+    timings = []
+    loaded: List[str] = []
+    error = ""
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], cwd=SOURCE_ROOT, capture_output=True, text=True)
+        timings.append(time.perf_counter() - start)
+
+        last_line = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+        try:
+            loaded = json.loads(last_line)["loaded"]
+        except (ValueError, KeyError):
+            error = (result.stderr.strip().splitlines() or ["no output"])[-1]
+
+    return {"median_seconds": round(statistics.median(timings), 4), "loaded": loaded, "error": error}
+
+
+def audit(runs: int) -> Dict[str, Any]:
+    results = {"cli": {}, "parsers": {}}
+
+    for name, target in CLI_TARGETS.items():
+        probe = run_probe(MAIN_BODY.format(args=CLI_ARGS[name]), runs)
+        probe["target_seconds"] = target
+        probe["passed"] = probe["median_seconds"] <= target and not set(probe["loaded"])
+        results["cli"][name] = probe
+
+    with open(SOURCE_ROOT / "config" / "dictionaries.yaml", "r", encoding="utf-8") as f:
+        dictionary_keys = list(yaml.safe_load(f)["dictionaries"].keys())
+
+    for key in dictionary_keys:
+        probe = run_probe(PARSER_BODY.format(key=key), runs)
+        allowed = PARSER_ALLOWED_MODULES | PARSER_EXTRA_ALLOWED.get(key, set())
+        probe["target_seconds"] = PARSER_IMPORT_TARGET
+        probe["unexpected"] = [m for m in probe["loaded"] if m not in allowed]
+        probe["passed"] = not probe["error"] and probe["median_seconds"] <= PARSER_IMPORT_TARGET and not probe["unexpected"]
+        results["parsers"][key] = probe
+
+    return results
+
+
+def print_results(results: Dict[str, Any]) -> bool:
+    all_passed = True
+
+    for section, title in (("cli", "CLI path"), ("parsers", "Parser import")):
+        print(f"\n{title:<20}{'median':>10}{'target':>10}  status  loaded")
+        print("-" * 72)
+        for name, probe in results[section].items():
+            status = "ok" if probe["passed"] else "FAIL"
+            all_passed &= probe["passed"]
+            detail = probe["error"] or ", ".join(probe["loaded"]) or "-"
+            print(f"{name:<20}{probe['median_seconds']:>10.3f}{probe['target_seconds']:>10.2f}  {status:<6}  {detail}")
+
+    return all_passed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure CLI and parser startup times against their targets")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per path (the median is reported)")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    results = audit(args.runs)
+    passed = print_results(results)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Size report and whole-dictionary consistency check for the structured-content minifier.
+
+    python -m benchmark.structured_content --pages 1000              # synthetic corpus, built with and without --minify
+    python -m benchmark.structured_content --term-banks path/to/term_bank_folder
+
+Every entry is minified and its signature (ContentMinifier.render_signature: text runs with
+the attributes around them, and the non-span elements in order) compared with the original's,
+which catches lost text and changed attributes. The minification rules themselves are tested
+in test/test_content_minifier.py. On the synthetic corpus the dictionary is built twice, and
+the minified build's term banks must equal the plain build's term banks minified. Exits with 1
+on any mismatch.
+"""
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from config import PathManager
+from core.yomitan import ContentMinifier
+from index import IndexRegistry
+from benchmark.corpus_generator import SyntheticCorpusGenerator
+from benchmark.run_benchmark import create_benchmark_config
+
+
+def load_rows(term_bank_folder: Path) -> List[list]:
+    rows = []
+    banks = sorted(term_bank_folder.glob("term_bank_*.json"), key=lambda path: int(path.stem.rsplit("_", 1)[1]))
+    for bank in banks:
+        with open(bank, "r", encoding="utf-8") as f:
+            rows.extend(json.load(f))
+    return rows
+
+
+def build_synthetic(base_dir: str, pages: int, seed: int, minify: bool) -> Path:
+    generator = SyntheticCorpusGenerator(base_dir, "BENCH", page_count=pages, idiom_ratio=0.0, seed=seed)
+    generator.generate()
+
+    config = create_benchmark_config("BENCH")
+    paths = PathManager(base_dir).get_paths(config)
+    config.set_paths(paths)
+    config.validate_required_paths()
+    config.tag_map_path = str(generator.tag_map_path)
+    config.minify_content = minify
+
+    IndexRegistry.clear()
+    parser = config.get_parser_class()(config)
+    parser.parse()
+    parser.export(paths["output_path"])
+    return Path(paths["term_bank_folder"])
+
+
+def check_rows(rows: List[list]) -> Dict[str, Any]:
+    mismatches = []
+    minified_rows = []
+    start = time.perf_counter()
+    for row in rows:
+        minified_rows.append(row[:5] + [ContentMinifier.minify_definitions(row[5])] + row[6:])
+    minify_seconds = time.perf_counter() - start
+
+    for row, minified in zip(rows, minified_rows):
+        for before, after in zip(row[5], minified[5]):
+            if not isinstance(before, dict):
+                continue
+            if ContentMinifier.render_signature(before.get("content")) != ContentMinifier.render_signature(after.get("content")):
+                mismatches.append(row[0])
+
+    return {
+        "rows": minified_rows,
+        "mismatches": mismatches,
+        "bytes_before": len(json.dumps(rows, ensure_ascii=False).encode("utf-8")),
+        "bytes_after": len(json.dumps(minified_rows, ensure_ascii=False).encode("utf-8")),
+        "minify_seconds": minify_seconds,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check and measure the structured-content minifier")
+    parser.add_argument("--term-banks", type=str, default=None, help="Check the term banks of an existing build")
+    parser.add_argument("--pages", type=int, default=1000, help="Synthetic pages when no term banks are given")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the corpus")
+    args = parser.parse_args()
+
+    minified_build = None
+    if args.term_banks:
+        rows = load_rows(Path(args.term_banks))
+    else:
+        work_dirs = [tempfile.mkdtemp(prefix="minify_bench_") for _ in range(2)]
+        try:
+            rows = load_rows(build_synthetic(work_dirs[0], args.pages, args.seed, minify=False))
+            minified_build = load_rows(build_synthetic(work_dirs[1], args.pages, args.seed, minify=True))
+        finally:
+            for work_dir in work_dirs:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+    result = check_rows(rows)
+    saved = result["bytes_before"] - result["bytes_after"]
+    print(f"\n{len(rows)} entries")
+    print(f"{'term bank bytes':<24}{result['bytes_before']:>14,} → {result['bytes_after']:,} "
+          f"({saved / result['bytes_before'] * 100:.1f}% saved)")
+    print(f"{'minify time':<24}{result['minify_seconds']:>14.3f}s "
+          f"({result['minify_seconds'] / max(len(rows), 1) * 1e6:.1f} µs per entry)")
+
+    failed = False
+    if result["mismatches"]:
+        print(f"Signatures differ for {len(result['mismatches'])} entries, e.g. {result['mismatches'][:5]}")
+        failed = True
+    if minified_build is not None and minified_build != json.loads(json.dumps(result["rows"], ensure_ascii=False)):
+        print("The --minify build differs from the plain build minified afterwards")
+        failed = True
+
+    if failed:
+        return 1
+    print("Text and attributes preserved" + (", --minify build matches" if minified_build is not None else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,7 @@ import yaml
 import importlib
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Any
 
 
 @dataclass
@@ -21,6 +21,7 @@ class DictionaryConfig:
     image_strategy_class: str = "DefaultImageHandlingStrategy"
     normalization_strategy_class: str = "DefaultNormalizationStrategy"
     pos_tag_strategy_class: str = "DefaultPosTagStrategy"
+    source_type: str = "pages"  # "pages" (one file per page) or "mdx_json" (streamed MDX dump JSON / JSON lines)
     
     # Paths
     dict_path: Optional[str] = None
@@ -47,6 +48,11 @@ class DictionaryConfig:
     has_audio: bool = False
     parse_all_links: bool = False
     subitems_not_split: bool = False
+    asset_conversions: Optional[List[str]] = None  # Asset extensions rasterised to PNG before packaging
+    fix_html: bool = False  # Run the NANMED20 text fix-up from resources/<type>/raw into the pages folder before parsing
+    minify_content: bool = False  # Minify structured content before it is written; also set by main.py --minify
+    shard: Optional[Any] = None  # core.sharding.ShardSpec; set by main.py --shard, not from the YAML
+    resume: bool = False  # Continue from the term bank folder's checkpoint; set by main.py --resume
 
     # Normalization
     normalization_tag_name: Optional[str] = None
@@ -102,6 +108,16 @@ class DictionaryConfig:
                 f"Missing required paths for {self.dict_name}: {', '.join(missing)}"
             )
             
+    def create_source_iterator(self):
+        if self.source_type == "mdx_json":
+            from core.mdx_json_iterator import MdxJsonIterator
+            return MdxJsonIterator(self.dict_path, shard=self.shard)
+        if self.source_type == "pages":
+            from core.file_iterator import FileIterator
+            return FileIterator(self.dict_path, shard=self.shard)
+
+        raise ValueError(f"Unknown source type for {self.dict_name}: {self.source_type}")
+
     def get_parser_class(self):
         module = importlib.import_module(self.parser_module)
         return getattr(module, self.parser_class_name)
@@ -18,6 +18,7 @@ class PathManager:
             "output_path": self.base_dir / "converted",
             "term_bank_folder": self.base_dir / "converted" / config.dict_name,
             "assets_folder": self.base_dir / f"resources/{dict_type}/assets",
+            "asset_manifest_path": self.base_dir / f"resources/{dict_type}/asset_manifest.json",
             "index_json_path": self.base_dir / f"resources/{dict_type}/index/index.json"
         }
             
@@ -33,6 +34,10 @@ class PathManager:
         if config.has_audio:
             paths["audio_path"] = self.base_dir / f"resources/{dict_type}/audio/index.json"
             
+        if config.fix_html:
+            paths["raw_dict_path"] = self.base_dir / f"resources/{dict_type}/raw"
+            paths["html_fix_cache_path"] = self.base_dir / f"resources/cache/{dict_type.lower()}_fixes.sqlite"
+            
         if config.has_appendix:
             paths["appendix_path"] = self.base_dir / f"resources/{dict_type}/appendix"
         
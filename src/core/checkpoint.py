@@ -0,0 +1,62 @@
+import os
+import json
+from typing import Any, Dict, Optional
+
+CHECKPOINT_FILE_NAME = "checkpoint.json"
+CHECKPOINT_VERSION = 1
+
+
+class BuildCheckpoint:
+    """
+    Durable record of how far a build got, written next to the term banks after every flush:
+    the number of source pages whose entries are all on disk, how many entries of the page
+    being parsed at flush time were already written (a flush can land mid-page), and the
+    next term bank number. Banks are only counted once their data has been fsynced.
+    """
+
+    @staticmethod
+    def get_path(folder: str) -> str:
+        return os.path.join(folder, CHECKPOINT_FILE_NAME)
+
+
+    @staticmethod
+    def load(folder: str) -> Optional[Dict[str, Any]]:
+        path = BuildCheckpoint.get_path(folder)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"チェックポイントを読み込めませんでした: {e}")
+            return None
+
+        return data if data.get("version") == CHECKPOINT_VERSION else None
+
+
+    @staticmethod
+    def save(folder: str, data: Dict[str, Any]) -> None:
+        path = BuildCheckpoint.get_path(folder)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CHECKPOINT_VERSION, **data}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+    @staticmethod
+    def clear(folder: str) -> None:
+        path = BuildCheckpoint.get_path(folder)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+    @staticmethod
+    def find_mismatch(checkpoint: Dict[str, Any], expected: Dict[str, Any]) -> Optional[str]:
+        """Name the first field that differs from the current build, or None when it can be resumed"""
+        for key, value in expected.items():
+            if checkpoint.get(key) != value:
+                return f"{key}: {checkpoint.get(key)} -> {value}"
+        return None
@@ -1,21 +1,31 @@
 import os
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 class FileIterator:
 
-    def __init__(self, directory_path: str):
+    def __init__(self, directory_path: str, shard=None):
         self.directory_path = directory_path
         self._validate_path()
         self.current_index = 0
         self.all_files = []
-        for filename in os.listdir(self.directory_path):
+        # Sorted so page order (and with it term bank order) doesn't depend on the filesystem
+        for filename in sorted(os.listdir(self.directory_path)):
             if os.path.isfile(os.path.join(self.directory_path, filename)) and filename.endswith(".xml"):
                 self.all_files.append(filename)
 
             if os.path.isfile(os.path.join(self.directory_path, filename)) and filename.endswith(".json"):
                 self.all_files.append(filename)
 
+        # Position of every page in the full, unsharded page list
+        self.end_position = len(self.all_files)
+        self.positions = list(range(len(self.all_files)))
+        if shard is not None:
+            kept = [(position, filename) for position, filename in enumerate(self.all_files) if shard.contains(filename)]
+            self.positions = [position for position, _ in kept]
+            self.all_files = [filename for _, filename in kept]
+        self.last_batch_positions: Optional[List[int]] = None
+
 
     def _validate_path(self):
         if not os.path.isdir(self.directory_path):
@@ -32,10 +42,15 @@ class FileIterator:
             file_content = self.read_file(self.all_files[i])
             batch.append((self.all_files[i], file_content))
 
+        self.last_batch_positions = self.positions[self.current_index:end_index]
         self.current_index = end_index
         return batch
 
 
+    def skip(self, count: int) -> None:
+        self.current_index = min(self.current_index + count, len(self.all_files))
+
+
     def has_more(self) -> bool:
         return self.current_index < len(self.all_files)
 
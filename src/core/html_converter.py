@@ -3,6 +3,7 @@ from typing import List, Dict, Optional, Tuple
 import bs4
 
 from core.yomitan import create_html_element
+from utils import Instrumentation
 from strategies.link import LinkHandlingStrategy, DefaultLinkHandlingStrategy
 from strategies.image import ImageHandlingStrategy, DefaultImageHandlingStrategy
 
@@ -122,6 +123,7 @@ class HTMLToYomitanConverter:
 		return html_elements  
 	
 	
+	@Instrumentation.timed("html_conversion")
 	def convert_element_to_yomitan(self, html_glossary: Optional[bs4.element.Tag] = None,
 									ignore_expressions: bool = False) -> Optional[Dict]:
 		"""Recursively converts HTML elements into Yomitan JSON format"""
@@ -0,0 +1,195 @@
+import os
+import json
+from typing import Iterator, List, Optional, Tuple, Any
+
+
+class MdxJsonIterator:
+    """
+    Streams the key/value pairs of MDX dump JSON files ({"key": "html", ...}) one entry at a time.
+    JSON-lines files (.jsonl, one ["key", "html"] array per line) in the same folder are read too.
+    Each pair is handed to the parser like a page file: (key, value).
+    With a shard, only the entries whose key hashes into it are handed out.
+    """
+
+    def __init__(self, directory_path: str, chunk_size: int = 1 << 20, shard=None):
+        self.directory_path = directory_path
+        self.chunk_size = chunk_size
+        self.shard = shard
+        self._validate_path()
+
+        self.json_files = sorted(
+            f for f in os.listdir(self.directory_path)
+            if f.lower().endswith(('.json', '.jsonl')) and os.path.isfile(os.path.join(self.directory_path, f))
+        )
+        self._entries = self._iter_positioned_entries()
+        self._next_entry: Optional[Tuple[int, Tuple[str, Any]]] = None
+        self._total_count: Optional[int] = None
+        # Position of each entry in the full, unsharded stream; known once the stream is exhausted
+        self.end_position: Optional[int] = None
+        self.last_batch_positions: Optional[List[int]] = None
+        self._advance()
+
+
+    def _validate_path(self):
+        if not os.path.isdir(self.directory_path):
+            raise FileNotFoundError(f'{self.directory_path} is not a directory')
+
+        return True
+
+
+    def _advance(self) -> None:
+        self._next_entry = next(self._entries, None)
+
+
+    def _iter_all_entries(self) -> Iterator[Tuple[str, Any]]:
+        for json_file in self.json_files:
+            yield from self._iter_file(json_file)
+
+
+    def _iter_positioned_entries(self) -> Iterator[Tuple[int, Tuple[str, Any]]]:
+        position = 0
+        for entry in self._iter_all_entries():
+            if self.shard is None or self.shard.contains(entry[0]):
+                yield position, entry
+            position += 1
+        self.end_position = position
+
+
+    def _iter_file(self, json_file: str) -> Iterator[Tuple[str, Any]]:
+        file_path = os.path.join(self.directory_path, json_file)
+        if json_file.lower().endswith('.jsonl'):
+            return MdxJsonIterator.iter_lines(file_path)
+        return MdxJsonIterator.iter_object_items(file_path, self.chunk_size)
+
+
+    def get_next_batch(self, batch_size: int) -> List[Tuple[str, Any]]:
+        batch = []
+        positions = []
+
+        while self._next_entry is not None and len(batch) < batch_size:
+            position, entry = self._next_entry
+            batch.append(entry)
+            positions.append(position)
+            self._advance()
+
+        self.last_batch_positions = positions
+        return batch
+
+
+    def skip(self, count: int) -> None:
+        """Drop the next count entries without handing them to the parser"""
+        for _ in range(count):
+            if self._next_entry is None:
+                break
+            self._advance()
+
+
+    def has_more(self) -> bool:
+        return self._next_entry is not None
+
+
+    def get_total_files_count(self) -> int:
+        """Number of entries across all files, counted with a separate streaming pass"""
+        if self._total_count is None:
+            self._total_count = sum(
+                1 for json_file in self.json_files for key, _ in self._iter_file(json_file)
+                if self.shard is None or self.shard.contains(key)
+            )
+
+        return self._total_count
+
+
+    @staticmethod
+    def iter_lines(file_path: str) -> Iterator[Tuple[str, Any]]:
+        """Yield the (key, value) pair stored on each non-empty line of a JSON-lines file"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    key, value = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"Invalid entry on line {line_number} of {file_path}: {e}") from e
+                yield key, value
+
+
+    @staticmethod
+    def iter_object_items(file_path: str, chunk_size: int = 1 << 20) -> Iterator[Tuple[str, Any]]:
+        """
+        Incrementally parse a top-level JSON object, yielding (key, value) pairs.
+        Only the current entry and one read chunk are held in memory.
+        """
+        decoder = json.JSONDecoder()
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            buffer = ""
+            pos = 0
+            eof = False
+
+            def fill() -> bool:
+                nonlocal buffer, pos, eof
+                if eof:
+                    return False
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    eof = True
+                    return False
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                return True
+
+            def skip_whitespace() -> str:
+                nonlocal pos
+                while True:
+                    while pos < len(buffer) and buffer[pos] in ' \t\n\r':
+                        pos += 1
+                    if pos < len(buffer):
+                        return buffer[pos]
+                    if not fill():
+                        return ""
+
+            def decode_value() -> Any:
+                nonlocal pos
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(buffer, pos)
+                        # A value ending exactly at the buffer edge may be a truncated number
+                        if end < len(buffer) or eof:
+                            pos = end
+                            return value
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                    if not fill():
+                        value, pos = decoder.raw_decode(buffer, pos)
+                        return value
+
+            def expect(char: str) -> None:
+                nonlocal pos
+                if skip_whitespace() != char:
+                    raise ValueError(f"Expected '{char}' at offset {pos} in {file_path}")
+                pos += 1
+
+            expect('{')
+            if skip_whitespace() == '}':
+                return
+
+            while True:
+                skip_whitespace()
+                key = decode_value()
+                expect(':')
+                skip_whitespace()
+                value = decode_value()
+                yield key, value
+
+                # Drop consumed text so the buffer stays bounded
+                if pos > chunk_size:
+                    buffer = buffer[pos:]
+                    pos = 0
+
+                separator = skip_whitespace()
+                pos += 1
+                if separator == '}':
+                    return
+                if separator != ',':
+                    raise ValueError(f"Expected ',' or '}}' at offset {pos - 1} in {file_path}")
@@ -1,7 +1,12 @@
 from .xml_parser import XMLParser
 from .yomitan_parser import YomitanParser
+from .side_table import SideTable
+from .search_rank import SearchRankRule, SearchRankRules
 
 __all__ = [
     "XMLParser",
-    "YomitanParser"
+    "YomitanParser",
+    "SideTable",
+    "SearchRankRule",
+    "SearchRankRules"
 ]
\ No newline at end of file
@@ -3,12 +3,12 @@ from typing import List, Tuple
 from tqdm import tqdm
 
 from config import DictionaryConfig
-from core.file_iterator import FileIterator
+from utils import Instrumentation, PageProfiler
 
 class BaseParser(ABC):
     def __init__(self, config: DictionaryConfig, batch_size = 1000) -> None:
         self.config = config
-        self.file_iterator = FileIterator(config.dict_path)
+        self.file_iterator = config.create_source_iterator()
         self.files_processed = 0
         self.entries_processed = 0
         self.batch_size = batch_size
@@ -20,18 +20,34 @@ class BaseParser(ABC):
 
         self.initialize_processing()
 
+        # Pages already fully written by an interrupted build are skipped without parsing
+        resumed_pages = self.get_resume_position()
+        if resumed_pages:
+            self.file_iterator.skip(resumed_pages)
+
         #count = 0
-        with tqdm(total=total_files, desc="進歩", bar_format=self.bar_format, unit="事項") as pbar:
+        with tqdm(total=total_files, initial=resumed_pages, desc="進歩", bar_format=self.bar_format, unit="事項") as pbar:
             while self.file_iterator.has_more():
             #while count <= 20:
-                batch = self.file_iterator.get_next_batch(self.batch_size)
-                self.entries_processed += self._process_batch(batch)
-                self.files_processed += self.batch_size
-                pbar.update(self.batch_size)
+                with Instrumentation.timer("page_read"):
+                    batch = self.file_iterator.get_next_batch(self.batch_size)
+                if self.config.shard is not None:
+                    self.entries_processed += self._process_sharded_batch(batch)
+                else:
+                    self.entries_processed += self._process_batch(batch)
+                self.files_processed += len(batch)
+                pbar.update(len(batch))
                 #count += 1
 
+        if self.config.shard is not None:
+            # Anything added from here on (finalisation, appendices) sorts after every page
+            self.set_page_position(self.file_iterator.end_position)
+
         self.finalize_processing()
 
+        Instrumentation.count("pages", self.files_processed)
+        Instrumentation.count("entries", self.entries_processed)
+
         return total_files
 
 
@@ -47,11 +63,45 @@ class BaseParser(ABC):
         pass
 
 
+    def get_resume_position(self) -> int:
+        """Number of source pages to skip when resuming from a checkpoint"""
+        return 0
+
+
+    def complete_page(self) -> None:
+        pass
+
+
+    def set_page_position(self, position: int) -> None:
+        """Record the global position of the page being parsed (sharded builds only)"""
+        self.page_position = position
+
+
+    def _process_sharded_batch(self, batch: List[Tuple[str, str]]) -> int:
+        batch_entries_processed = 0
+
+        for item, position in zip(batch, self.file_iterator.last_batch_positions):
+            self.set_page_position(position)
+            batch_entries_processed += self._process_batch([item])
+
+        return batch_entries_processed
+
+
     def _process_batch(self, batch: List[Tuple[str, str]]) -> int:
         batch_entries_processed = 0
 
         for filename, file_content in batch:
-            entries_from_file = self._process_file(filename, file_content)
+            if PageProfiler.enabled:
+                PageProfiler.start_page(filename)
+                entries_from_file = 0
+                try:
+                    entries_from_file = self._process_file(filename, file_content)
+                finally:
+                    # A page that raises is still recorded, so the profile shows where the build stopped
+                    PageProfiler.end_page(entries_from_file)
+            else:
+                entries_from_file = self._process_file(filename, file_content)
+            self.complete_page()
             #if entries_from_file == 0:
                 #print(f"No entries were processed for file: {filename}")
 
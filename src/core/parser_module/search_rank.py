@@ -0,0 +1,68 @@
+import regex as re
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SearchRankRule:
+    """Readings containing any of the patterns get this rank"""
+    name: str
+    rank: int
+    patterns: Tuple[str, ...]
+    literal: bool = True  # Patterns are plain strings; set False to use them as regexes
+
+
+class SearchRankRules:
+    """
+    An ordered set of search-rank rules compiled into one pattern. Each rule becomes a
+    lookahead branch of a single alternation, so one match call finds the first rule (in
+    rule order) with a pattern anywhere in the reading. Readings no rule matches get the
+    default rank (the reading length unless given).
+
+    Ranks are memoised per reading: the same readings come up for every kanji of a page
+    and again on other pages, so each distinct reading is matched once per process.
+    """
+
+    def __init__(self, rules: Iterable[SearchRankRule], default: Callable[[str], int] = len,
+                 normalize: Optional[Callable[[str], str]] = None):
+        self.rules = list(rules)
+        self.default = default
+        self.normalize = normalize
+        self.pattern = SearchRankRules.compile_rules(self.rules)
+        self._ranks: Dict[str, int] = {}
+
+
+    @staticmethod
+    def compile_rules(rules: Iterable[SearchRankRule]) -> Optional[re.Pattern]:
+        branches = []
+        for i, rule in enumerate(rules):
+            alternatives = "|".join(re.escape(p) if rule.literal else p for p in rule.patterns)
+            # The empty group only records which branch matched
+            branches.append(f"(?=.*?(?:{alternatives}))(?P<rule_{i}>)")
+
+        return re.compile("|".join(branches), re.DOTALL) if branches else None
+
+
+    def match_rule(self, reading: str) -> Optional[SearchRankRule]:
+        """The first rule that applies to the reading, or None"""
+        if self.pattern is None:
+            return None
+
+        text = self.normalize(reading) if self.normalize else reading
+        match = self.pattern.match(text)
+        if not match:
+            return None
+        return self.rules[int(match.lastgroup[len("rule_"):])]
+
+
+    def get_rank(self, reading: str) -> int:
+        rank = self._ranks.get(reading)
+        if rank is None:
+            rule = self.match_rule(reading)
+            rank = rule.rank if rule else self.default(reading)
+            self._ranks[reading] = rank
+        return rank
+
+
+    def clear_cache(self) -> None:
+        self._ranks.clear()
@@ -0,0 +1,83 @@
+import os
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+
+class SideTable:
+    """
+    A per-dictionary JSON side file (mappings, lookup lists, manual headwords, ...)
+    loaded once per process, validated, and indexed for O(1) lookups.
+
+    File contents are cached by path, mtime and size, so a side file is read and
+    parsed at most once per process no matter how many parsers or strategies load it.
+    """
+    _file_data: Dict[Tuple[str, int, int], Any] = {}
+
+    def __init__(self, path: str, data: Any, index: Dict[Any, Any]):
+        self.path = path
+        self.data = data
+        self.index = index
+
+
+    @classmethod
+    def load(cls, path: Union[str, Path], required_keys: Iterable[str] = (),
+             build_index: Optional[Callable[[Any], Dict[Any, Any]]] = None) -> "SideTable":
+        """
+        Load a side table. required_keys are checked on the top-level object and
+        build_index turns the raw data into the lookup dict (defaults to the data itself).
+        """
+        abs_path = os.path.abspath(str(path))
+        if not os.path.isfile(abs_path):
+            raise FileNotFoundError(f"Side table not found: {abs_path}")
+
+        stat = os.stat(abs_path)
+        key = (abs_path, stat.st_mtime_ns, stat.st_size)
+        data = cls._file_data.get(key)
+        if data is None:
+            with open(abs_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            cls._file_data[key] = data
+
+        cls._validate(abs_path, data, required_keys)
+
+        index = build_index(data) if build_index else data
+        if not isinstance(index, dict):
+            raise ValueError(f"Side table {os.path.basename(abs_path)} must be indexed by a dict, got {type(index).__name__}")
+
+        return cls(abs_path, data, index)
+
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._file_data.clear()
+
+
+    @staticmethod
+    def _validate(path: str, data: Any, required_keys: Iterable[str]) -> None:
+        required_keys = list(required_keys)
+        if not required_keys:
+            return
+
+        if not isinstance(data, dict):
+            raise ValueError(f"Side table {os.path.basename(path)} must be a JSON object")
+
+        missing = [key for key in required_keys if key not in data]
+        if missing:
+            raise ValueError(f"Side table {os.path.basename(path)} is missing keys: {', '.join(missing)}")
+
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self.index.get(key, default)
+
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.index[key]
+
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.index
+
+
+    def __len__(self) -> int:
+        return len(self.index)
@@ -3,7 +3,7 @@ import bs4
 
 from .base_parser import BaseParser
 from config import DictionaryConfig
-from utils import FileUtils
+from utils import FileUtils, Instrumentation
 
 
 class XMLParser(BaseParser):
@@ -12,13 +12,13 @@ class XMLParser(BaseParser):
         super().__init__(config)
 
         from core import HTMLToYomitanConverter
-        from index import IndexReader, JukugoIndexReader
+        from index import IndexRegistry
         from handlers import ManualMatchHandler
 
-        self.index_reader = IndexReader(config.index_path) if config.index_path else None
-        self.jukugo_index_reader = JukugoIndexReader(config.jukugo_index_path) if config.jukugo_index_path else None
-        self.idiom_index_reader = JukugoIndexReader(config.idiom_index_path) if config.idiom_index_path else None
-        self.kanji_index_reader = IndexReader(config.kanji_index_path) if config.kanji_index_path else None
+        self.index_reader = IndexRegistry.get_index_reader(config.index_path) if config.index_path else None
+        self.jukugo_index_reader = IndexRegistry.get_jukugo_index_reader(config.jukugo_index_path) if config.jukugo_index_path else None
+        self.idiom_index_reader = IndexRegistry.get_jukugo_index_reader(config.idiom_index_path) if config.idiom_index_path else None
+        self.kanji_index_reader = IndexRegistry.get_index_reader(config.kanji_index_path) if config.kanji_index_path else None
 
         self.tag_mapping = FileUtils.load_json(config.tag_map_path) if config.tag_map_path else {}
         self.manual_handler = ManualMatchHandler() if config.index_path else None
@@ -39,6 +39,22 @@ class XMLParser(BaseParser):
         self.bar_format = "「{desc}: {bar:30}」{percentage:3.0f}% | {n_fmt}/{total_fmt} {unit} [経過: {elapsed} | 残り: {remaining}]{postfix}"
 
 
+    def parse(self) -> int:
+        total_files = super().parse()
+
+        if hasattr(self.image_handling_strategy, "report_unresolved"):
+            self.image_handling_strategy.report_unresolved()
+            Instrumentation.count("unresolved_images", self.image_handling_strategy.unresolved_references)
+
+        return total_files
+
+
+    def parse_xml(self, content: str, features: str = "xml") -> bs4.BeautifulSoup:
+        """Parse a page into a soup, timed as its own stage"""
+        with Instrumentation.timer("xml_parse"):
+            return bs4.BeautifulSoup(content, features)
+
+
     def get_target_tag(self, tag_name: str, class_list: Optional[List[str]] = None,
                        parent: Optional[bs4.element.Tag] = None, recursion_depth: int = 0) -> str:
         """
@@ -5,6 +5,7 @@ import bs4
 from config import DictionaryConfig
 from .xml_parser import XMLParser
 from core.yomitan import DicEntry
+from utils import MemoryProfiler
 
 
 class YomitanParser(XMLParser):
@@ -12,8 +13,29 @@ class YomitanParser(XMLParser):
         super().__init__(config)
 
         from core.yomitan import YomitanDictionary
-        self.dictionary = YomitanDictionary(config.dict_name, config.term_bank_folder)
+        self.dictionary = YomitanDictionary(
+            config.dict_name,
+            config.term_bank_folder,
+            track_order=config.shard is not None,
+            resume=config.resume,
+            source_pages=self.file_iterator.get_total_files_count(),
+            minify=config.minify_content
+        )
         self.normalization_strategy = config.create_normalization_strategy()
+        MemoryProfiler.checkpoint("strategies")
+
+
+    def get_resume_position(self) -> int:
+        return self.dictionary.pages_completed
+
+
+    def complete_page(self) -> None:
+        self.dictionary.complete_page()
+
+
+    def set_page_position(self, position: int) -> None:
+        super().set_page_position(position)
+        self.dictionary.order_position = position
 
 
     def parse_entry(self,
@@ -0,0 +1,151 @@
+import os
+import json
+import heapq
+import hashlib
+import regex as re
+from typing import Any, Iterator, List, Tuple
+
+ORDER_FILE_NAME = "shard_order.jsonl"
+
+
+class ShardSpec:
+    """
+    One shard of an N-way build ("i/N", 1-based). Pages are assigned by a stable hash of
+    their name, so every machine computes the same partition without coordination.
+    """
+
+    def __init__(self, index: int, count: int):
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"Invalid shard {index}/{count}: expected 1 <= i <= N")
+        self.index = index
+        self.count = count
+
+
+    @classmethod
+    def parse(cls, spec: str) -> "ShardSpec":
+        try:
+            index, count = (int(part) for part in spec.split("/"))
+        except ValueError:
+            raise ValueError(f"Invalid shard '{spec}': expected i/N, e.g. 1/4")
+        return cls(index, count)
+
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+    @property
+    def folder_name(self) -> str:
+        return f"shard_{self.index}_of_{self.count}"
+
+
+    @staticmethod
+    def stable_hash(name: str) -> int:
+        # hash() is salted per process, so it can't be used to agree across machines
+        return int.from_bytes(hashlib.md5(name.encode("utf-8")).digest()[:8], "big")
+
+
+    def contains(self, name: str) -> bool:
+        return ShardSpec.stable_hash(name) % self.count == self.index - 1
+
+
+class ShardMerger:
+    """
+    Merges the term banks of N shard builds into one renumbered set. Each shard writes
+    the global page position of every entry next to its term banks (shard_order.jsonl,
+    one line per term bank), and pages within a shard are in global order, so a k-way
+    merge on that position reproduces the entry order of a single-node build. Within a page,
+    entries keep the order the parser emitted them in; parsers have to emit them in the same
+    order on every run (no iteration over sets of keys, whose order depends on the hash seed).
+    """
+    termbank_pattern = re.compile(r'term_bank_(\d+)\.json$')
+
+    @staticmethod
+    def get_shard_folders(base_folder: str, count: int) -> List[str]:
+        folders = [os.path.join(base_folder, ShardSpec(i, count).folder_name) for i in range(1, count + 1)]
+        missing = [folder for folder in folders if not os.path.isfile(os.path.join(folder, ORDER_FILE_NAME))]
+        if missing:
+            raise FileNotFoundError(f"Missing shard output: {', '.join(missing)}")
+        return folders
+
+
+    @staticmethod
+    def iter_shard_entries(shard_folder: str, shard_number: int) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (page position, shard number, entry), holding one term bank at a time"""
+        banks = sorted(
+            (int(match.group(1)), name)
+            for name in os.listdir(shard_folder)
+            if (match := ShardMerger.termbank_pattern.match(name))
+        )
+
+        with open(os.path.join(shard_folder, ORDER_FILE_NAME), "r", encoding="utf-8") as order_file:
+            for (_, name), line in zip(banks, order_file):
+                positions = json.loads(line)
+                with open(os.path.join(shard_folder, name), "r", encoding="utf-8") as f:
+                    entries = json.load(f)
+                if len(positions) != len(entries):
+                    raise ValueError(f"{shard_folder}/{name} has {len(entries)} entries but {len(positions)} positions")
+
+                for position, entry in zip(positions, entries):
+                    yield position, shard_number, entry
+
+
+    @staticmethod
+    def merge(shard_folders: List[str], output_folder: str, chunk_size: int = 10000) -> int:
+        """Write the merged term banks to output_folder; returns the number of entries"""
+        os.makedirs(output_folder, exist_ok=True)
+        for name in os.listdir(output_folder):
+            if ShardMerger.termbank_pattern.match(name):
+                os.remove(os.path.join(output_folder, name))
+
+        streams = [ShardMerger.iter_shard_entries(folder, i) for i, folder in enumerate(shard_folders)]
+        # Ties (entries added after the last page, e.g. appendices) keep shard order
+        merged = heapq.merge(*streams, key=lambda item: (item[0], item[1]))
+
+        chunk: List[Any] = []
+        bank_number = 0
+        total = 0
+
+        def write_chunk() -> None:
+            nonlocal bank_number
+            bank_number += 1
+            with open(os.path.join(output_folder, f"term_bank_{bank_number}.json"), "w", encoding="utf-8") as f:
+                json.dump(chunk, f, ensure_ascii=False)
+
+        for _, _, entry in merged:
+            chunk.append(entry)
+            total += 1
+            if len(chunk) >= chunk_size:
+                write_chunk()
+                chunk = []
+
+        if chunk:
+            write_chunk()
+
+        return total
+
+
+    @staticmethod
+    def write_order(output_folder: str, positions: List[int]) -> None:
+        with open(os.path.join(output_folder, ORDER_FILE_NAME), "a", encoding="utf-8") as f:
+            f.write(json.dumps(positions) + "\n")
+
+
+    @staticmethod
+    def clear_order(output_folder: str) -> None:
+        order_path = os.path.join(output_folder, ORDER_FILE_NAME)
+        if os.path.exists(order_path):
+            os.remove(order_path)
+
+
+    @staticmethod
+    def truncate_order(output_folder: str, bank_count: int) -> None:
+        """Keep the positions of the first bank_count term banks (resuming a shard build)"""
+        order_path = os.path.join(output_folder, ORDER_FILE_NAME)
+        if not os.path.exists(order_path):
+            return
+
+        with open(order_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()[:bank_count]
+        with open(order_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
@@ -1,8 +1,10 @@
 from .dic_entry import DicEntry, create_html_element
 from .dictionary import YomitanDictionary
+from .content_minifier import ContentMinifier
 
 __all__ = [
     "DicEntry",
     "create_html_element",
-    "YomitanDictionary"
+    "YomitanDictionary",
+    "ContentMinifier"
 ]
\ No newline at end of file
@@ -0,0 +1,61 @@
+import queue
+import threading
+from typing import Callable, Optional
+
+
+class ChunkWriteError(Exception):
+    """A background term bank write failed; the original exception is the __cause__"""
+
+
+class ChunkWriter:
+    """
+    Background thread that runs term bank writes one at a time, in submission order.
+    The queue is bounded, so a parser that outruns the disk blocks in submit() instead of
+    piling finished chunks up in memory. The first failed write stops all later ones and is
+    re-raised on the parsing thread at its next submit(), wait() or close().
+    """
+
+    def __init__(self, max_pending: int = 2, name: str = "term-bank-writer"):
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.error: Optional[BaseException] = None
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+
+    def _run(self) -> None:
+        while True:
+            job = self.queue.get()
+            try:
+                if job is None:
+                    return
+                # After a failure later chunks are dropped; writing them would leave a gap in the banks
+                if self.error is None:
+                    job()
+            except BaseException as e:
+                self.error = e
+            finally:
+                self.queue.task_done()
+
+
+    def raise_error(self) -> None:
+        if self.error is not None:
+            raise ChunkWriteError(f"Background term bank write failed: {self.error}") from self.error
+
+
+    def submit(self, job: Callable[[], None]) -> None:
+        """Queue a write, blocking while max_pending writes are already waiting"""
+        self.raise_error()
+        self.queue.put(job)
+
+
+    def wait(self) -> None:
+        """Block until every submitted write has finished"""
+        self.queue.join()
+        self.raise_error()
+
+
+    def close(self) -> None:
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        self.raise_error()
@@ -0,0 +1,140 @@
+import json
+from typing import Any, List, Optional, Tuple
+
+# Elements whose children are rows, cells or list items; text is never spliced directly into them
+STRUCTURAL_TAGS = {"table", "thead", "tbody", "tfoot", "tr", "ol", "ul"}
+# Attributes Yomitan needs even when empty
+REQUIRED_ATTRIBUTES = {"tag", "href", "path"}
+EMPTY_VALUES = (None, "", {}, [])
+
+
+class ContentMinifier:
+    """
+    Shrinks structured content without changing how Yomitan renders it. HTMLToYomitanConverter
+    wraps every text node in an attribute-less span and keeps one-item content lists, so a
+    plain <b>word</b> comes out as three levels of nesting. The pass:
+
+    - unwraps attribute-less spans, splicing their content into the parent (Yomitan only gives
+      them the gloss-sc-span class, which dictionary styles don't target)
+    - joins adjacent strings, and adjacent text-only spans with the same data
+    - stores one-item content lists as the item itself, which Yomitan accepts
+    - drops attributes whose value is empty
+
+    data dicts are kept as they are, even when they only name the source tag: dictionary
+    stylesheets select on data-sc-* attributes. The input is never modified.
+    """
+
+    @staticmethod
+    def minify_definitions(definitions: list) -> list:
+        """Minify the structured-content definitions of a term bank row; plain definitions are kept"""
+        return [
+            {**definition, "content": ContentMinifier.minify_content(definition.get("content"))}
+            if isinstance(definition, dict) and definition.get("type") == "structured-content" else definition
+            for definition in definitions
+        ]
+
+
+    @staticmethod
+    def minify_content(content: Any, parent_tag: Optional[str] = None) -> Any:
+        if content is None or isinstance(content, str):
+            return content
+
+        children = []
+        for item in content if isinstance(content, list) else [content]:
+            if isinstance(item, dict):
+                item = ContentMinifier.minify_element(item)
+                if ContentMinifier.is_bare_span(item) and parent_tag not in STRUCTURAL_TAGS:
+                    inner = item.get("content")
+                    for child in inner if isinstance(inner, list) else [inner]:
+                        ContentMinifier._append(children, child)
+                    continue
+            ContentMinifier._append(children, item)
+
+        return children[0] if len(children) == 1 else children
+
+
+    @staticmethod
+    def minify_element(element: dict) -> dict:
+        minified = {}
+        for key, value in element.items():
+            if key == "content":
+                value = ContentMinifier.minify_content(value, element.get("tag"))
+            if key not in REQUIRED_ATTRIBUTES and value in EMPTY_VALUES:
+                continue
+            minified[key] = value
+        return minified
+
+
+    @staticmethod
+    def is_bare_span(element: dict) -> bool:
+        return element.get("tag") == "span" and element.keys() <= {"tag", "content"}
+
+
+    @staticmethod
+    def is_text_span(element: Any) -> bool:
+        return (isinstance(element, dict) and element.get("tag") == "span"
+                and isinstance(element.get("content"), str) and element.keys() <= {"tag", "content", "data"})
+
+
+    @staticmethod
+    def _append(children: List, node: Any) -> None:
+        if node is None or node == "":
+            return
+
+        last = children[-1] if children else None
+        if isinstance(node, str) and isinstance(last, str):
+            children[-1] = last + node
+        elif (ContentMinifier.is_text_span(node) and ContentMinifier.is_text_span(last)
+              and node.get("data") == last.get("data")):
+            children[-1] = {**last, "content": last["content"] + node["content"]}
+        else:
+            children.append(node)
+
+
+    @staticmethod
+    def render_signature(content: Any) -> List[Tuple]:
+        """
+        Structured content reduced to runs of text with the attributes of every element around
+        them, and open/close markers for all elements except spans. Empty attributes and
+        attribute-less spans contribute nothing.
+
+        This follows the same equivalences the minifier relies on, so it can't fault unwrapping
+        or joining spans (test/test_content_minifier.py pins those rules down). It catches text
+        that was lost or reordered and attributes that were changed, over whole term banks.
+        """
+        tokens = []
+
+        def walk(node: Any, ancestors: Tuple, parent_tag: Optional[str] = None) -> None:
+            if node is None or isinstance(node, str):
+                if not node:
+                    return
+                if tokens and tokens[-1][0] == "text" and tokens[-1][1] == ancestors:
+                    tokens[-1] = ("text", ancestors, tokens[-1][2] + node)
+                else:
+                    tokens.append(("text", ancestors, node))
+                return
+
+            if isinstance(node, list):
+                for child in node:
+                    walk(child, ancestors, parent_tag)
+                return
+
+            tag = node.get("tag")
+            attributes = tuple(sorted(
+                (key, json.dumps(value, ensure_ascii=False, sort_keys=True))
+                for key, value in node.items()
+                if key != "content" and (key in REQUIRED_ATTRIBUTES or value not in EMPTY_VALUES)
+            ))
+            if tag == "span" and len(attributes) == 1 and parent_tag not in STRUCTURAL_TAGS:
+                walk(node.get("content"), ancestors, parent_tag)
+                return
+
+            inner = ancestors + (attributes,)
+            if tag != "span":
+                tokens.append(("open", inner))
+            walk(node.get("content"), inner, tag)
+            if tag != "span":
+                tokens.append(("close",))
+
+        walk(content, ())
+        return tokens
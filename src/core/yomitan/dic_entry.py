@@ -1,3 +1,4 @@
+from utils import Instrumentation
 
 
 class DicEntry:
@@ -41,7 +42,8 @@ class DicEntry:
 
 
     def add_element(self, element):
-        self.validate_element(element)
+        with Instrumentation.timer("entry_validation"):
+            self.validate_element(element)
         self.content.append(element)
         self.structured_content = True
 
@@ -1,45 +1,130 @@
 import os
 import json
+import functools
 import regex as re
+from typing import Optional
+
+from core.checkpoint import BuildCheckpoint
+from .chunk_writer import ChunkWriter, ChunkWriteError
+from .content_minifier import ContentMinifier
+from utils import Instrumentation, PageProfiler, MemoryProfiler
 
 
 class YomitanDictionary:
     termbank_pattern = re.compile(r'(term_bank_(\d+)\.json$)')
 
-    def __init__(self, dictionary_name: str, output_path: str):
+    def __init__(self, dictionary_name: str, output_path: str, track_order: bool = False,
+                 resume: bool = False, source_pages: Optional[int] = None, minify: bool = False):
         self.dictionary_name = dictionary_name
         self.output_path = output_path
-        self._init_directory()
         # TODO: use a config instead with more info about the dictionary
 
         self.current_chunk = []
         self.total_entries = 0
         self.chunk_size = 10000
 
-
-    def _init_directory(self):
+        # Structured content is minified on the writer thread; term bank bytes before and after
+        # are added up there (and kept in the checkpoint) for the report at export
+        self.minify = minify
+        self.bytes_before_minify = 0
+        self.bytes_after_minify = 0
+
+        # Progress saved in the checkpoint at every flush: pages whose entries were all added,
+        # entries added so far for the current page, and (when resuming) entries to drop
+        # because the checkpointed build already wrote them
+        self.source_pages = source_pages
+        self.pages_completed = 0
+        self.page_entries = 0
+        self.skip_entries = 0
+        checkpoint = self._load_checkpoint() if resume else None
+        self._init_directory(checkpoint)
+        self.next_bank_number = self._get_next_term_bank_number()
+
+        # Full chunks are encoded and written on a background thread; at most this many wait in its queue
+        self.max_pending_chunks = 2
+        self.writer: Optional[ChunkWriter] = None
+
+        # Sharded builds record each entry's global page position so shards can be merged in order
+        self.track_order = track_order
+        self.order_position = 0
+        self.current_order = []
+        if track_order:
+            from core.sharding import ShardMerger
+            if checkpoint:
+                ShardMerger.truncate_order(self.output_path, checkpoint["next_bank"] - 1)
+            else:
+                ShardMerger.clear_order(self.output_path)
+
+
+    def _get_build_identity(self) -> dict:
+        return {"dictionary_name": self.dictionary_name, "chunk_size": self.chunk_size,
+                "source_pages": self.source_pages, "minify": self.minify}
+
+
+    def _load_checkpoint(self) -> Optional[dict]:
+        checkpoint = BuildCheckpoint.load(self.output_path)
+        if checkpoint is None:
+            print("チェックポイントが見つからないため、最初から処理します")
+            return None
+
+        mismatch = BuildCheckpoint.find_mismatch(checkpoint, self._get_build_identity())
+        missing_banks = [
+            number for number in range(1, checkpoint["next_bank"])
+            if not os.path.exists(os.path.join(self.output_path, f"term_bank_{number}.json"))
+        ]
+        if mismatch or missing_banks:
+            reason = mismatch or f"term_bank_{missing_banks[0]}.json がありません"
+            print(f"チェックポイントを使えないため、最初から処理します ({reason})")
+            return None
+
+        self.total_entries = checkpoint["total_entries"]
+        self.pages_completed = checkpoint["pages_completed"]
+        self.skip_entries = checkpoint["page_entries"]
+        self.bytes_before_minify, self.bytes_after_minify = checkpoint.get("minify_bytes", (0, 0))
+        print(f"チェックポイントから再開します: {self.pages_completed}ページ, "
+              f"{self.total_entries}項目 (term_bank_{checkpoint['next_bank'] - 1}.json まで)")
+        return checkpoint
+
+
+    def _init_directory(self, checkpoint: Optional[dict] = None):
         os.makedirs(self.output_path, exist_ok=True)
 
+        # Banks written after the checkpoint (or all of them, when starting over) are rebuilt
+        first_stale_bank = checkpoint["next_bank"] if checkpoint else 1
         for file in os.listdir(self.output_path):
             match = self.termbank_pattern.match(file)
-            if match:
+            if match and int(match.group(2)) >= first_stale_bank:
                 os.remove(os.path.join(self.output_path, file))
 
+        if not checkpoint:
+            BuildCheckpoint.clear(self.output_path)
+
 
     def add_entry(self, entry) -> bool:
         try:
             if not entry:
                 raise ValueError("Entry must not be empty")
 
+            self.page_entries += 1
+            if self.skip_entries:
+                # Re-emitted by the page the checkpoint stopped in; already in a term bank
+                self.skip_entries -= 1
+                return True
+
             self.current_chunk.append(entry)
             self.total_entries += 1
+            if self.track_order:
+                self.current_order.append(self.order_position)
+
+            if PageProfiler.enabled:
+                PageProfiler.record_entry(entry)
 
             if len(self.current_chunk) >= self.chunk_size:
                 self._flush_chunk_to_disk()
 
             return True
 
-        except ValueError:
+        except (ValueError, ChunkWriteError):
             raise
         except Exception as e:
             print(f"Failed to add entry {entry}: {e}")
@@ -47,7 +132,20 @@ class YomitanDictionary:
 
 
     def flush(self) -> bool:
-        return self._flush_chunk_to_disk()
+        """Write the current chunk and wait until every queued term bank is on disk"""
+        self._flush_chunk_to_disk()
+        if self.writer is not None:
+            self.writer.wait()
+        return True
+
+
+    def complete_page(self) -> None:
+        """Mark every entry of the current source page as added"""
+        if self.skip_entries:
+            print(f"警告: 再開したページの項目数がチェックポイントより{self.skip_entries}件少ないです")
+            self.skip_entries = 0
+        self.pages_completed += 1
+        self.page_entries = 0
 
 
     def get_entry_count(self) -> int:
@@ -55,26 +153,86 @@ class YomitanDictionary:
 
 
     def _flush_chunk_to_disk(self) -> bool:
+        """Hand the current chunk to the writer thread; parsing continues while it is encoded and written"""
         if not self.current_chunk or len(self.current_chunk) == 0:
             return True
 
-        entries_to_flush = []
-        for entry in self.current_chunk:
-            entries_to_flush.append(entry.to_list())
+        term_bank_number = self.next_bank_number
+        self.next_bank_number += 1
+        # Progress as of this chunk; written after the bank itself so it never counts unwritten entries
+        checkpoint = {
+            **self._get_build_identity(),
+            "next_bank": term_bank_number + 1,
+            "pages_completed": self.pages_completed,
+            "page_entries": self.page_entries,
+            "total_entries": self.total_entries,
+        }
+        job = functools.partial(self._write_chunk, term_bank_number, self.current_chunk,
+                                self.current_order if self.track_order else None, checkpoint)
+        self.current_chunk = []
+        self.current_order = []
+
+        if self.writer is None:
+            self.writer = ChunkWriter(self.max_pending_chunks)
+        with Instrumentation.timer("flush_wait"):
+            self.writer.submit(job)
+
+        MemoryProfiler.checkpoint(f"flush:term_bank_{term_bank_number}")
+        return True
+
 
-        term_bank_number = self._get_next_term_bank_number()
+    def _write_chunk(self, term_bank_number: int, chunk: list, order: Optional[list], checkpoint: dict) -> None:
+        """Runs on the writer thread"""
         output_file = os.path.join(self.output_path, f"term_bank_{term_bank_number}.json")
 
         try:
-            with open(output_file, 'w', encoding='utf-8') as out_file:
-                json.dump(entries_to_flush, out_file, ensure_ascii=False)
+            rows = [entry.to_list() for entry in chunk]
+            if self.minify:
+                rows = self._minify_rows(rows)
+            with Instrumentation.timer("json_serialisation"):
+                # dumps takes the C encoder's one-shot path; dump would stream through the pure Python one
+                data = json.dumps(rows, ensure_ascii=False).encode("utf-8")
+            if self.minify:
+                self.bytes_after_minify += len(data)
+                checkpoint["minify_bytes"] = [self.bytes_before_minify, self.bytes_after_minify]
+            with Instrumentation.timer("term_bank_write"), open(output_file, 'wb') as out_file:
+                out_file.write(data)
+                # The checkpoint below may only count banks that are durably on disk
+                out_file.flush()
+                os.fsync(out_file.fileno())
         except Exception as e:
             print(f"Failed to write chunk: {output_file}: {e}")
             raise
 
-        self.current_chunk = []
+        if order is not None:
+            from core.sharding import ShardMerger
+            ShardMerger.write_order(self.output_path, order)
 
-        return True
+        BuildCheckpoint.save(self.output_path, checkpoint)
+
+
+    def _minify_rows(self, rows: list) -> list:
+        """Runs on the writer thread; also counts the bytes the rows would have taken unminified"""
+        with Instrumentation.timer("content_minify"):
+            minified = [row[:5] + [ContentMinifier.minify_definitions(row[5])] + row[6:] for row in rows]
+        with Instrumentation.timer("minify_report"):
+            self.bytes_before_minify += len(json.dumps(rows, ensure_ascii=False).encode("utf-8"))
+        return minified
+
+
+    def report_minify(self) -> None:
+        if not self.bytes_before_minify:
+            return
+
+        saved = self.bytes_before_minify - self.bytes_after_minify
+        percentage = saved / self.bytes_before_minify * 100
+        print(f"構造化コンテンツを最小化しました: {self.bytes_before_minify:,} → {self.bytes_after_minify:,} バイト "
+              f"({percentage:.1f}% 削減)")
+        Instrumentation.add_section("minify", {
+            "bytes_before": self.bytes_before_minify,
+            "bytes_after": self.bytes_after_minify,
+            "saved_percent": round(percentage, 2),
+        })
 
 
     def _get_next_term_bank_number(self) -> int:
@@ -104,5 +262,16 @@ class YomitanDictionary:
         if len(self.current_chunk) != 0 and not self._flush_chunk_to_disk():
             raise Exception("Failed to flush remaining entries during export")
 
+        # Wait for the writer to drain; a failed write surfaces here at the latest
+        if self.writer is not None:
+            with Instrumentation.timer("flush_wait"):
+                self.writer.close()
+            self.writer = None
+
+        # Every entry is on disk, so there is nothing left to resume
+        BuildCheckpoint.clear(self.output_path)
+        if self.minify:
+            self.report_minify()
+
         # TODO: export index from config
         return True
\ No newline at end of file
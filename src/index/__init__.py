@@ -1,7 +1,9 @@
 from .index_reader import IndexReader
 from .index_reader import JukugoIndexReader
+from .index_registry import IndexRegistry
 
 __all__ = [
     "IndexReader",
-    "JukugoIndexReader"
+    "JukugoIndexReader",
+    "IndexRegistry"
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 import os
-from typing import List, Dict, Any
+import sys
+from typing import List, Dict, Any, Tuple
 from collections import defaultdict
 from tqdm import tqdm
 
@@ -10,6 +11,7 @@ class IndexReader:
         self.index_file_path = index_file_path
         self.dict_data = {}  # Dictionary mapping keys to filenames
         self.file_to_keys = defaultdict(list)  # Reverse mapping: filename -> keys
+        self.read_only = False  # Set by IndexRegistry for shared instances
         self.load_index()
 
     def load_index(self) -> None:
@@ -71,6 +73,9 @@ class IndexReader:
 
         :returns bool: True if entry was added, False if key-filename pair already exists
         """
+        if self.read_only:
+            raise RuntimeError(f"Index is shared and read-only: {self.index_file_path}")
+
         # Check if this key-filename pair already exists
         if key in self.dict_data and filename in self.dict_data[key]:
             return False  # Already exists
@@ -94,6 +99,9 @@ class IndexReader:
         Write the updated entry to the index file.
         This rewrites the entire file to maintain consistency.
         """
+        if self.read_only:
+            raise RuntimeError(f"Index is shared and read-only: {self.index_file_path}")
+
         with open(self.index_file_path, 'w', encoding='utf-8') as f:
             for k, filenames in self.dict_data.items():
                 line = k + '\t' + '\t'.join(filenames) + '\n'
@@ -104,13 +112,14 @@ class JukugoIndexReader:
 
     def __init__(self, index_file_path: str):
         self.index_file_path = index_file_path
-        self.page_to_items = defaultdict(list)
-        self.grouped_entries = defaultdict(lambda: defaultdict(set))  # page_id -> item_id -> set of keys
+        # page_id -> item_id -> {'kanji': (...), 'readings': (...)}, compiled once at load time
+        self.organized_entries: Dict[str, Dict[str, Dict[str, Tuple[str, ...]]]] = {}
+        self.read_only = False  # Set by IndexRegistry for shared instances
 
         self.load_index()
 
     def load_index(self):
-        """Load the index file and build mappings"""
+        """Load the index file and compile the per-page entry groups"""
         if not os.path.exists(self.index_file_path):
             raise FileNotFoundError(f"Index file not found: {self.index_file_path}")
 
@@ -119,6 +128,7 @@ class JukugoIndexReader:
             total_lines = sum(1 for _ in f)
 
         bar_format = "「{desc}: {bar:30}」{percentage:3.0f}% | {n_fmt}/{total_fmt} {unit}"
+        grouped_entries = defaultdict(lambda: defaultdict(set))  # page_id -> item_id -> set of keys
 
         with open(self.index_file_path, 'r', encoding='utf-8') as f, \
                 tqdm(total=total_lines, desc="索引読込中", unit="行", bar_format=bar_format, ascii="░▒█") as pbar:
@@ -129,10 +139,10 @@ class JukugoIndexReader:
                     print(f"Found a malformed line: {parts}")
                     continue
 
-                key = parts[0]  # The jukugo word
+                key = sys.intern(parts[0])  # The jukugo word
                 reference_ids = parts[1:]
 
-                # Process each reference ID to build the page_to_items mapping
+                # Process each reference ID to build the page -> item mapping
                 for ref_id in reference_ids:
                     try:
                         ref_parts = ref_id.split('-')
@@ -142,23 +152,52 @@ class JukugoIndexReader:
                         page_id = ref_parts[0]
                         item_id = ref_parts[1]
 
-                        self.page_to_items[page_id].append({"key": key, "item_id": [item_id]})
-                        self.grouped_entries[page_id][item_id].add(key)
+                        grouped_entries[page_id][item_id].add(key)
 
                     except ValueError:
                         print(f"Invalid reference ID format: {ref_id}")
 
                 pbar.update(1)
 
+        self._compile_entries(grouped_entries)
+
+    def _compile_entries(self, grouped_entries: Dict[str, Dict[str, set]]) -> None:
+        """Sort and categorise every item's keys once, so page lookups are a plain fetch"""
+        from utils.lang import KanjiUtils  # Import here to avoid circular imports
+
+        is_kanji_key = {}
+        for page_id, items in grouped_entries.items():
+            page_entries = {}
+            for item_id, keys in items.items():
+                kanji_entries = []
+                kana_entries = []
+
+                for key in sorted(keys):
+                    if key not in is_kanji_key:
+                        is_kanji_key[key] = any(KanjiUtils.is_kanji(c) for c in key)
+
+                    if is_kanji_key[key]:
+                        kanji_entries.append(key)
+                    else:
+                        kana_entries.append(key)
+
+                page_entries[item_id] = {
+                    'kanji': tuple(kanji_entries),
+                    'readings': tuple(kana_entries)
+                }
+
+            self.organized_entries[page_id] = page_entries
+
     def get_grouped_entries_for_page(self, page_id: str) -> Dict[str, List[str]]:
-        if page_id not in self.grouped_entries:
+        """Get the sorted keys of every item on a page"""
+        page_entries = self.organized_entries.get(page_id)
+        if not page_entries:
             return {}
 
-        result = {}
-        for item_id, keys in self.grouped_entries[page_id].items():
-            result[item_id] = sorted(list(keys))
-
-        return result
+        return {
+            item_id: sorted(entry['kanji'] + entry['readings'])
+            for item_id, entry in page_entries.items()
+        }
 
     def categorize_entries(self, entries: List[str]) -> Dict[str, List[str]]:
         from utils.lang import KanjiUtils
@@ -177,26 +216,12 @@ class JukugoIndexReader:
             'readings': kana_entries
         }
 
-    def get_organized_entries_for_page(self, page_id: str) -> dict[str, Any]:
+    def get_organized_entries_for_page(self, page_id: str) -> Dict[str, Any]:
         """
         Get entries organized by item_id with categorized keys.
-        Returns a list of dictionaries, each containing:
-        - item_id: The item identifier
-        - kanji: List of kanji forms
-        - readings: List of reading forms (kana)
+        Returns a dictionary mapping each item_id to:
+        - kanji: Sorted kanji forms
+        - readings: Sorted reading forms (kana)
+        The returned structure is shared and must not be modified.
         """
-        from utils.lang import KanjiUtils  # Import here to avoid circular imports
-        import jaconv
-
-        grouped = self.get_grouped_entries_for_page(page_id)
-        result = {}
-
-        for item_id, keys in grouped.items():
-            categorized = self.categorize_entries(keys)
-
-            result[item_id] = {
-                'kanji': categorized['kanji'],
-                'readings': categorized['readings']
-            }
-
-        return result
+        return self.organized_entries.get(page_id, {})
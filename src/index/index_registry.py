@@ -0,0 +1,91 @@
+import os
+import time
+import hashlib
+from typing import Dict, Tuple, Type, Union
+from pathlib import Path
+
+from .index_reader import IndexReader, JukugoIndexReader
+from utils import Instrumentation, MemoryProfiler
+
+
+class IndexRegistry:
+    """
+    Process-wide cache of loaded index readers.
+
+    Readers are keyed by reader type, absolute path and content hash, so every parser
+    (and every dictionary processed in the same run) shares a single instance per index file.
+    Shared readers are read-only.
+    """
+    _readers: Dict[Tuple[str, str, str], Union[IndexReader, JukugoIndexReader]] = {}
+    _file_hashes: Dict[Tuple[str, int, int], str] = {}
+    _load_timings: Dict[str, float] = {}
+
+    @classmethod
+    def get_index_reader(cls, index_file_path: Union[str, Path]) -> IndexReader:
+        return cls._get_reader(IndexReader, index_file_path)
+
+    @classmethod
+    def get_jukugo_index_reader(cls, index_file_path: Union[str, Path]) -> JukugoIndexReader:
+        return cls._get_reader(JukugoIndexReader, index_file_path)
+
+    @classmethod
+    def get_load_timings(cls) -> Dict[str, float]:
+        """Seconds spent loading each index file in this process"""
+        return dict(cls._load_timings)
+
+    @classmethod
+    def print_load_timings(cls) -> None:
+        if not cls._load_timings:
+            return
+
+        print("索引読込時間:")
+        for path, elapsed in cls._load_timings.items():
+            print(f"  {os.path.basename(path)}: {elapsed:.2f}秒")
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._readers.clear()
+        cls._file_hashes.clear()
+        cls._load_timings.clear()
+
+    @classmethod
+    def _get_reader(cls, reader_class: Type, index_file_path: Union[str, Path]):
+        abs_path = os.path.abspath(str(index_file_path))
+        key = (reader_class.__name__, abs_path, cls._hash_file(abs_path))
+
+        reader = cls._readers.get(key)
+        if reader is not None:
+            return reader
+
+        start_time = time.perf_counter()
+        with Instrumentation.timer("index_load"):
+            reader = reader_class(abs_path)
+        elapsed = time.perf_counter() - start_time
+
+        reader.read_only = True
+        cls._readers[key] = reader
+        cls._load_timings[abs_path] = elapsed
+        print(f"索引読込完了: {os.path.basename(abs_path)} ({elapsed:.2f}秒)")
+        MemoryProfiler.checkpoint(f"index_load:{os.path.basename(abs_path)}")
+
+        return reader
+
+    @classmethod
+    def _hash_file(cls, path: str) -> str:
+        """Content hash of the file, memoised by mtime and size so it is computed once per run"""
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Index file not found: {path}")
+
+        stat = os.stat(path)
+        stat_key = (path, stat.st_mtime_ns, stat.st_size)
+        if stat_key in cls._file_hashes:
+            return cls._file_hashes[stat_key]
+
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(chunk)
+
+        file_hash = hasher.hexdigest()
+        cls._file_hashes[stat_key] = file_hash
+        return file_hash
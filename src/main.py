@@ -4,36 +4,102 @@ import argparse
 import sys
 from pathlib import Path
 from config import DictionaryConfig, PathManager
-from utils import FileUtils
+from utils import Instrumentation, PageProfiler, MemoryProfiler
 
 
-def process_dictionary(config: DictionaryConfig, base_dir: Optional[str] = None, repackage_only: bool = False):
+def process_dictionary(config: DictionaryConfig, base_dir: Optional[str] = None, repackage_only: bool = False,
+                       profile: bool = False, profile_pages: bool = False, memory_profile: bool = False,
+                       asset_backend: str = "auto", asset_workers: Optional[int] = None, keep_all_assets: bool = False,
+                       shard: Optional[str] = None, merge_shards: Optional[int] = None, resume: bool = False,
+                       minify: bool = False):
     """Process a dictionary based on its configuration
     
     Args:
         config: Dictionary configuration
         base_dir: Optional base directory for files
         repackage_only: If True, skip parsing and just repackage existing files
+        profile: If True, time each processing stage and write a run report
+        profile_pages: If True, record the cost of every page and write a slow-page report
+        memory_profile: If True, sample RSS and tracemalloc at stage boundaries and add them to the run report
+        asset_backend: Rasteriser for asset conversion ("auto", "inkscape" or "python")
+        asset_workers: Worker count for asset conversion (defaults to the CPU count)
+        keep_all_assets: If True, package every file in assets instead of only referenced, deduplicated images
+        shard: "i/N" to parse only shard i of N into a shard-local term bank folder (no packaging)
+        merge_shards: N to merge the term banks of shards 1..N instead of parsing, then package
+        resume: If True, continue an interrupted parse from the checkpoint in the term bank folder
+        minify: If True, minify structured content before writing term banks (as minify_content in the YAML)
     """
+    # Imported here so --list and argument errors don't pay for loading the parsing stack
+    from utils import FileUtils, AssetConverter, AssetPacker
+
+    # The audio index (and OZK5's waka_entries.json) is built up across all pages and written
+    # whole by export(), so a resumed build or a shard would overwrite it with part of the pages
+    if config.has_audio and (shard or resume):
+        raise ValueError(f"--shard and --resume can't be used for {config.dict_name}: its audio index is written whole at the end of the build")
+
+    if profile or memory_profile:
+        Instrumentation.enable()
+    if memory_profile:
+        MemoryProfiler.enable()
+
     path_manager = PathManager(base_dir)
     paths = path_manager.get_paths(config)
+    shards_folder = paths["output_path"] / f"{config.dict_name}.shards"
+
+    if shard:
+        from core.sharding import ShardSpec
+        config.shard = ShardSpec.parse(shard)
+        paths["term_bank_folder"] = shards_folder / config.shard.folder_name
+    config.resume = resume
+    config.minify_content = config.minify_content or minify
     
     config.set_paths(paths)
     config.validate_required_paths()
     
+    if merge_shards:
+        from core.sharding import ShardMerger
+        print(f"Merging {merge_shards} shards for dictionary: {config.dict_name}")
+        shard_folders = ShardMerger.get_shard_folders(str(shards_folder), merge_shards)
+        entry_count = ShardMerger.merge(shard_folders, str(paths["term_bank_folder"]))
+        print(f"{entry_count}項目を統合しました")
+        FileUtils.update_index_revision(config.rev_name, paths["index_json_path"])
     # Only parse if not in repackage-only mode
-    if not repackage_only:
+    elif not repackage_only:
         print(f"Parsing dictionary: {config.dict_name}")
         
+        # The fix-up rewrites the pages folder, so it has to finish before the parser opens it
+        if config.fix_html:
+            raw_dict_path = paths["raw_dict_path"]
+            if raw_dict_path.exists():
+                from parsers.NANMED20.html_fixer import fix_directory
+                print(f"{config.dict_name}の本文を修正します")
+                with Instrumentation.timer("html_fix"):
+                    fix_stats = fix_directory(str(raw_dict_path), str(paths["dict_path"]),
+                                              cache_path=str(paths["html_fix_cache_path"]))
+                print(f"{fix_stats['entries']:,}項目を処理しました (修正 {fix_stats['changed']:,}件, "
+                      f"キャッシュ利用 {fix_stats['cached']:,}件)")
+                Instrumentation.add_section("html_fix", fix_stats)
+            else:
+                print(f"{raw_dict_path}が見つからないため、本文の修正を省略します")
+        
         # Create parser_module instance with required paths
         parser_class = config.get_parser_class()
         parser = parser_class(config)
         
         # TODO add variant character entry handling
         
-        parser.parse()
+        if profile_pages:
+            PageProfiler.enable(str(paths["term_bank_folder"]))
+        
+        try:
+            parser.parse()
+        finally:
+            # Close page_profile.tsv and write the report even when a page raises
+            PageProfiler.finish()
+        MemoryProfiler.checkpoint("parse")
         
-        if config.has_appendix and "appendix_path" in paths:
+        # In a sharded build the appendix belongs to the first shard only
+        if config.has_appendix and "appendix_path" in paths and (config.shard is None or config.shard.index == 1):
             appendix_path = paths["appendix_path"]
             if appendix_path.exists():
                 print(f"{config.dict_name}の付録を処理します")
@@ -45,16 +111,40 @@ def process_dictionary(config: DictionaryConfig, base_dir: Optional[str] = None,
                 print(f"{appendix_count}の付録項目を追加しました")
         
         parser.export(paths["output_path"])
+
+        if config.shard is not None:
+            print(f"Shard {config.shard} written to: {paths['term_bank_folder']}")
+            write_reports(config, paths, profile, memory_profile)
+            return
+
         FileUtils.update_index_revision(config.rev_name, paths["index_json_path"])
     else:
         print(f"Repackaging only for dictionary: {config.dict_name}")
     
+    if config.asset_conversions and paths["assets_folder"].exists():
+        print(f"{config.dict_name}のアセットをPNGに変換します")
+        asset_report = AssetConverter.convert_directory(
+            str(paths["assets_folder"]),
+            extensions=config.asset_conversions,
+            backend=asset_backend,
+            workers=asset_workers,
+            manifest_path=str(paths["asset_manifest_path"])
+        )
+        Instrumentation.add_section("assets", asset_report)
+        MemoryProfiler.checkpoint("assets")
+
+    asset_files = None
+    if not keep_all_assets and paths["assets_folder"].exists():
+        asset_files = AssetPacker.prepare(str(paths["term_bank_folder"]), str(paths["assets_folder"]),
+                                          config.asset_conversions or ())
+
     # Always gather files and create zip
     file_paths = FileUtils.gather_files(
         paths["term_bank_folder"],
         paths["assets_folder"],
         paths["index_json_path"],
-        paths["output_path"]
+        paths["output_path"],
+        asset_files
     )
     
     print(f"Creating dictionary package...")
@@ -67,6 +157,22 @@ def process_dictionary(config: DictionaryConfig, base_dir: Optional[str] = None,
     )
     print(f"Dictionary package created at: {paths['output_path']}")
 
+    MemoryProfiler.checkpoint("packaging")
+    write_reports(config, paths, profile, memory_profile)
+
+
+def write_reports(config: DictionaryConfig, paths: Dict, profile: bool, memory_profile: bool):
+    """Finish the memory profile and write the run report, when either was requested"""
+    if memory_profile:
+        Instrumentation.add_section("memory", MemoryProfiler.finish())
+
+    if profile or memory_profile:
+        report_path = Path(paths["term_bank_folder"]) / "run_report.json"
+        report = Instrumentation.write_report(str(report_path), config.dict_name)
+        Instrumentation.print_summary(report)
+        print(f"Run report written to: {report_path}")
+        Instrumentation.disable()
+
 
 def main():
     config_path = Path(__file__).parent / "config/dictionaries.yaml"
@@ -83,6 +189,26 @@ def main():
                         help='Base directory for files')
     parser.add_argument('--list', '-l', action='store_true',
                         help='List available dictionaries and exit')
+    parser.add_argument('--profile', '-p', action='store_true',
+                        help='Time each processing stage and write a run report')
+    parser.add_argument('--profile-pages', action='store_true',
+                        help='Record per-page cost and write a slow-page report next to the term banks')
+    parser.add_argument('--memory-profile', action='store_true',
+                        help='Track memory high-water marks at stage boundaries and add them to the run report')
+    parser.add_argument('--asset-backend', choices=["auto", "inkscape", "python"], default="auto",
+                        help='Rasteriser for dictionaries with asset conversions (auto prefers inkscape)')
+    parser.add_argument('--asset-workers', type=int, default=None,
+                        help='Parallel asset conversions (defaults to the CPU count)')
+    parser.add_argument('--shard', type=str, default=None, metavar='I/N',
+                        help='Parse only shard I of N (1-based) into <dict name>.shards/ for a later --merge')
+    parser.add_argument('--merge', type=int, default=None, metavar='N',
+                        help='Merge the term banks of shards 1..N, in single-build order, and package the result')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted build from its last checkpoint instead of starting over')
+    parser.add_argument('--minify', action='store_true',
+                        help='Minify structured content (unwrap plain spans, join text, drop empty attributes) and report the bytes saved')
+    parser.add_argument('--keep-all-assets', action='store_true',
+                        help='Package every asset instead of only images referenced by the term banks (deduplicated by content)')
     
     args = parser.parse_args()
     
@@ -94,6 +220,16 @@ def main():
     
     if not args.dict and not args.all:
         parser.error("Either --dict or --all must be specified")
+    if (args.shard or args.merge) and args.all:
+        parser.error("--shard and --merge work on a single --dict")
+    if args.shard and args.merge:
+        parser.error("--shard and --merge can't be combined")
+    if args.resume and (args.repackage or args.merge):
+        parser.error("--resume only applies to parsing")
+    if args.minify and (args.repackage or args.merge):
+        parser.error("--minify only applies to parsing")
+    if (args.shard or args.resume) and args.dict and dictionary_configs[args.dict].has_audio:
+        parser.error(f"--shard and --resume can't be used for {args.dict}: its audio index is written whole at the end of the build")
     
     if args.all:
         # Process all dictionaries
@@ -102,7 +238,9 @@ def main():
                 print(f"\n{'='*60}")
                 print(f"Processing {dict_key}: {config.dict_name}")
                 print(f"{'='*60}")
-                process_dictionary(config, args.base_dir, args.repackage)
+                process_dictionary(config, args.base_dir, args.repackage, args.profile, args.profile_pages, args.memory_profile,
+                                   args.asset_backend, args.asset_workers, args.keep_all_assets, resume=args.resume,
+                                   minify=args.minify)
             except Exception as e:
                 print(f"Error processing {dict_key}: {e}")
                 import traceback
@@ -113,13 +251,17 @@ def main():
         dict_key = args.dict
         config = dictionary_configs[dict_key]
         try:
-            process_dictionary(config, args.base_dir, args.repackage)
+            process_dictionary(config, args.base_dir, args.repackage, args.profile, args.profile_pages, args.memory_profile,
+                               args.asset_backend, args.asset_workers, args.keep_all_assets,
+                               args.shard, args.merge, args.resume, args.minify)
         except Exception as e:
             print(f"Error processing {dict_key}: {e}")
             import traceback
             traceback.print_exc()
             return 1
     
+    from index import IndexRegistry
+    IndexRegistry.print_load_timings()
     print("Dictionary processing completed")
     return 0
 
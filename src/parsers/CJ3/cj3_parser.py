@@ -65,11 +65,11 @@ class CJ3Parser(YomitanParser):
         filename_without_ext = os.path.splitext(filename)[0]
 
         # Get keys from index
-        entry_keys = list(set(self.index_reader.get_keys_for_file(filename_without_ext)))
+        entry_keys = list(dict.fromkeys(self.index_reader.get_keys_for_file(filename_without_ext)))
         hanzi_keys = [k for k in entry_keys if CNUtils.is_hanzi(k)]
 
         # Parse xml
-        soup = bs4.BeautifulSoup(file_content, "xml")
+        soup = self.parse_xml(file_content)
         audio_filenames = CJ3Utils.extract_audio_links_from_headword(soup)
 
         # Handl entries without keys
@@ -1,57 +1,28 @@
 import os
 import bs4
-import jaconv
-import regex as re
 
-from core.parser_module import YomitanParser
+from core.parser_module import YomitanParser, SearchRankRule, SearchRankRules
 from config import DictionaryConfig
-from utils.lang import KanjiUtils
-from index import JukugoIndexReader
+from utils.lang import KanjiUtils, KanaUtils
+from index import IndexRegistry
 from parsers.KJT.kjt_utils import KJTUtils
 
 
+# Historical kana spellings of on'yomi (クヮ, ヰ, テフ, ...): ranked below the modern readings
+ARCHAIC_ONYOMI_PATTERNS = (
+    "クヮ", "グヮ", "クワ", "グワ", "セツヱウ", "セヅヱウ", "シツヱウ", "シヅヱウ",
+    "ヤクワン", "スヰ", "ツヰ", "ヰ", "ヱ", "クヰ", "グヰ", "シヤ",
+    "チヤ", "テフ", "テウ", "バウ", "パウ", "マウ", "ガウ", "タウ",
+)
+
+SEARCH_RANK_RULES = SearchRankRules(
+    [SearchRankRule("archaic_onyomi", -2, ARCHAIC_ONYOMI_PATTERNS)],
+    normalize=KanaUtils.hira2kata
+)
+
+
 def get_search_rank(reading: str) -> int:
-    def is_archaic_onyomi(text: str) -> bool:
-        ARCHAIC_PATTERNS = [
-            r"クヮ",
-            r"グヮ",
-            r"クワ",
-            r"グワ",
-            r"セツヱウ",
-            r"セヅヱウ",
-            r"シツヱウ",
-            r"シヅヱウ",
-            r"ヤクワン",
-            r"スヰ",
-            r"ツヰ",
-            r"ヰ",
-            r"ヱ",
-            r"クヰ",
-            r"グヰ",
-            r"シヤ",
-            r"チヤ",
-            r"テフ",
-            r"テウ",
-            r"バウ",
-            r"パウ",
-            r"マウ",
-            r"ガウ",
-            r"タウ"
-        ]
-
-        kata_reading = jaconv.hira2kata(text)
-
-        # Check against known archaic patterns
-        for pattern in ARCHAIC_PATTERNS:
-            if re.search(pattern, kata_reading):
-                return True
-
-        return False
-
-    if is_archaic_onyomi(reading):
-        return -2
-
-    return len(reading)
+    return SEARCH_RANK_RULES.get_rank(reading)
 
 
 def is_gaiji_entry(soup: bs4.BeautifulSoup) -> bool:
@@ -73,7 +44,7 @@ class KJTParser(YomitanParser):
 
     def __init__(self, config: DictionaryConfig):
         super().__init__(config)
-        self.jukugo_index_reader = JukugoIndexReader(
+        self.jukugo_index_reader = IndexRegistry.get_jukugo_index_reader(
             os.path.join(os.path.dirname(config.index_path), "jyukugo_prefix.tsv"))
 
     def _handle_busyu_entry(self, soup: bs4.BeautifulSoup) -> int:
@@ -102,12 +73,12 @@ class KJTParser(YomitanParser):
     def _process_file(self, filename: str, file_content: str) -> int:
         count = 0
         filename_without_ext = os.path.splitext(filename)[0]
-        entry_keys = list(set(self.index_reader.get_keys_for_file(filename_without_ext)))
+        entry_keys = list(dict.fromkeys(self.index_reader.get_keys_for_file(filename_without_ext)))
         kanji_keys = [k for k in entry_keys if any(KanjiUtils.is_kanji(c) for c in k)]
         reading_keys = [k for k in entry_keys if k not in kanji_keys and k != '〓']
 
         # Parse xml
-        soup = bs4.BeautifulSoup(file_content, "xml")
+        soup = self.parse_xml(file_content)
 
         if soup.find("SubItem"):
             count += self._handle_jukugo(soup, filename_without_ext)
@@ -120,7 +91,7 @@ class KJTParser(YomitanParser):
                 continue
 
             for reading in reading_keys:
-                reading = jaconv.kata2hira(reading)
+                reading = KanaUtils.kata2hira(reading)
                 search_rank = get_search_rank(reading)
                 count += self.parse_entry(kanji, reading, soup, ignore_expressions=True, search_rank=search_rank)
 
@@ -130,7 +101,7 @@ class KJTParser(YomitanParser):
                 for entry in jukugo_data:
                     for headword in entry['processed']['headwords']:
                         for reading in entry['processed']['readings']:
-                            reading = jaconv.kata2hira(reading)
+                            reading = KanaUtils.kata2hira(reading)
                             search_rank = get_search_rank(reading)
                             count += self.parse_entry(headword, reading, soup, search_rank=search_rank)
 
@@ -155,7 +126,7 @@ class KJTParser(YomitanParser):
                     if "〓" in kanji or "〓" in reading:
                         continue
 
-                    reading = jaconv.kata2hira(reading)
+                    reading = KanaUtils.kata2hira(reading)
                     search_rank = get_search_rank(reading)
                     count += self.parse_entry(kanji, reading, subitem, search_rank=search_rank,
                                               ignore_expressions=False)
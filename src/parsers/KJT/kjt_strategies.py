@@ -3,7 +3,7 @@ import os
 import regex as re
 from typing import Dict, List
 
-from utils import FileUtils
+from core.parser_module import SideTable
 from core.yomitan import create_html_element
 
 from strategies.link import DefaultLinkHandlingStrategy
@@ -12,7 +12,7 @@ from strategies.image import HashedImageStrategy
 class KJTLinkHandlingStrategy(DefaultLinkHandlingStrategy):
     
     def __init__(self):
-        self.appendix_entries = FileUtils.load_json(os.path.join(os.path.dirname(__file__), "mapping/appendix_entries.json"))
+        self.appendix_entries = SideTable.load(os.path.join(os.path.dirname(__file__), "mapping/appendix_entries.json"))
 
     @staticmethod
     def clean_link_text(text: str) -> str:
@@ -52,7 +52,10 @@ class KJTImageHandlingStrategy(HashedImageStrategy):
 
     def handle_image_element(self, html_glossary: bs4.element.Tag, html_elements: List, 
                              data_dict: Dict, class_list: List[str]) -> Dict:
-        src_path = self.get_src_path(html_glossary)
+        # The src is looked up as given and again after the path rewrites below; it is only
+        # unresolved when neither lookup finds it
+        original_path = html_glossary.get("src", "").lstrip("/")
+        src_path, found = self._lookup(original_path)
         if not src_path:
             return create_html_element("span", content=html_elements, data=data_dict)
 
@@ -63,7 +66,11 @@ class KJTImageHandlingStrategy(HashedImageStrategy):
             src_path = src_path.replace('../', '', 1)
 
         if src_path.startswith("img"):
-            src_path = self._get_normalized_filename(src_path)
+            src_path, found_rewritten = self._lookup(src_path)
+            found = found or found_rewritten
+
+        if not found:
+            self._record_unresolved(original_path)
 
         img_element = {
             "tag": "img",
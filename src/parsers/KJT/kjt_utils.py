@@ -2,7 +2,7 @@ import bs4
 import regex as re
 from typing import Optional
 
-from utils.lang import KanjiUtils
+from utils.lang import KanjiUtils, patterns
 
 class KJTUtils: 
 	
@@ -68,14 +68,7 @@ class KJTUtils:
 	@staticmethod
 	def get_all_jukugo(soup: bs4.BeautifulSoup, sub_element: str):
 		def clean_headword(headword: str):
-			headword = re.sub('【', '', headword)
-			headword = re.sub('】', '', headword)
-			headword = re.sub('〗', '', headword)
-			headword = re.sub('〖', '', headword)
-			headword = re.sub('△', '', headword)
-			headword = re.sub('［', '', headword)
-			headword = re.sub('］', '', headword)
-			return headword
+			return headword.translate(patterns.JUKUGO_HEADWORD_STRIP_TABLE)
 		
 		jukugo_data = []
 		
@@ -131,7 +131,7 @@ class KNEJParser(YomitanParser):
     def _process_file(self, filename: str, file_content: str) -> int:
         entry_count = 0
 
-        soup = bs4.BeautifulSoup(file_content, "xml")
+        soup = self.parse_xml(file_content)
         soup = KNEJParser._rename_valuable_subentries(soup)
         #soup = KNEJParser._wrap_example_elements(soup)
 
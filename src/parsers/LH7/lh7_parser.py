@@ -59,7 +59,7 @@ class LH7Parser(YomitanParser):
 
             headwords.append(''.join(texts).replace(",", "").strip())
 
-        return list(set(headwords))
+        return list(dict.fromkeys(headwords))
 
     # ----- Parsing ----- #
 
@@ -74,7 +74,7 @@ class LH7Parser(YomitanParser):
                 subitem.name = "SubVar"
                 continue
 
-            filtered_keys = list(set(ExpressionFilter.filter_substrings(entry_keys)))
+            filtered_keys = list(dict.fromkeys(ExpressionFilter.filter_substrings(entry_keys)))
             filtered_keys = [key.strip() for key in filtered_keys]
             for key in filtered_keys:
                 count += self.parse_entry(key, "", subitem, ignore_expressions=False)
@@ -85,10 +85,10 @@ class LH7Parser(YomitanParser):
     def _process_file(self, filename: str, file_content: str) -> int:
         entry_count = 0
         filename_without_ext = os.path.splitext(filename)[0]
-        entry_keys = list(set(self.index_reader.get_keys_for_file(filename_without_ext)))
+        entry_keys = list(dict.fromkeys(self.index_reader.get_keys_for_file(filename_without_ext)))
         idiom_keys = self.idiom_index_reader.get_grouped_entries_for_page(filename_without_ext) if self.idiom_index_reader else None
 
-        soup = bs4.BeautifulSoup(file_content, "xml")
+        soup = self.parse_xml(file_content)
         soup = self._preprocess_content(soup)
 
         headwords = LH7Parser.extract_text_from_headword(soup, entry_keys, "Headword")
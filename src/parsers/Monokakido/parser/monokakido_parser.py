@@ -1,7 +1,6 @@
 import os
 import re
 import bs4
-import jaconv
 from typing import List
 
 from config import DictionaryConfig
@@ -10,7 +9,7 @@ from parsers.Monokakido.utils import MonokakidoUtils
 from utils import HTMLUtils
 
 from handlers import process_unmatched_entries
-from utils.lang import ExpressionFilter, KanjiUtils
+from utils.lang import ExpressionFilter, KanjiUtils, KanaUtils
 
 
 class MonokakidoParser(YomitanParser):
@@ -30,14 +29,14 @@ class MonokakidoParser(YomitanParser):
         entry_count = 0
         filename_without_ext = os.path.splitext(filename)[0]
 
-        entry_keys = list(set(self.index_reader.get_keys_for_file(filename_without_ext)))
+        entry_keys = list(dict.fromkeys(self.index_reader.get_keys_for_file(filename_without_ext)))
         kanji_keys = list(
-            set(self.kanji_index_reader.get_keys_for_file(filename_without_ext))) if self.kanji_index_reader else None
+            dict.fromkeys(self.kanji_index_reader.get_keys_for_file(filename_without_ext))) if self.kanji_index_reader else None
         idiom_keys = self.idiom_index_reader.get_organized_entries_for_page(
             filename_without_ext) if self.idiom_index_reader else None
 
         # Parse xml
-        soup = bs4.BeautifulSoup(file_content, "xml")
+        soup = self.parse_xml(file_content)
         soup = self._preprocess_content(soup)
 
         if entry_keys:
@@ -96,7 +95,7 @@ class MonokakidoParser(YomitanParser):
                 continue
 
             for reading in reading_keys:
-                reading = jaconv.kata2hira(reading)
+                reading = KanaUtils.kata2hira(reading)
                 count += self.parse_entry(kanji, reading, soup, ignore_expressions=True)
 
         return count
@@ -126,7 +125,7 @@ class MonokakidoParser(YomitanParser):
                 print(f"Katakana found: {filtered_keys}, context: {HTMLUtils.extract_field(subitem, 'headword')}")
 
             for kanji, reading in filtered_keys:
-                count += self.parse_entry(jaconv.kata2hira(kanji), jaconv.kata2hira(reading), subitem, ignore_expressions=False)
+                count += self.parse_entry(KanaUtils.kata2hira(kanji), KanaUtils.kata2hira(reading), subitem, ignore_expressions=False)
 
         return count
 
@@ -135,8 +134,8 @@ class MonokakidoParser(YomitanParser):
         count = 0
 
         entry = idiom_keys.get(list(idiom_keys.keys())[0])
-        kanji_forms = [jaconv.kata2hira(k) for k in entry['kanji']]
-        reading_forms = [jaconv.kata2hira(r) for r in entry['readings']]
+        kanji_forms = [KanaUtils.kata2hira(k) for k in entry['kanji']]
+        reading_forms = [KanaUtils.kata2hira(r) for r in entry['readings']]
 
         filtered_keys = ExpressionFilter.filter_full_forms(kanji_forms, reading_forms)
         if not filtered_keys:
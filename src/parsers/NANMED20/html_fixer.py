@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Text fix-up stage for NANMED20 entry HTML, run between extraction and parsing.
+
+    python -m parsers.NANMED20.html_fixer dictionary_raw.jsonl ../resources/NANMED20/pages/dictionary.jsonl
+
+With fix_html set in the dictionary config (as for NANMED20), main.py runs the stage itself
+before parsing: every dump in resources/NANMED20/raw is fixed into resources/NANMED20/pages.
+
+Every entry is parsed once into an lxml tree. A single walk records each text node's offset
+in the entry's linear text, so the context around a punctuation mark is a string slice instead
+of a walk over neighbouring nodes, and both fix-up passes are applied during one more walk.
+Entries are fixed on a process pool in bounded windows, and fixed HTML is cached on disk by
+content hash so unchanged entries are skipped when the stage is rerun.
+"""
+import os
+import sys
+import json
+import sqlite3
+import hashlib
+import argparse
+import multiprocessing
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import regex as re
+import lxml.html
+from lxml import etree
+from tqdm import tqdm
+
+# Bump when the fixes change, so cached output from older rules is not reused
+FIXER_VERSION = 1
+CACHE_PATH = Path(__file__).parent.parent.parent.parent / "resources" / "cache" / "nanmed20_fixes.sqlite"
+
+FULLWIDTH_SPACE = '　'
+NORMAL_SPACE = ' '
+
+SKIP_TAGS = {'a', 'script', 'style', 'code'}
+SKIP_CLASSES = {'imageMark'}
+CONTEXT_LENGTH = 50
+
+PUNCTUATION_MAP = {
+    '.': '。',
+    ',': '、',
+    '!': '！',
+    '?': '？',
+    ':': '：',
+    '，': '、',
+    '．': '。'
+}
+
+OPEN_PUNCT_MAP = {
+    '(': '（',
+    '[': '［',
+    '{': '｛',
+    '"': '「',
+    "'": '「',
+}
+
+CLOSE_PUNCT_MAP = {
+    ')': '）',
+    ']': '］',
+    '}': '｝',
+    '"': '」',
+    "'": '」',
+}
+
+JAPANESE_CHARS = r'[\p{Script=Hiragana}\p{Script=Katakana}\p{Script=Han}ー]'
+JAPANESE_CHARS_REGEX = re.compile(JAPANESE_CHARS)
+LATIN_CHARS = re.compile(r'\p{Latin}[\p{Latin}\d\s\-\']*')
+
+PUNCT_FIX_REGEX = re.compile(
+    fr'(?<={JAPANESE_CHARS})([.,!?:，．！？：])|([.,!?:，．！？：])(?={JAPANESE_CHARS})'
+)
+
+JAPANESE_PUNCT = r'[。、！？：；]'
+JP_PUNCT_SPACE_REGEX = re.compile(fr'({JAPANESE_PUNCT}){FULLWIDTH_SPACE}')
+SINGLE_PUNCT_REGEX = re.compile(r'^[.,!?:，．！？：]$')
+
+escaped_open = re.escape('([{{"\'')
+escaped_close = re.escape(')]}}"\'')
+OPEN_PUNCT_REGEX = re.compile(fr'([{escaped_open}])(?={JAPANESE_CHARS})')
+CLOSE_PUNCT_REGEX = re.compile(fr'(?<={JAPANESE_CHARS})([{escaped_close}])')
+
+TRAILING_JP_WHITESPACE_REGEX = re.compile(fr'{FULLWIDTH_SPACE}+$')
+CONSECUTIVE_JP_WHITESPACE_REGEX = re.compile(fr'{FULLWIDTH_SPACE}{{2,}}')
+LATIN_FULLWIDTH_SPACE_REGEX = re.compile(r'(?<=\p{Latin})　(?=\p{Latin})')
+LATIN_FULLWIDTH_HYPHEN_REGEX = re.compile(r'(?<=\p{Latin})－(?=\p{Latin})')
+
+ENTITY_REGEX = re.compile(r'&([a-zA-Z0-9#]+);')
+PLACEHOLDER_REGEX = re.compile(r'__ENTITY_(\d+)__')
+ROMAN_NUMERAL_ENTITY_REGEX = re.compile(r'&((?:I|V|X){1,4})(?:_w)?;')
+ROMAN_NUMERALS = {
+    'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X',
+    'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII', 'XIX', 'XX'
+}
+
+
+def replace_roman_numeral_entities(html_content: str) -> str:
+    """Replace Roman numeral entities with properly formatted spans."""
+    def replacement(match):
+        roman_numeral = match.group(1)
+        if roman_numeral in ROMAN_NUMERALS:
+            return f'<span class="roman_numeral">{roman_numeral}</span>'
+        return match.group(0)
+
+    return ROMAN_NUMERAL_ENTITY_REGEX.sub(replacement, html_content)
+
+
+def fix_spaces_in_latin(text: str) -> str:
+    text = LATIN_FULLWIDTH_SPACE_REGEX.sub(NORMAL_SPACE, text)
+    return LATIN_FULLWIDTH_HYPHEN_REGEX.sub('-', text)
+
+
+def fix_punctuation(text: str) -> str:
+    return PUNCT_FIX_REGEX.sub(
+        lambda m: PUNCTUATION_MAP.get(m.group(1) or m.group(2), m.group(0)), text
+    )
+
+
+def fix_japanese_whitespace(text: str) -> str:
+    text = TRAILING_JP_WHITESPACE_REGEX.sub('', text)
+    text = CONSECUTIVE_JP_WHITESPACE_REGEX.sub(FULLWIDTH_SPACE, text)
+    return JP_PUNCT_SPACE_REGEX.sub(r'\1', text)
+
+
+def fix_punctuation_and_par(text: str) -> str:
+    text = fix_punctuation(text)
+    text = OPEN_PUNCT_REGEX.sub(lambda m: OPEN_PUNCT_MAP[m.group(1)], text)
+    return CLOSE_PUNCT_REGEX.sub(lambda m: CLOSE_PUNCT_MAP[m.group(1)], text)
+
+
+def process_text_node(text: str) -> str:
+    """Process a text node, fixing spaces and punctuation."""
+    if not text:
+        return text
+
+    text = fix_punctuation(text)
+    text = fix_spaces_in_latin(text)
+    return fix_japanese_whitespace(text)
+
+
+def should_skip_element(el) -> bool:
+    if not isinstance(el.tag, str) or el.tag in SKIP_TAGS:
+        return True
+    classes = (el.get('class') or '').split()
+    return any(cls in SKIP_CLASSES for cls in classes)
+
+
+def should_use_japanese_punctuation(prev_text: str, next_text: str) -> bool:
+    # Japanese on both sides, or more Japanese than Latin overall
+    prev_has_japanese = JAPANESE_CHARS_REGEX.search(prev_text) is not None
+    next_has_japanese = JAPANESE_CHARS_REGEX.search(next_text) is not None
+    if prev_has_japanese and next_has_japanese:
+        return True
+
+    context = prev_text + next_text
+    return len(JAPANESE_CHARS_REGEX.findall(context)) > len(LATIN_CHARS.findall(context))
+
+
+class TextOffsetMap:
+    """
+    The text nodes of a tree in document order, with each node's start offset in the
+    concatenated text and each element's [start, end) span, built in one walk.
+    """
+
+    def __init__(self, root):
+        # (element, "text" | "tail", start offset); a tail belongs to the element's parent
+        self.nodes: List[Tuple[object, str, int]] = []
+        self.spans: Dict[object, Tuple[int, int]] = {}
+        parts = []
+        offset = 0
+
+        stack = [(root, False)]
+        while stack:
+            el, closing = stack.pop()
+            if closing:
+                self.spans[el] = (self.spans[el][0], offset)
+                if el is not root and el.tail:
+                    self.nodes.append((el, "tail", offset))
+                    parts.append(el.tail)
+                    offset += len(el.tail)
+                continue
+
+            self.spans[el] = (offset, offset)
+            # Comment and processing-instruction content isn't document text
+            if isinstance(el.tag, str) and el.text:
+                self.nodes.append((el, "text", offset))
+                parts.append(el.text)
+                offset += len(el.text)
+
+            stack.append((el, True))
+            for child in reversed(el):
+                stack.append((child, False))
+
+        self.text = "".join(parts)
+
+    def context(self, start: int, end: int) -> Tuple[str, str]:
+        return self.text[max(0, start - CONTEXT_LENGTH):start], self.text[end:end + CONTEXT_LENGTH]
+
+
+def process_html_content(html_content: str) -> Tuple[str, bool]:
+    """Fix one entry's HTML; returns (fixed html, whether anything changed)"""
+    html_content = replace_roman_numeral_entities(html_content)
+
+    # Keep &name; entities out of the parser's hands and restore them afterwards
+    entities = []
+
+    def to_placeholder(match):
+        entities.append(match.group(0))
+        return f"__ENTITY_{len(entities) - 1}__"
+
+    modified_content = ENTITY_REGEX.sub(to_placeholder, html_content)
+    root = lxml.html.fragment_fromstring(modified_content, create_parent="div")
+    offsets = TextOffsetMap(root)
+    changes_made = False
+
+    # Isolated punctuation: one-character <span lang="ja"> elements and lone punctuation text nodes
+    isolated = {}
+    for span in root.iter("span"):
+        if span.get("lang") != "ja" or should_skip_element(span) or len(span):
+            continue
+        text = (span.text or "").strip()
+        if len(text) == 1 and text in PUNCTUATION_MAP:
+            start, end = offsets.spans[span]
+            if should_use_japanese_punctuation(*offsets.context(start, end)):
+                isolated[(span, "text")] = PUNCTUATION_MAP[text]
+
+    for el, kind, start in offsets.nodes:
+        value = el.text if kind == "text" else el.tail
+        parent = el if kind == "text" else el.getparent()
+        if (el, kind) in isolated or parent is None or should_skip_element(parent):
+            continue
+        punct = value.strip()
+        if SINGLE_PUNCT_REGEX.match(value) and punct in PUNCTUATION_MAP:
+            if should_use_japanese_punctuation(*offsets.context(start, start + len(value))):
+                isolated[(el, kind)] = PUNCTUATION_MAP[punct]
+
+    # Apply the isolated replacements and the general text fixes in one walk
+    for el, kind, _ in offsets.nodes:
+        original = el.text if kind == "text" else el.tail
+        value = isolated.get((el, kind), original)
+
+        parent = el if kind == "text" else el.getparent()
+        if parent is not None and not should_skip_element(parent):
+            value = process_text_node(value)
+
+        if value != original:
+            changes_made = True
+            if kind == "text":
+                el.text = value
+            else:
+                el.tail = value
+
+    if not changes_made:
+        return html_content, False
+
+    serialized = lxml.html.tostring(root, encoding="unicode")
+    # Drop the wrapper <div> added by fragment_fromstring
+    processed_html = serialized[len("<div>"):-len("</div>")]
+    final_html = PLACEHOLDER_REGEX.sub(lambda m: entities[int(m.group(1))], processed_html)
+    return final_html, True
+
+
+def _fix_entry(html: str) -> Tuple[str, bool]:
+    try:
+        return process_html_content(html)
+    except (etree.ParserError, ValueError):
+        # Empty or unparseable fragments are passed through unchanged
+        return html, False
+
+
+class FixCache:
+    """Fixed HTML keyed by the SHA-256 of the input and the fixer version, stored in SQLite"""
+
+    def __init__(self, path: Optional[str]):
+        self.conn = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self.conn = sqlite3.connect(path)
+            self.conn.execute("CREATE TABLE IF NOT EXISTS fixes (hash TEXT PRIMARY KEY, html TEXT, changed INTEGER)")
+
+    @staticmethod
+    def key(html: str) -> str:
+        return hashlib.sha256(f"{FIXER_VERSION}\0{html}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[str, bool]]:
+        if self.conn is None or not keys:
+            return {}
+        found = {}
+        # SQLite limits the number of bound parameters per statement
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            query = f"SELECT hash, html, changed FROM fixes WHERE hash IN ({','.join('?' * len(chunk))})"
+            for key, html, changed in self.conn.execute(query, chunk):
+                found[key] = (html, bool(changed))
+        return found
+
+    def put_many(self, rows: List[Tuple[str, str, bool]]) -> None:
+        if self.conn is None or not rows:
+            return
+        self.conn.executemany("INSERT OR REPLACE INTO fixes VALUES (?, ?, ?)", rows)
+        self.conn.commit()
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+
+
+def fix_entries(entries: Iterable[Tuple[str, str]], workers: Optional[int] = None,
+                cache_path: Optional[str] = str(CACHE_PATH), window: int = 2000,
+                stats: Optional[Dict[str, int]] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Fix a stream of (key, html) pairs, preserving order. Entries are handled in windows so
+    only `window` entries are in flight; cache hits never reach the worker pool.
+    """
+    stats = stats if stats is not None else {}
+    stats.update({"entries": 0, "changed": 0, "cached": 0})
+    cache = FixCache(cache_path)
+    workers = workers or os.cpu_count() or 1
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+
+    def flush(batch: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        keys = [FixCache.key(html) for _, html in batch]
+        cached = cache.get_many(keys)
+        misses = [i for i, key in enumerate(keys) if key not in cached]
+
+        inputs = [batch[i][1] for i in misses]
+        results = pool.map(_fix_entry, inputs, chunksize=64) if pool else [_fix_entry(html) for html in inputs]
+        for i, result in zip(misses, results):
+            cached[keys[i]] = result
+        cache.put_many([(keys[i], html, changed) for i, (html, changed) in zip(misses, results)])
+
+        stats["entries"] += len(batch)
+        stats["cached"] += len(batch) - len(misses)
+        fixed = []
+        for (key, _), entry_hash in zip(batch, keys):
+            html, changed = cached[entry_hash]
+            stats["changed"] += changed
+            fixed.append((key, html))
+        return fixed
+
+    try:
+        batch = []
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) >= window:
+                yield from flush(batch)
+                batch = []
+        if batch:
+            yield from flush(batch)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        cache.close()
+
+
+def iter_source(input_path: str) -> Iterator[Tuple[str, str]]:
+    """Entries of a JSON-lines file or a {"key": "html"} dump, streamed"""
+    from core.mdx_json_iterator import MdxJsonIterator
+
+    if input_path.lower().endswith(".jsonl"):
+        return MdxJsonIterator.iter_lines(input_path)
+    return MdxJsonIterator.iter_object_items(input_path)
+
+
+def fix_file(input_path: str, output_path: str, workers: Optional[int] = None,
+             cache_path: Optional[str] = str(CACHE_PATH)) -> Dict[str, int]:
+    """Fix one dump into a JSON-lines file; returns the entry, changed and cached counts"""
+    stats = {}
+    total = sum(1 for _ in iter_source(input_path))
+    # Per process, so shards fixing the same source don't write over each other's temp file
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+
+    with open(tmp_path, 'w', encoding='utf-8') as out, \
+            tqdm(total=total, desc="本文修正", unit="項目", ascii="░▒█") as pbar:
+        for key, html in fix_entries(iter_source(input_path), workers, cache_path, stats=stats):
+            out.write(json.dumps([key, html], ensure_ascii=False) + "\n")
+            pbar.update(1)
+    os.replace(tmp_path, output_path)
+    return stats
+
+
+def fix_directory(input_dir: str, output_dir: str, workers: Optional[int] = None,
+                  cache_path: Optional[str] = str(CACHE_PATH)) -> Dict[str, int]:
+    """Fix every .json/.jsonl dump in input_dir into a .jsonl of the same name in output_dir"""
+    totals = {"entries": 0, "changed": 0, "cached": 0}
+    for filename in sorted(os.listdir(input_dir)):
+        if not filename.lower().endswith(('.json', '.jsonl')):
+            continue
+        output_path = os.path.join(output_dir, Path(filename).stem + ".jsonl")
+        stats = fix_file(os.path.join(input_dir, filename), output_path, workers, cache_path)
+        for name in totals:
+            totals[name] += stats[name]
+    return totals
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Fix NANMED20 entry text formatting')
+    parser.add_argument('input_file', nargs='?', help='Input dictionary (.jsonl or {key: html} .json)')
+    parser.add_argument('output_file', nargs='?', help='Output JSON-lines file')
+    parser.add_argument('--workers', '-w', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the fix cache')
+    parser.add_argument('--test', '-t', help='Test a piece of text instead of processing files')
+    args = parser.parse_args()
+
+    if args.test:
+        print(f"Input:  {args.test}")
+        print(f"Output: {process_text_node(args.test)}")
+        return 0
+
+    if not args.input_file or not args.output_file:
+        parser.error("input_file and output_file are required")
+
+    stats = fix_file(args.input_file, args.output_file, args.workers, None if args.no_cache else str(CACHE_PATH))
+    print(f"{stats['entries']:,}項目を処理しました (修正 {stats['changed']:,}件, キャッシュ利用 {stats['cached']:,}件)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
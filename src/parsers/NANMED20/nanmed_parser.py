@@ -1,10 +1,8 @@
 import bs4
-import jaconv
 import regex as re
 from typing import List
 
-from utils import FileUtils
-from utils.lang import KanjiUtils
+from utils.lang import KanjiUtils, KanaUtils
 from core.parser_module import YomitanParser
 from config import DictionaryConfig
 
@@ -13,7 +11,6 @@ class NanmedParser(YomitanParser):
     def __init__(self, config: DictionaryConfig):
         super().__init__(config)
         
-        self.dict_data = FileUtils.load_mdx_json(config.dict_path)
         self.parentheses = {'(', ')', '（', '）'}
         self.parentheses_ignored = {
             "細菌", "関節", "角膜", "器具", "歯科インプラント", "硫酸", "塩素", "塩酸", "ニコチン酸", "リン酸",
@@ -30,9 +27,10 @@ class NanmedParser(YomitanParser):
 
 
     def _process_file(self, filename: str, file_content: str) -> int:
+        # Entries are streamed from the MDX dump: filename is the entry key, file_content its html
         local_count = 0
         entry_keys = NanmedParser.extract_entry_keys(filename)
-        soup = bs4.BeautifulSoup(file_content, "lxml")
+        soup = self.parse_xml(file_content, "lxml")
         
         if any(any(p in key for p in self.parentheses) for key in entry_keys):   
             if len(entry_keys) == 1:
@@ -76,11 +74,11 @@ class NanmedParser(YomitanParser):
                             kanji_form = inside_paren_match.group(1)
                             # Add entry with kanji as headword and kana as reading
                             if all(KanjiUtils.is_kanji(c) for c in kanji_form):
-                                before_paren = jaconv.kata2hira(before_paren)
+                                before_paren = KanaUtils.kata2hira(before_paren)
                             elif any(KanjiUtils.is_katakana(c) for c in kanji_form):
-                                before_paren = jaconv.hira2kata(before_paren)
+                                before_paren = KanaUtils.hira2kata(before_paren)
                             else:
-                                before_paren = jaconv.kata2hira(before_paren)
+                                before_paren = KanaUtils.kata2hira(before_paren)
                             
                             local_count += self.parse_entry(kanji_form, before_paren, soup)
                 
@@ -88,11 +86,11 @@ class NanmedParser(YomitanParser):
                 clean_headword = re.sub(r'（[^）]+）', '', headword)
                 if not any(KanjiUtils.is_kanji(c) for c in reading):
                     if all(KanjiUtils.is_kanji(c) for c in clean_headword):
-                        reading = jaconv.kata2hira(reading)
+                        reading = KanaUtils.kata2hira(reading)
                     elif any(KanjiUtils.is_katakana(c) for c in clean_headword):
-                        reading = jaconv.hira2kata(reading)
+                        reading = KanaUtils.hira2kata(reading)
                     else:
-                        reading = jaconv.kata2hira(reading)
+                        reading = KanaUtils.kata2hira(reading)
                         
                     local_count += self.parse_entry(clean_headword, reading, soup)
                 else:
@@ -109,11 +107,11 @@ class NanmedParser(YomitanParser):
                 reading = entry_keys[1]
                 if not any(KanjiUtils.is_kanji(c) for c in reading):
                     if all(KanjiUtils.is_kanji(c) for c in headword):
-                        reading = jaconv.kata2hira(reading)
+                        reading = KanaUtils.kata2hira(reading)
                     elif any(KanjiUtils.is_katakana(c) for c in headword):
-                        reading = jaconv.hira2kata(reading)
+                        reading = KanaUtils.hira2kata(reading)
                     else:
-                        reading = jaconv.kata2hira(reading)
+                        reading = KanaUtils.kata2hira(reading)
                         
                     local_count += self.parse_entry(headword, reading, soup)
                 else:
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Streaming extractor for the NANMED20 SQLite database.
+
+    python -m parsers.NANMED20.sql_extractor -i nanmed.db -o ../resources/NANMED20/raw/dictionary.jsonl
+    python -m parsers.NANMED20.sql_extractor -i nanmed.db --analyze
+
+Each table's columns are classified once from a sampled scan, then the table is read in a
+single pass with fetchmany and every entry is written out as soon as it is read, so memory
+stays flat however large the database is (only the set of emitted keys grows, for duplicate
+handling). The output is a JSON-lines file of ["key", "html"] pairs (or, with --format json,
+a {"key": "html"} object) that the "mdx_json" source type reads directly. NANMED20's output
+goes in resources/NANMED20/raw, from where the html_fixer stage writes the fixed pages.
+"""
+import os
+import sys
+import json
+import time
+import sqlite3
+import argparse
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from tqdm import tqdm
+
+KEY_NAME_PATTERNS = ("midashi", "term", "word", "title")
+CONTENT_NAME_PATTERNS = ("content", "html", "text")
+READING_NAME_PATTERNS = ("kana", "yomi", "reading")
+CSS_PATTERNS = ("{", "px", "em", "rem", "#", "rgb", "@media", "@font-face", "url(")
+CSS_TABLE_PATTERNS = ("css", "style", "theme", "format", "layout")
+
+bar_format = "「{desc}: {bar:30}」{percentage:3.0f}% | {n_fmt}/{total_fmt} {unit} [経過: {elapsed} | 残り: {remaining}]"
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class NanmedSqlExtractor:
+
+    def __init__(self, db_path: str, separator: str = "|", sample_size: int = 200, batch_size: int = 1000):
+        if not os.path.isfile(db_path):
+            raise FileNotFoundError(f"Database not found: {db_path}")
+
+        self.db_path = db_path
+        self.separator = separator
+        self.sample_size = sample_size
+        self.batch_size = batch_size
+        # Read-only, so a half-written output can never touch the source database
+        self.conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        self._profiles: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+    def get_tables(self) -> List[str]:
+        return [row[0] for row in self.conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+
+
+    def profile_table(self, table: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Classify every column of a table from one sampled scan: the share of text values,
+        of values that look like HTML, of values with CSS-like patterns, and the mean length.
+        """
+        if table in self._profiles:
+            return self._profiles[table]
+
+        columns = [(row[1], row[2]) for row in self.conn.execute(f"PRAGMA table_info({quote_identifier(table)})")]
+        profiles = {
+            name: {"declared_type": declared_type, "text": 0, "html": 0, "css": 0, "length": 0, "sampled": 0}
+            for name, declared_type in columns
+        }
+
+        cursor = self.conn.execute(f"SELECT * FROM {quote_identifier(table)} LIMIT ?", (self.sample_size,))
+        for row in cursor:
+            for (name, _), value in zip(columns, row):
+                stats = profiles[name]
+                stats["sampled"] += 1
+                if isinstance(value, str):
+                    stats["text"] += 1
+                    stats["length"] += len(value)
+                    if "<" in value and ">" in value:
+                        stats["html"] += 1
+                    if any(pattern in value for pattern in CSS_PATTERNS):
+                        stats["css"] += 1
+
+        for stats in profiles.values():
+            sampled = stats.pop("sampled") or 1
+            stats["text_ratio"] = round(stats.pop("text") / sampled, 3)
+            stats["html_ratio"] = round(stats.pop("html") / sampled, 3)
+            stats["css_ratio"] = round(stats.pop("css") / sampled, 3)
+            stats["mean_length"] = round(stats.pop("length") / sampled, 1)
+
+        self._profiles[table] = profiles
+        return profiles
+
+
+    def choose_columns(self, table: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Pick the (key, content, reading) columns of a table from its profile"""
+        profiles = self.profile_table(table)
+        columns = list(profiles)
+
+        key_col = "f_midashi" if "f_midashi" in profiles else None
+        content_col = "f_contents" if "f_contents" in profiles else None
+        reading_col = "f_midashi_kana" if "f_midashi_kana" in profiles else None
+
+        if not key_col:
+            for col in columns:
+                lower = col.lower()
+                if "midashi" in lower and "kana" not in lower and "prev" not in lower and "next" not in lower:
+                    key_col = col
+                    break
+
+        if not content_col:
+            candidates = [
+                col for col in columns
+                if any(p in col.lower() for p in CONTENT_NAME_PATTERNS) and profiles[col]["html_ratio"] > 0
+            ]
+            if candidates:
+                content_col = max(candidates, key=lambda col: profiles[col]["html_ratio"])
+
+        if not reading_col and not key_col:
+            for col in columns:
+                if any(p in col.lower() for p in READING_NAME_PATTERNS):
+                    reading_col = col
+                    break
+
+        return key_col, content_col, reading_col
+
+
+    def get_content_tables(self) -> List[str]:
+        tables = self.get_tables()
+        content_tables = []
+
+        for table in tables:
+            columns = [col.lower() for col in self.profile_table(table)]
+            has_content = any(p in col for col in columns for p in CONTENT_NAME_PATTERNS)
+            has_key = any(p in col for col in columns for p in KEY_NAME_PATTERNS)
+            if (has_content and has_key) or table.startswith(("t_contents", "t_dic")) or "dictionary" in table.lower():
+                content_tables.append(table)
+
+        if not content_tables:
+            print("警告: 辞書テーブルが見つからないため、すべてのテーブルを試します")
+            content_tables = tables
+
+        return content_tables
+
+
+    def iter_table_entries(self, table: str, limit: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+        """Stream (key, html) pairs from one table with fetchmany"""
+        key_col, content_col, reading_col = self.choose_columns(table)
+        if not key_col or not content_col:
+            print(f"  {table}をスキップします: 見出し列と本文列を特定できません")
+            return
+
+        selected = [key_col, content_col] + ([reading_col] if reading_col else [])
+        query = f"SELECT {', '.join(quote_identifier(col) for col in selected)} FROM {quote_identifier(table)}"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+
+        cursor = self.conn.execute(query)
+        while True:
+            rows = cursor.fetchmany(self.batch_size)
+            if not rows:
+                break
+
+            for row in rows:
+                term, html = row[0], row[1]
+                reading = row[2] if reading_col else None
+                if not term or not html:
+                    yield None, None
+                    continue
+
+                if reading and reading != term:
+                    yield f"{term}{self.separator}{reading}", html
+                else:
+                    yield term, html
+
+
+    def extract(self, output_path: str, output_format: str = "jsonl", limit: Optional[int] = None) -> Dict[str, Any]:
+        """Write every entry to output_path as it is read; returns extraction statistics"""
+        start_time = time.perf_counter()
+        tables = self.get_content_tables()
+        seen_keys = set()
+        stats = {"tables": {}, "entries": 0, "skipped": 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        tmp_path = output_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            if output_format == "json":
+                out.write("{")
+
+            for table in tables:
+                row_count = self.conn.execute(f"SELECT COUNT(*) FROM {quote_identifier(table)}").fetchone()[0]
+                if limit:
+                    row_count = min(row_count, limit)
+
+                processed = 0
+                skipped = 0
+                with tqdm(total=row_count, desc=table, unit="項目", bar_format=bar_format, ascii="░▒█") as pbar:
+                    for key, html in self.iter_table_entries(table, limit):
+                        pbar.update(1)
+                        if key is None:
+                            skipped += 1
+                            continue
+
+                        # Duplicate keys get a numeric suffix, as in the original dump
+                        if key in seen_keys:
+                            counter = 1
+                            while f"{key}_{counter}" in seen_keys:
+                                counter += 1
+                            key = f"{key}_{counter}"
+                        seen_keys.add(key)
+
+                        if output_format == "json":
+                            out.write(("," if stats["entries"] or processed else "") + "\n")
+                            out.write(json.dumps(key, ensure_ascii=False) + ": " + json.dumps(html, ensure_ascii=False))
+                        else:
+                            out.write(json.dumps([key, html], ensure_ascii=False) + "\n")
+                        processed += 1
+
+                stats["tables"][table] = {"entries": processed, "skipped": skipped}
+                stats["entries"] += processed
+                stats["skipped"] += skipped
+
+            if output_format == "json":
+                out.write("\n}\n")
+
+        os.replace(tmp_path, output_path)
+
+        elapsed = time.perf_counter() - start_time
+        stats["seconds"] = round(elapsed, 2)
+        stats["entries_per_second"] = round(stats["entries"] / elapsed, 1) if elapsed else 0.0
+        stats["output_mb"] = round(os.path.getsize(output_path) / (1 << 20), 2)
+        return stats
+
+
+    def analyze(self) -> None:
+        """Print the structure of every table from the sampled profiles (no full-table pattern queries)"""
+        tables = self.get_tables()
+        print(f"データベース: {self.db_path} ({os.path.getsize(self.db_path) / (1 << 20):.2f} MB)")
+        print(f"{len(tables)}テーブル: {', '.join(tables)}")
+
+        table_columns = {}
+        for table in tables:
+            profiles = self.profile_table(table)
+            table_columns[table] = set(profiles)
+            row_count = self.conn.execute(f"SELECT COUNT(*) FROM {quote_identifier(table)}").fetchone()[0]
+            key_col, content_col, reading_col = self.choose_columns(table)
+
+            print(f"\n{table}: {row_count:,}行")
+            print(f"  見出し列: {key_col or '-'} / 本文列: {content_col or '-'} / 読み列: {reading_col or '-'}")
+            for name, stats in profiles.items():
+                flags = []
+                if stats["html_ratio"]:
+                    flags.append(f"HTML {stats['html_ratio']:.0%}")
+                if stats["css_ratio"]:
+                    flags.append(f"CSS風 {stats['css_ratio']:.0%}")
+                print(f"  {name} ({stats['declared_type'] or '?'}): テキスト {stats['text_ratio']:.0%}, "
+                      f"平均長 {stats['mean_length']}" + (f", {', '.join(flags)}" if flags else ""))
+
+            if any(p in table.lower() for p in CSS_TABLE_PATTERNS):
+                print("  スタイル関連のテーブル名です")
+
+        print("\nテーブル間の関連候補:")
+        for table1, columns1 in table_columns.items():
+            for col in columns1:
+                if "id" not in col.lower() and "key" not in col.lower():
+                    continue
+                for table2, columns2 in table_columns.items():
+                    if table1 != table2 and col in columns2:
+                        print(f"  {table1}.{col} -> {table2}.{col}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stream NANMED20 entries out of its SQLite database")
+    parser.add_argument("--input", "-i", required=True, help="Path to the SQLite database file")
+    parser.add_argument("--output", "-o", default="dictionary.jsonl", help="Output path (put it in resources/NANMED20/raw)")
+    parser.add_argument("--format", "-f", choices=["jsonl", "json"], default="jsonl",
+                        help="jsonl: one [key, html] per line; json: a single {key: html} object")
+    parser.add_argument("--separator", "-s", default="|", help="Separator for term and reading (default: |)")
+    parser.add_argument("--analyze", "-a", action="store_true", help="Only analyze the database structure")
+    parser.add_argument("--limit", "-l", type=int, help="Limit entries per table (for testing)")
+    parser.add_argument("--sample-size", type=int, default=200, help="Rows sampled per table to classify columns")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows fetched per fetchmany call")
+    args = parser.parse_args()
+
+    extractor = NanmedSqlExtractor(args.input, args.separator, args.sample_size, args.batch_size)
+    try:
+        if args.analyze:
+            extractor.analyze()
+            return 0
+
+        stats = extractor.extract(args.output, args.format, args.limit)
+    finally:
+        extractor.close()
+
+    if not stats["entries"]:
+        print("エラー: 項目を抽出できませんでした。--analyze でデータベースの構造を確認してください")
+        return 1
+
+    print(f"\n{stats['entries']:,}項目を抽出しました ({stats['skipped']}件スキップ, {stats['output_mb']:.2f} MB, "
+          f"{stats['seconds']:.1f}秒, {stats['entries_per_second']:.0f}項目/秒)")
+    print(f"出力先: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
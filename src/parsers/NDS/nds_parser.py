@@ -9,14 +9,14 @@ from parsers.NDS.nds_utils import NDSUtils
 from parsers.KJT.kjt_utils import KJTUtils
 from config import DictionaryConfig
 from handlers import process_unmatched_entries
-from index import JukugoIndexReader
+from index import IndexRegistry
 
 
 class NDSParser(YomitanParser):
 
     def __init__(self, config: DictionaryConfig):
         super().__init__(config)
-        self.subitem_index_reader = JukugoIndexReader(os.path.join(os.path.dirname(config.index_path), "idiom_prefix.tsv"))
+        self.subitem_index_reader = IndexRegistry.get_jukugo_index_reader(os.path.join(os.path.dirname(config.index_path), "idiom_prefix.tsv"))
 
 
     def _process_file(self, filename: str, xml: str):
@@ -24,13 +24,13 @@ class NDSParser(YomitanParser):
         filename_without_ext = os.path.splitext(filename)[0]
 
         # Get keys from index
-        entry_keys = list(set(self.index_reader.get_keys_for_file(filename_without_ext)))
+        entry_keys = list(dict.fromkeys(self.index_reader.get_keys_for_file(filename_without_ext)))
 
         if not entry_keys:
             print(f"No entry keys for entry: {filename_without_ext}")
 
         # Parse xml
-        soup = bs4.BeautifulSoup(xml, "xml")
+        soup = self.parse_xml(xml)
 
         if soup.find("子項目"):
             count += self._handle_subitems(soup, filename_without_ext)
@@ -4,9 +4,9 @@ import bs4
 from pathlib import Path
 from typing import Optional
 
-from utils import KanjiUtils
+from utils.lang import KanjiUtils
 
-from core.parser_module import YomitanParser
+from core.parser_module import YomitanParser, SideTable
 from config import DictionaryConfig
 from handlers import AudioHandler, process_unmatched_entries
 from parsers.OZK5.ozk5_utils import OZK5Utils
@@ -19,6 +19,7 @@ class OZK5Parser(YomitanParser):
         # List to store 和歌 entries (I add the head word manually for these 269 entries)
         self.waka_entries = {"entries": [], "reading_index": {}}
         self.waka_path =  Path(config.index_path).parent / "waka_entries.json"
+        self.waka_table: Optional[SideTable] = None
         self.audio_handler = AudioHandler(config.dict_name, config.audio_path)
             
             
@@ -34,7 +35,7 @@ class OZK5Parser(YomitanParser):
             return local_count
         
         # Parse xml
-        soup = bs4.BeautifulSoup(xml, "xml") 
+        soup = self.parse_xml(xml) 
         
         # Skip appendix entries
         if soup.find("付録タイトル") or soup.find("付録見出"):     
@@ -92,12 +93,9 @@ class OZK5Parser(YomitanParser):
     def _handle_waka_entry(self, soup: bs4.BeautifulSoup, reading: str,
                            filename: str, audio_filename: str):
         count = 0
-        with open(self.waka_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            
-        waka_index = data["reading_index"][reading]
-        head_word = data["entries"][waka_index]["head_word"]
-        waka_filename = data["entries"][waka_index]["file"]
+        waka_entry = self._get_waka_table()[reading]
+        head_word = waka_entry["head_word"]
+        waka_filename = waka_entry["file"]
         
         if waka_filename == filename:
             if head_word:
@@ -111,6 +109,19 @@ class OZK5Parser(YomitanParser):
         return count
     
     
+    def _get_waka_table(self) -> SideTable:
+        # Loaded on the first 和歌 page so exporting a fresh waka_entries.json doesn't need an existing one
+        if self.waka_table is None:
+            self.waka_table = SideTable.load(
+                self.waka_path,
+                required_keys=("entries", "reading_index"),
+                build_index=lambda data: {
+                    reading: data["entries"][index] for reading, index in data["reading_index"].items()
+                }
+            )
+        return self.waka_table
+    
+    
     def _save_waka_entry(self, soup: bs4.BeautifulSoup, reading: str, filename: str):
         entry_index = len(self.waka_entries["entries"])
         
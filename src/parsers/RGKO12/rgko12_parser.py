@@ -1,10 +1,10 @@
 import os
 import bs4
-import re
 from typing import List, Tuple
 
 from parsers.Monokakido.parser import MonokakidoParser
 from config import DictionaryConfig
+from utils.lang import patterns
 
 
 class RGKO12Parser(MonokakidoParser):
@@ -28,20 +28,7 @@ class RGKO12Parser(MonokakidoParser):
 
     @staticmethod
     def get_tsukaiwake_entries(index_str: str) -> List[Tuple[str, str]]:
-        EXCLUDE_PATTERNS = [
-            r'\{RB:活:かつ\}',
-            r'\{RB:用:よう\}',
-            r'\{RB:関:かん\}',
-            r'\{RB:連:れん\}',
-            r'\{RB:敬:けい\}',
-            r'\{RB:語:ご\}',
-            r'\{RB:参:さん\}',
-            r'\{RB:考:こう\}'
-        ]
-
-        cleaned_str = index_str
-        for pattern in EXCLUDE_PATTERNS:
-            cleaned_str = re.sub(pattern, '', cleaned_str)
+        cleaned_str = patterns.RB_LABEL_PATTERN.sub('', index_str)
 
         variants = cleaned_str.split('・')
         pairs = []
@@ -51,7 +38,7 @@ class RGKO12Parser(MonokakidoParser):
                 continue
 
             # Extract all remaining RB tags
-            rb_tags = re.findall(r'\{RB:([^:]+):([^}]+)\}', variant)
+            rb_tags = patterns.RB_TAG_PATTERN.findall(variant)
 
             if not rb_tags:
                 # Handle cases like "ほどく" without RB tags
@@ -61,7 +48,7 @@ class RGKO12Parser(MonokakidoParser):
                 continue
 
             # Extract remaining text after RB tags
-            remaining_text = re.sub(r'\{RB:[^}]+\}', '', variant)
+            remaining_text = patterns.RB_ANY_TAG_PATTERN.sub('', variant)
 
             # Build kanji and reading from RB tags and remaining text
             kanji_parts = []
@@ -93,10 +80,10 @@ class RGKO12Parser(MonokakidoParser):
         entry_count = 0
         filename_without_ext = os.path.splitext(filename)[0]
 
-        entry_keys = list(set(self.index_reader.get_keys_for_file(filename_without_ext)))
+        entry_keys = list(dict.fromkeys(self.index_reader.get_keys_for_file(filename_without_ext)))
 
         # Parse xml
-        soup = bs4.BeautifulSoup(file_content, "xml")
+        soup = self.parse_xml(file_content)
 
         is_tsukaiwake_entry, _ = RGKO12Parser.is_tsukaiwake_entry(soup)
         if is_tsukaiwake_entry:
@@ -1,9 +1,6 @@
-import json
 import bs4
 from typing import List
 
-from utils import FileUtils
-
 from core.parser_module import YomitanParser
 from config import DictionaryConfig
 
@@ -11,7 +8,6 @@ class ShinjigenParser(YomitanParser):
 
     def __init__(self, config: DictionaryConfig):
         super().__init__(config)
-        self.dict_data = FileUtils.load_mdx_json(config.dict_path)
 
 
     @staticmethod
@@ -25,14 +21,13 @@ class ShinjigenParser(YomitanParser):
         
         
     def _process_file(self, filename: str, file_content: str) -> int:
+        # Entries are streamed from the MDX dump: filename is the entry key, file_content its html
         count = 0
 
-        file_content_dict = json.loads(file_content)
-        for key, val in file_content_dict.items():
-            entry_keys = ShinjigenParser.extract_entry_keys(key)
-            soup = bs4.BeautifulSoup(val, "lxml")
+        entry_keys = ShinjigenParser.extract_entry_keys(filename)
+        soup = self.parse_xml(file_content, "lxml")
 
-            for entry in entry_keys:
-                count += self.parse_entry(entry, "", soup)
+        for entry in entry_keys:
+            count += self.parse_entry(entry, "", soup)
 
         return count
\ No newline at end of file
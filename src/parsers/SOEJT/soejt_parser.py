@@ -1,14 +1,50 @@
 import os
+import copy
 import bs4
 import jaconv
+from collections import OrderedDict
+from typing import Optional
 
 from config import DictionaryConfig
 from core.parser_module import YomitanParser
 
+
+class ChildPageCache:
+    """
+    Bounded LRU of parsed thesaurus pages keyed by page id (the zero-padded href).
+    Each slot holds the page's processed childbody fragment for cross-page includes and,
+    until the main page loop consumes it, the full parsed soup of that page.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self.entries = OrderedDict()  # page_id -> {"soup": BeautifulSoup | None, "fragment": Tag | None}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, page_id: str) -> Optional[dict]:
+        entry = self.entries.get(page_id)
+        if entry is not None:
+            self.entries.move_to_end(page_id)
+        return entry
+
+    def put(self, page_id: str, entry: dict) -> None:
+        self.entries[page_id] = entry
+        self.entries.move_to_end(page_id)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def get_stats(self) -> str:
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total else 0
+        return f"ヒット: {self.hits} | ミス: {self.misses} | ヒット率: {hit_rate:.1f}%"
+
+
 class SOEJTParser(YomitanParser):
 
     def __init__(self, config: DictionaryConfig):
         super().__init__(config)
+        self.child_page_cache = ChildPageCache()
 
     # ----- Preprocessing ----- #
 
@@ -84,7 +120,9 @@ class SOEJTParser(YomitanParser):
             details.append(example.extract())
 
     @staticmethod
-    def replace_scale_header_arrows(soup: bs4.BeautifulSoup) -> bs4.BeautifulSoup:
+    def replace_scale_header_arrows(soup: bs4.BeautifulSoup | bs4.Tag,
+                                    tag_factory: Optional[bs4.BeautifulSoup] = None) -> bs4.BeautifulSoup | bs4.Tag:
+        tag_factory = tag_factory or soup
         scale_section = soup.find(class_='類語スケール')
         if not scale_section:
             return soup
@@ -93,7 +131,7 @@ class SOEJTParser(YomitanParser):
         if arrow_td:
             # Clear the content and add CSS arrow div
             arrow_td.clear()
-            css_arrow = soup.new_tag('div', **{'class': 'css-arrow'})
+            css_arrow = tag_factory.new_tag('div', **{'class': 'css-arrow'})
             arrow_td.append(css_arrow)
 
             scale_head = scale_section.find('td', class_='scale-header')
@@ -108,30 +146,56 @@ class SOEJTParser(YomitanParser):
 
     # ----- Parsing ----- #
 
-    def _add_misc_xml_content(self, soup: bs4.BeautifulSoup, href: str, title: str) -> bs4.BeautifulSoup:
-        if not href:
+    def _get_page_soup(self, page_id: str, file_content: str) -> bs4.BeautifulSoup:
+        """Parse a page for the main loop, reusing a soup already parsed by an include"""
+        entry = self.child_page_cache.get(page_id)
+        if entry and entry["soup"] is not None:
+            self.child_page_cache.hits += 1
+            soup = entry["soup"]
+            entry["soup"] = None
             return soup
 
-        body = soup.find('body')
-        href = href.zfill(10)
+        self.child_page_cache.misses += 1
+        return self.parse_xml(file_content)
+
 
+    def _get_child_fragment(self, page_id: str) -> Optional[bs4.Tag]:
+        """Get the processed childbody of a linked page, parsing the page at most once"""
+        entry = self.child_page_cache.get(page_id)
+        if entry:
+            self.child_page_cache.hits += 1
+            return entry["fragment"]
+
+        self.child_page_cache.misses += 1
         try:
-            xml_content = self.file_iterator.read_file(href + ".xml")
+            xml_content = self.file_iterator.read_file(page_id + ".xml")
         except FileNotFoundError:
-            return soup
+            return None
+
+        child_soup = self.parse_xml(xml_content)
+        fragment = None
+        if not child_soup.find(class_='topchildbody'):
+            child_body = child_soup.find(class_='childbody')
+            if child_body:
+                # Work on a copy so the page is left untouched for the main loop
+                fragment = self.replace_scale_header_arrows(copy.copy(child_body), tag_factory=child_soup)
+
+        self.child_page_cache.put(page_id, {"soup": child_soup, "fragment": fragment})
+        return fragment
+
 
-        child_soup = bs4.BeautifulSoup(xml_content, "xml")
-        if child_soup.find(class_='topchildbody'):
+    def _add_misc_xml_content(self, soup: bs4.BeautifulSoup, href: str, title: str) -> bs4.BeautifulSoup:
+        if not href:
             return soup
 
-        child_soup = self.replace_scale_header_arrows(child_soup)
-        child_body = child_soup.find(class_='childbody')
+        body = soup.find('body')
+        child_body = self._get_child_fragment(href.zfill(10))
         if child_body:
             new_element = soup.new_tag('details')
             summary = soup.new_tag('summary')
             summary.append(title)
             new_element.append(summary)
-            new_element.append(child_body)
+            new_element.append(copy.copy(child_body))
 
             body.append(new_element)
 
@@ -159,9 +223,10 @@ class SOEJTParser(YomitanParser):
 
     def _process_file(self, filename: str, file_content: str) -> int:
         entry_count = 0
-        entry_keys = list(set(self.index_reader.get_keys_for_file(os.path.splitext(filename)[0])))
+        page_id = os.path.splitext(filename)[0]
+        entry_keys = list(dict.fromkeys(self.index_reader.get_keys_for_file(page_id)))
 
-        soup = bs4.BeautifulSoup(file_content, "xml")
+        soup = self._get_page_soup(page_id, file_content)
         soup = self._preprocess_content(soup)
 
         if soup.find(class_='topchildbody'):
@@ -174,3 +239,7 @@ class SOEJTParser(YomitanParser):
                 entry_count += self.parse_entry(key, "", soup, "", "", -1)
 
         return entry_count
+
+
+    def finalize_processing(self):
+        print(f"子ページキャッシュ: {self.child_page_cache.get_stats()}")
@@ -2,12 +2,11 @@ import os
 import regex as re
 from typing import Dict, List
 
-from core.parser_module import YomitanParser
+from core.parser_module import YomitanParser, SideTable
 from core.yomitan import DicEntry, create_html_element
 from config import DictionaryConfig
 from parsers.TISMKANJI.tismkanji_utils import TismKanjiUtils
-from utils import FileUtils
-from utils.lang import KanjiUtils
+from utils.lang import KanjiUtils, patterns
 
     
 class TismKanjiParser(YomitanParser):
@@ -16,13 +15,13 @@ class TismKanjiParser(YomitanParser):
         super().__init__(config)
         
         self.dict_data = {i: item for i, item in enumerate(TismKanjiUtils.load_json(config.dict_path))}
-        self.kanken_data = FileUtils.load_json(os.path.join(os.path.dirname(__file__), "kanken_data.json"))
-        
-        self.kanken_level_map = {}
-        for level in self.kanken_data.get('groups', []):
-            level_name = level.get('name', '')
-            for kanji in level.get('characters', []):
-                self.kanken_level_map[kanji] = level_name
+        self.kanken_data = SideTable.load(
+            os.path.join(os.path.dirname(__file__), "kanken_data.json"),
+            required_keys=("groups",),
+            build_index=lambda data: {
+                kanji: level.get('name', '') for level in data['groups'] for kanji in level.get('characters', [])
+            }
+        )
     
     
     def clean_content(self, text: str) -> str:
@@ -36,7 +35,7 @@ class TismKanjiParser(YomitanParser):
             
     def create_kanken_level_element(self, kanji: str) -> Dict:
         # 漢字検定レベルを確定、ディフォルトは配当外
-        kanken_level = self.kanken_level_map.get(kanji, self.kanken_data.get('leftover_group', '配当外'))
+        kanken_level = self.kanken_data.get(kanji, self.kanken_data.data.get('leftover_group', '配当外'))
                 
         html_elements = []
         data_dict = {}
@@ -102,12 +101,11 @@ class TismKanjiParser(YomitanParser):
         # 1. Replace カタカナ漢字 in the beginning of the text with 漢字(カタカナ)
         # 2. Replace 「漢字カタカナ」with 漢字(カタカナ)
         # Also works for example like 「鸒𪆁・鸒斯イシ」and 「髻タブサ・モトドリ」
-        text = TismKanjiUtils.replace_furigana_pattern(re.compile(r'^(?<furigana>\p{Katakana}+)(?<kanji>\p{Han}+)'), definition)
-        text = TismKanjiUtils.replace_furigana_pattern(re.compile(r'[「・](?<kanji>\p{Han}+(?:・\p{Han}+)?)(?<furigana>\p{Katakana}+(?:・\p{Katakana}+)?)(?:」)?'), text)
+        text = TismKanjiUtils.replace_furigana_pattern(patterns.LEADING_FURIGANA_PATTERN, definition)
+        text = TismKanjiUtils.replace_furigana_pattern(patterns.QUOTED_FURIGANA_PATTERN, text)
         
         # Add furigana style to 漢字（かな）pattern
-        furigana_full = r'([^()]+)\(([^)]+)\)'
-        pattern = re.compile(furigana_full)
+        pattern = patterns.PARENTHESISED_FURIGANA_PATTERN
         
         parts = []
         last_index = 0
@@ -15,10 +15,11 @@ class TismKanjiUtils:
             
             # Check if the last character is Japanese punctuation, don't add a comma in that case
             preceding_char = text[start - 1] if start > 0 else ""
+            # The match is only kanji, katakana and 「・」, so a plain replace does what re.sub(full_text, ...) did
             if start == 0 or TismKanjiUtils.PUNCTUATION_PATTERN.search(preceding_char) or preceding_char == '\n':
-                text = re.sub(full_text, kanji + f'({furigana})', text)
+                text = text.replace(full_text, kanji + f'({furigana})')
             else:
-                text = re.sub(full_text, "、" + kanji + f'({furigana})', text)
+                text = text.replace(full_text, "、" + kanji + f'({furigana})')
             
         return text
     
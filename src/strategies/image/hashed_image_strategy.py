@@ -1,13 +1,36 @@
 import os
 import bs4
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Tuple
 
 from .image_strategies import DefaultImageHandlingStrategy
-from utils import FileUtils
+from core.parser_module import SideTable
+
+NORMALIZATION_FORMS = ("NFC", "NFD", "NFKC", "NFKD")
+
 
 class HashedImageStrategy(DefaultImageHandlingStrategy):
+    # Resolved src paths kept per strategy; image-heavy pages reference the same files repeatedly
+    resolved_cache_size = 4096
 
     def __init__(self, image_map_path: str) -> None:
-        self.image_map = FileUtils.load_json(image_map_path)
+        table = SideTable.load(image_map_path, build_index=self._build_lookup)
+        self.image_map = table.data
+        self.lookup = table.index
+
+        self._resolved: "OrderedDict[str, Tuple[str, bool]]" = OrderedDict()
+        self.unresolved_references = 0
+        self.unresolved_files = set()
+
+    @staticmethod
+    def _build_lookup(image_map: Dict[str, str]) -> Dict[str, str]:
+        """Map every normalisation form of each filename to its hash; exact names take priority"""
+        lookup = dict(image_map)
+        for filename, hashed in image_map.items():
+            for norm_form in NORMALIZATION_FORMS:
+                lookup.setdefault(unicodedata.normalize(norm_form, filename), hashed)
+        return lookup
 
     def get_src_path(self, html_glossary: bs4.element.Tag) -> str:
         src_path = html_glossary.get("src", "").lstrip("/")
@@ -16,20 +39,49 @@ class HashedImageStrategy(DefaultImageHandlingStrategy):
         return normalized_filename
 
     def _get_normalized_filename(self, src_path: str) -> str:
+        resolved_path, found = self._lookup(src_path)
+        if not found:
+            self._record_unresolved(src_path)
+        return resolved_path
+
+    def _lookup(self, src_path: str) -> Tuple[str, bool]:
+        """The hashed path and whether the image map knows the file; misses aren't recorded here"""
         if not src_path:
-            return ""
+            return "", True
+
+        cached = self._resolved.get(src_path)
+        if cached is None:
+            cached = self._resolve(src_path)
+            self._resolved[src_path] = cached
+            if len(self._resolved) > self.resolved_cache_size:
+                self._resolved.popitem(last=False)
+        else:
+            self._resolved.move_to_end(src_path)
+        return cached
 
+    def _record_unresolved(self, src_path: str) -> None:
+        self.unresolved_references += 1
+        self.unresolved_files.add(os.path.basename(src_path))
+
+    def _resolve(self, src_path: str) -> Tuple[str, bool]:
         original_filename = os.path.basename(src_path)
 
-        # Try direct lookup first
-        if original_filename in self.image_map:
-            return src_path.replace(original_filename, self.image_map[original_filename])
+        hashed = self.lookup.get(original_filename)
+        if hashed is None:
+            # Only references in a mixed or compatibility form get here, and each is resolved once
+            for norm_form in NORMALIZATION_FORMS:
+                hashed = self.lookup.get(unicodedata.normalize(norm_form, original_filename))
+                if hashed is not None:
+                    break
+
+        if hashed is None:
+            return src_path, False
+        return src_path.replace(original_filename, hashed), True
 
-        # Try normalized versions
-        import unicodedata
-        for norm_form in ["NFC", "NFD", "NFKC", "NFKD"]:
-            normalized = unicodedata.normalize(norm_form, original_filename)
-            if normalized in self.image_map:
-                return src_path.replace(original_filename, self.image_map[normalized])
+    def report_unresolved(self, limit: int = 10) -> None:
+        if not self.unresolved_references:
+            return
 
-        return src_path
\ No newline at end of file
+        print(f"未解決の画像参照: {self.unresolved_references}件 ({len(self.unresolved_files)}ファイル)")
+        for filename in sorted(self.unresolved_files)[:limit]:
+            print(f"  {filename}")
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 import bs4
-import jaconv
 
-from utils.lang import KanjiUtils
+from utils import Instrumentation
+from utils.lang import KanjiUtils, KanaUtils
 
 
 class NormalizationStrategy(ABC):
@@ -31,14 +31,15 @@ class DefaultNormalizationStrategy(NormalizationStrategy):
         return context
 
 
+    @Instrumentation.timed("key_normalisation")
     def normalize_keys(self, entry_keys: List[str], soup: bs4.BeautifulSoup) -> List[str]:
         context = self.get_context(soup)
 
         if all(KanjiUtils.is_kanji(c) for c in context):
-            normalized_keys = [jaconv.kata2hira(entry) for entry in entry_keys]
+            normalized_keys = [KanaUtils.kata2hira(entry) for entry in entry_keys]
         elif any(KanjiUtils.is_katakana(c) for c in context):
-            normalized_keys = [jaconv.hira2kata(entry) for entry in entry_keys]
+            normalized_keys = [KanaUtils.hira2kata(entry) for entry in entry_keys]
         else:
-            normalized_keys = [jaconv.kata2hira(entry) for entry in entry_keys]
+            normalized_keys = [KanaUtils.kata2hira(entry) for entry in entry_keys]
 
         return normalized_keys
\ No newline at end of file
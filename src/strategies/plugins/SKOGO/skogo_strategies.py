@@ -1,10 +1,9 @@
 import regex as re
 import bs4
-import jaconv
 from typing import Tuple
 
 from utils import HTMLUtils
-from utils.lang import KanjiUtils
+from utils.lang import KanjiUtils, KanaUtils
 from strategies.link import DefaultLinkHandlingStrategy
 from strategies.normalization import DefaultNormalizationStrategy
 
@@ -62,12 +61,12 @@ class SKOGONormalizationStrategy(DefaultNormalizationStrategy):
             head_word_element = head_element.find("見出G")
             if head_word_element:
                 head_word = head_word_element.text.strip()
-                head_word = jaconv.kata2hira(KanjiUtils.clean_headword(head_word))
+                head_word = KanaUtils.kata2hira(KanjiUtils.clean_headword(head_word))
 
             reading_element = head_element.find("見出現代仮名")
             if reading_element:
                 reading = reading_element.text.strip()
-                reading = jaconv.kata2hira(KanjiUtils.clean_reading(reading))
+                reading = KanaUtils.kata2hira(KanjiUtils.clean_reading(reading))
             else:
                 return "", ""
 
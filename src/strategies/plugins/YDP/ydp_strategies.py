@@ -1,14 +1,19 @@
 import os
 import bs4
+import json
 import regex as re
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from core.yomitan import create_html_element
 from strategies.image import DefaultImageHandlingStrategy
 
 class YDPImageHandlingStrategy(DefaultImageHandlingStrategy):
-    def __init__(self):
+    SVG_DIMENSIONS_CACHE_PATH = Path(__file__).parent.parent.parent.parent.parent / "resources" / "cache" / "ydp_svg_dimensions.json"
+    SVG_DIMENSIONS_CACHE_VERSION = 1
+
+    def __init__(self, dictionary_path: Optional[str] = None):
         self.replacements = {
             "arrow-thick.svg": {
                 "text": "➡",
@@ -32,11 +37,11 @@ class YDPImageHandlingStrategy(DefaultImageHandlingStrategy):
             }
         }
 
-        # Cache for SVG viewBox dimensions to avoid repeated file reads
-        self.svg_dimensions_cache = {}
-
         # Path to the dictionary files
-        self.dictionary_path = Path(__file__).parent.parent.parent.parent.parent / "resources/YDP/assets"
+        self.dictionary_path = Path(dictionary_path) if dictionary_path else Path(__file__).parent.parent.parent.parent.parent / "resources/YDP/assets"
+
+        # Every SVG's viewBox dimensions, read up front so page conversion never touches the disk
+        self.svg_dimensions_cache = self.load_svg_dimensions()
 
         # Configuration for different equation types
         self.equation_config = {
@@ -78,16 +83,53 @@ class YDPImageHandlingStrategy(DefaultImageHandlingStrategy):
         }
 
     def extract_svg_viewbox(self, svg_path: str) -> Tuple[float, float]:
-        """Extract width and height from SVG viewBox attribute"""
-        try:
-            # Use cached dimensions if available
-            if svg_path in self.svg_dimensions_cache:
-                return self.svg_dimensions_cache[svg_path]
-
-            full_path = self.dictionary_path.joinpath(svg_path)
-            if not full_path.exists():
-                return 0, 0
+        """Width and height of an SVG from the pre-scanned dimension table"""
+        return self.svg_dimensions_cache.get(svg_path, (0, 0))
+
+    def load_svg_dimensions(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Scan every SVG under the assets folder and return relative path -> (width, height).
+        Files whose mtime and size match the on-disk cache are not re-read; the rest are
+        read in parallel and the cache is written back.
+        """
+        if not self.dictionary_path.is_dir():
+            return {}
+
+        cached_files = self._read_svg_dimensions_cache()
+        files = {}
+        to_scan = []
+
+        for root, _, filenames in os.walk(self.dictionary_path):
+            for filename in filenames:
+                if not filename.lower().endswith(".svg"):
+                    continue
+
+                full_path = os.path.join(root, filename)
+                rel_path = Path(os.path.relpath(full_path, self.dictionary_path)).as_posix()
+                stat = os.stat(full_path)
+
+                cached = cached_files.get(rel_path)
+                if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    files[rel_path] = cached
+                else:
+                    to_scan.append((rel_path, full_path, stat.st_mtime_ns, stat.st_size))
+
+        if to_scan:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as executor:
+                dimensions = executor.map(YDPImageHandlingStrategy.read_svg_dimensions, [item[1] for item in to_scan])
+                for (rel_path, _, mtime_ns, size), (width, height) in zip(to_scan, dimensions):
+                    files[rel_path] = [mtime_ns, size, width, height]
+
+        if to_scan or len(files) != len(cached_files):
+            self._write_svg_dimensions_cache(files)
+            print(f"SVG寸法キャッシュ: {len(files)}件 (新規読み込み {len(to_scan)}件)")
+
+        return {rel_path: (width, height) for rel_path, (_, _, width, height) in files.items()}
 
+    @staticmethod
+    def read_svg_dimensions(full_path: str) -> Tuple[float, float]:
+        """Extract width and height from an SVG's viewBox, falling back to its width/height attributes"""
+        try:
             with open(full_path, 'r', encoding='utf-8') as f:
                 svg_content = f.read()
 
@@ -99,10 +141,7 @@ class YDPImageHandlingStrategy(DefaultImageHandlingStrategy):
                 if len(values) >= 4:
                     try:
                         # The first two values are min-x and min-y, the last two are width and height
-                        width = float(values[-2])
-                        height = float(values[-1])
-                        self.svg_dimensions_cache[svg_path] = (width, height)
-                        return width, height
+                        return float(values[-2]), float(values[-1])
                     except ValueError:
                         pass
 
@@ -112,18 +151,47 @@ class YDPImageHandlingStrategy(DefaultImageHandlingStrategy):
 
             if width_match and height_match:
                 try:
-                    width = float(width_match.group(1))
-                    height = float(height_match.group(1))
-                    self.svg_dimensions_cache[svg_path] = (width, height)
-                    return width, height
+                    return float(width_match.group(1)), float(height_match.group(1))
                 except ValueError:
                     pass
 
             return 0, 0
         except Exception as e:
-            print(f"Error extracting viewBox from {svg_path}: {e}")
+            print(f"Error extracting viewBox from {full_path}: {e}")
             return 0, 0
 
+    def _read_svg_dimensions_cache(self) -> Dict[str, List]:
+        cache_path = self.SVG_DIMENSIONS_CACHE_PATH
+        if not cache_path.exists():
+            return {}
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"SVG寸法キャッシュを読み込めませんでした: {e}")
+            return {}
+
+        if data.get("version") != self.SVG_DIMENSIONS_CACHE_VERSION or data.get("root") != str(self.dictionary_path.resolve()):
+            return {}
+
+        return data.get("files", {})
+
+    def _write_svg_dimensions_cache(self, files: Dict[str, List]) -> None:
+        cache_path = self.SVG_DIMENSIONS_CACHE_PATH
+        try:
+            os.makedirs(cache_path.parent, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": self.SVG_DIMENSIONS_CACHE_VERSION,
+                    "root": str(self.dictionary_path.resolve()),
+                    "files": files
+                }, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"SVG寸法キャッシュを書き込めませんでした: {e}")
+
     def calculate_svg_dimensions(self, svg_path: str) -> Dict:
         """Calculate appropriate width and height for SVG based on its viewBox"""
         width, height = self.extract_svg_viewbox(svg_path)
@@ -1,10 +1,10 @@
 import regex as re
 import bs4
-import jaconv
 from typing import Dict, Tuple, Optional
 
 from .pos_tag_strategies import DefaultPosTagStrategy
-from utils.lang import KanjiUtils
+from utils import Instrumentation
+from utils.lang import KanjiUtils, KanaUtils
 
 
 class NDSPosTagStrategy(DefaultPosTagStrategy):
@@ -57,6 +57,7 @@ class NDSPosTagStrategy(DefaultPosTagStrategy):
         self.yodan_category_regex = r'\p{Katakana}(?=.*四)'
         self.godan_category_regex = r'\p{Katakana}(?=.*五)'
 
+    @Instrumentation.timed("pos_lookup")
     def get_from_html(self, soup: bs4.BeautifulSoup, term: str, reading: str) -> Tuple[str, str]:
         pos_info = self._extract_pos_info(soup, reading)
 
@@ -152,7 +153,7 @@ class NDSPosTagStrategy(DefaultPosTagStrategy):
 
 
     def _get_godan_category(self, element_text: str, reading: str) -> str:
-        match jaconv.kata2hira(reading):
+        match KanaUtils.kata2hira(reading):
             case s if s.endswith("ある") or s.endswith("有る"):
                 return "v5aru"
             case s if any(s.endswith(c) for c in ["いく", "ゆく", "行く", "逝く"]):
@@ -2,7 +2,7 @@ import bs4
 from abc import ABC, abstractmethod
 from typing import Tuple, Optional
 
-from utils import FileUtils
+from utils import FileUtils, Instrumentation
 from utils.lang import sudachi_rules
 
 class PosTagStrategy(ABC):
@@ -25,6 +25,7 @@ class DefaultPosTagStrategy(PosTagStrategy):
     def get_from_html(self, soup: bs4.BeautifulSoup, term: str, reading: str) -> Tuple[str, str]:
         pass
 
+    @Instrumentation.timed("pos_lookup")
     def get_from_term(self, term: str) -> Tuple[str, str]:
         """Get part-of-speech tags for a term"""
         info_tag, pos_tag = self.jmdict_data.get(term, ["", ""])
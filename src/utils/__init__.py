@@ -1,7 +1,32 @@
-from .file_utils import FileUtils
-from .html_utils import HTMLUtils
+import importlib
+
+from .instrumentation import Instrumentation
+from .page_profiler import PageProfiler
+from .memory_profiler import MemoryProfiler
+
+# Loaded on first access, so importing utils doesn't pull in bs4, regex and tqdm
+_LAZY_EXPORTS = {
+    "FileUtils": ".file_utils",
+    "HTMLUtils": ".html_utils",
+    "AssetConverter": ".asset_converter",
+    "AssetPacker": ".asset_packer",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "FileUtils",
     "HTMLUtils",
-]
\ No newline at end of file
+    "AssetConverter",
+    "AssetPacker",
+    "Instrumentation",
+    "PageProfiler",
+    "MemoryProfiler",
+]
@@ -0,0 +1,227 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import subprocess
+import importlib.util
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .instrumentation import Instrumentation
+
+BACKENDS = ("auto", "inkscape", "python")
+# Sources each backend can rasterise; raster inputs (TIFF) always go through Pillow
+VECTOR_EXTENSIONS = {
+    "inkscape": {".svg", ".pdf"},
+    "python": {".svg"},
+}
+RASTER_EXTENSIONS = {".tif", ".tiff"}
+# Python module each conversion imports, and the package that provides it
+MODULE_PACKAGES = {"PIL": "Pillow", "cairosvg": "cairosvg"}
+MANIFEST_VERSION = 1
+
+
+def _convert_file(source: str, output: str, backend: str, dpi: int) -> Tuple[str, Optional[str]]:
+    """Convert one file; returns (source, error message or None). Module level so process pools can pickle it"""
+    try:
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        tmp_output = output + ".tmp.png"
+        extension = os.path.splitext(source)[1].lower()
+
+        if extension in RASTER_EXTENSIONS:
+            from PIL import Image
+            with Image.open(source) as image:
+                image.save(tmp_output, "PNG")
+        elif backend == "inkscape":
+            result = subprocess.run(
+                ["inkscape", "--export-type=png", "--export-filename", tmp_output, "--export-dpi", str(dpi), source],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            )
+            if result.returncode != 0:
+                return source, result.stderr.strip() or f"inkscape exited with {result.returncode}"
+        else:
+            import cairosvg
+            cairosvg.svg2png(url=source, write_to=tmp_output, dpi=dpi)
+
+        os.replace(tmp_output, output)
+        return source, None
+    except Exception as e:
+        return source, str(e)
+
+
+class AssetConverter:
+    """
+    Asset-build stage that rasterises SVG/PDF/TIFF assets to PNG before packaging.
+    Conversions run on a bounded worker pool, and a manifest of source content hashes
+    lets unchanged sources with an existing output be skipped on the next build.
+    """
+
+    @staticmethod
+    def resolve_backend(backend: str = "auto") -> str:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown asset backend: {backend} (expected one of {', '.join(BACKENDS)})")
+        if backend == "auto":
+            return "inkscape" if shutil.which("inkscape") else "python"
+        if backend == "inkscape" and not shutil.which("inkscape"):
+            raise RuntimeError("Inkscape is not installed or not available in PATH")
+        return backend
+
+    @staticmethod
+    def get_required_module(source: str, backend: str) -> Optional[str]:
+        """The Python module converting this file needs, or None when Inkscape does it"""
+        if os.path.splitext(source)[1].lower() in RASTER_EXTENSIONS:
+            return "PIL"
+        return "cairosvg" if backend == "python" else None
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def find_sources(input_dir: str, extensions: Iterable[str], recursive: bool = True) -> List[str]:
+        extensions = {ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions}
+        sources = []
+        for root, _, files in os.walk(input_dir):
+            for filename in files:
+                if os.path.splitext(filename)[1].lower() in extensions:
+                    sources.append(os.path.join(root, filename))
+            if not recursive:
+                break
+        return sorted(sources)
+
+    @staticmethod
+    def load_manifest(manifest_path: Optional[str]) -> Dict[str, Any]:
+        if not manifest_path or not os.path.exists(manifest_path):
+            return {}
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"アセットマニフェストを読み込めませんでした: {e}")
+            return {}
+        return data.get("files", {}) if data.get("version") == MANIFEST_VERSION else {}
+
+    @staticmethod
+    def save_manifest(manifest_path: Optional[str], files: Dict[str, Any]) -> None:
+        if not manifest_path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "files": files}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, manifest_path)
+
+    @staticmethod
+    @Instrumentation.timed("asset_conversion")
+    def convert_directory(input_dir: str, output_dir: Optional[str] = None, extensions: Iterable[str] = (".svg",),
+                          backend: str = "auto", dpi: int = 96, workers: Optional[int] = None,
+                          manifest_path: Optional[str] = None, recursive: bool = True) -> Dict[str, Any]:
+        """
+        Convert every matching file under input_dir to a PNG with the same relative path and stem
+        (next to the source when output_dir is None). Returns the throughput report.
+        """
+        start_time = time.perf_counter()
+        backend = AssetConverter.resolve_backend(backend)
+        sources = AssetConverter.find_sources(input_dir, extensions, recursive)
+        manifest = AssetConverter.load_manifest(manifest_path)
+        output_root = output_dir or input_dir
+
+        jobs = []
+        hashes = {}
+        skipped = 0
+        unsupported = []
+        for source in sources:
+            rel_path = Path(os.path.relpath(source, input_dir)).as_posix()
+            output = str(Path(output_root) / Path(rel_path).with_suffix(".png"))
+            extension = os.path.splitext(source)[1].lower()
+
+            if extension not in RASTER_EXTENSIONS and extension not in VECTOR_EXTENSIONS[backend]:
+                unsupported.append(rel_path)
+                continue
+
+            source_hash = AssetConverter.hash_file(source)
+            hashes[rel_path] = source_hash
+            entry = manifest.get(rel_path)
+            if os.path.exists(output):
+                up_to_date = entry is not None and entry["sha256"] == source_hash and entry["dpi"] == dpi
+                # Outputs from before the manifest existed are trusted when they're newer than their source
+                if up_to_date or (entry is None and os.path.getmtime(output) >= os.path.getmtime(source)):
+                    manifest[rel_path] = {"sha256": source_hash, "dpi": dpi, "output": Path(os.path.relpath(output, output_root)).as_posix()}
+                    skipped += 1
+                    continue
+
+            jobs.append((rel_path, source, output))
+
+        # Files whose converter module isn't installed are left as they are instead of failing the build
+        missing_modules = {}
+        for rel_path, source, _ in jobs:
+            module = AssetConverter.get_required_module(source, backend)
+            if module and importlib.util.find_spec(module) is None:
+                missing_modules[rel_path] = MODULE_PACKAGES[module]
+        jobs = [job for job in jobs if job[0] not in missing_modules]
+
+        # Inkscape runs as a subprocess, so threads are enough; the Python backend needs processes
+        workers = workers or os.cpu_count() or 1
+        executor_class = ThreadPoolExecutor if backend == "inkscape" else ProcessPoolExecutor
+        failed = {}
+        converted_bytes = 0
+
+        if jobs:
+            with executor_class(max_workers=min(workers, len(jobs))) as executor:
+                results = executor.map(_convert_file, [job[1] for job in jobs], [job[2] for job in jobs],
+                                       [backend] * len(jobs), [dpi] * len(jobs))
+                for (rel_path, source, output), (_, error) in zip(jobs, results):
+                    if error:
+                        failed[rel_path] = error
+                        manifest.pop(rel_path, None)
+                        continue
+                    converted_bytes += os.path.getsize(source)
+                    manifest[rel_path] = {"sha256": hashes[rel_path], "dpi": dpi, "output": Path(os.path.relpath(output, output_root)).as_posix()}
+
+        AssetConverter.save_manifest(manifest_path, manifest)
+
+        elapsed = time.perf_counter() - start_time
+        converted = len(jobs) - len(failed)
+        report = {
+            "backend": backend,
+            "workers": min(workers, len(jobs)) if jobs else 0,
+            "sources": len(sources),
+            "converted": converted,
+            "skipped": skipped,
+            "failed": failed,
+            "unsupported": unsupported,
+            "missing_modules": missing_modules,
+            "seconds": round(elapsed, 3),
+            "files_per_second": round(converted / elapsed, 2) if elapsed and converted else 0.0,
+            "mb_per_second": round(converted_bytes / (1 << 20) / elapsed, 2) if elapsed and converted else 0.0,
+        }
+        Instrumentation.count("assets_converted", converted)
+        Instrumentation.count("assets_skipped", skipped)
+
+        AssetConverter.print_report(report)
+        return report
+
+    @staticmethod
+    def print_report(report: Dict[str, Any]) -> None:
+        print(f"アセット変換 ({report['backend']}, {report['workers']}並列): "
+              f"{report['converted']}件変換, {report['skipped']}件スキップ, {len(report['failed'])}件失敗 "
+              f"/ {report['sources']}件 [{report['seconds']:.2f}秒, {report['files_per_second']:.1f}件/秒, "
+              f"{report['mb_per_second']:.2f}MB/秒]")
+        for rel_path, error in list(report["failed"].items())[:10]:
+            print(f"  変換失敗: {rel_path}: {error}")
+        if report["unsupported"]:
+            unsupported = report["unsupported"]
+            print(f"警告: {report['backend']}バックエンドでは変換できないため、{len(unsupported)}件を変換せずにパッケージします "
+                  f"(例: {', '.join(unsupported[:3])})")
+            if any(os.path.splitext(path)[1].lower() in VECTOR_EXTENSIONS["inkscape"] for path in unsupported):
+                print("  PDFの変換にはInkscapeが必要です (--asset-backend inkscape)")
+        for package in sorted(set(report["missing_modules"].values())):
+            paths = [path for path, required in report["missing_modules"].items() if required == package]
+            print(f"警告: {package}がインストールされていないため、{len(paths)}件を変換せずにパッケージします "
+                  f"(例: {', '.join(paths[:3])}; pip install {package})")
@@ -0,0 +1,178 @@
+import os
+import glob
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set
+
+from .instrumentation import Instrumentation
+from .asset_converter import AssetConverter
+
+# Only images are pruned; stylesheets, fonts and other support files are always packaged
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".avif", ".webp", ".bmp", ".tif", ".tiff", ".eps"}
+
+
+class AssetPacker:
+    """
+    Asset stage run between export and packaging. Every img path referenced by the exported
+    term banks is collected, referenced assets are hashed by content, byte-identical copies
+    are folded into one file (the term banks are rewritten to point at it), and only the
+    referenced, unique images are handed to the zip step. Sources of asset conversions
+    (e.g. YDP's PDFs) are pruned like images, so only their PNGs are packaged.
+    """
+
+    @staticmethod
+    def normalize_path(path: str) -> str:
+        path = path.replace("\\", "/").lstrip("/")
+        return path[2:] if path.startswith("./") else path
+
+    @staticmethod
+    def get_reference_keys(rel_path: str) -> List[str]:
+        """
+        Paths an asset can be referenced by: its path inside assets, and the path the zip step
+        gives it (from the first structure-preserving folder onwards)
+        """
+        from .file_utils import FileUtils
+
+        keys = [rel_path]
+        parts = rel_path.split("/")
+        for i, part in enumerate(parts):
+            if part in FileUtils.PRESERVE_STRUCTURE_FOLDERS:
+                if i:
+                    keys.append("/".join(parts[i:]))
+                break
+        return keys
+
+    @staticmethod
+    def find_image_paths(content: Any, found: Set[str]) -> None:
+        """Collect the path of every img node / image glossary inside a term bank entry"""
+        stack = [content]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                path = item.get("path")
+                if isinstance(path, str) and (item.get("tag") == "img" or item.get("type") == "image"):
+                    found.add(AssetPacker.normalize_path(path))
+                for value in item.values():
+                    if isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(item, list):
+                stack.extend(item)
+
+    @staticmethod
+    def replace_image_paths(content: Any, replacements: Dict[str, str]) -> int:
+        replaced = 0
+        stack = [content]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                path = item.get("path")
+                if isinstance(path, str) and (item.get("tag") == "img" or item.get("type") == "image"):
+                    canonical = replacements.get(AssetPacker.normalize_path(path))
+                    if canonical is not None:
+                        item["path"] = canonical
+                        replaced += 1
+                for value in item.values():
+                    if isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(item, list):
+                stack.extend(item)
+        return replaced
+
+    @staticmethod
+    @Instrumentation.timed("asset_packing")
+    def prepare(term_bank_folder: str, assets_folder: str, conversion_extensions: Iterable[str] = ()) -> List[str]:
+        """
+        Return the asset files to package. Falls back to every asset when the term banks
+        reference no images at all, so a dictionary whose images are linked some other way
+        is never packaged without them. conversion_extensions (the config's asset_conversions)
+        are pruned along with the image extensions unless a term bank references them.
+        """
+        prunable_extensions = IMAGE_EXTENSIONS | {
+            ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in conversion_extensions
+        }
+        asset_files = {}
+        asset_keys = {}
+        for root, _, files in os.walk(assets_folder):
+            for filename in files:
+                full_path = os.path.join(root, filename)
+                rel_path = Path(os.path.relpath(full_path, assets_folder)).as_posix()
+                asset_files[rel_path] = full_path
+                for key in AssetPacker.get_reference_keys(rel_path):
+                    asset_keys.setdefault(key, rel_path)
+
+        term_banks = sorted(glob.glob(os.path.join(str(term_bank_folder), "term_bank_*.json")))
+        bank_references = {}
+        for bank_path in term_banks:
+            with open(bank_path, "r", encoding="utf-8") as f:
+                found = set()
+                AssetPacker.find_image_paths(json.load(f), found)
+            bank_references[bank_path] = found
+
+        referenced = set().union(*bank_references.values()) if bank_references else set()
+        if not referenced:
+            print("画像参照が見つからないため、アセットをすべて収録します")
+            return list(asset_files.values())
+
+        # Hash referenced images; the first reference (sorted) of each content group is kept
+        canonical_by_hash = {}
+        canonical_asset = {}
+        replacements = {}
+        missing = sorted(path for path in referenced if path not in asset_keys)
+        for reference in sorted(path for path in referenced if path in asset_keys):
+            rel_path = asset_keys[reference]
+            digest = AssetConverter.hash_file(asset_files[rel_path])
+            canonical = canonical_by_hash.setdefault(digest, reference)
+            canonical_asset.setdefault(digest, rel_path)
+            if asset_keys[canonical] != rel_path:
+                replacements[reference] = canonical
+
+        rewritten_banks = 0
+        if replacements:
+            duplicate_paths = set(replacements)
+            for bank_path, found in bank_references.items():
+                if found.isdisjoint(duplicate_paths):
+                    continue
+                with open(bank_path, "r", encoding="utf-8") as f:
+                    entries = json.load(f)
+                AssetPacker.replace_image_paths(entries, replacements)
+                with open(bank_path, "w", encoding="utf-8") as f:
+                    json.dump(entries, f, ensure_ascii=False)
+                rewritten_banks += 1
+
+        packaged = []
+        unreferenced_bytes = 0
+        duplicate_bytes = 0
+        unreferenced_count = 0
+        kept = set(canonical_asset.values())
+        duplicates = {asset_keys[reference] for reference in replacements}
+        for rel_path, full_path in asset_files.items():
+            is_image = os.path.splitext(rel_path)[1].lower() in prunable_extensions
+            if not is_image or rel_path in kept:
+                packaged.append(full_path)
+            elif rel_path in duplicates:
+                duplicate_bytes += os.path.getsize(full_path)
+            else:
+                unreferenced_bytes += os.path.getsize(full_path)
+                unreferenced_count += 1
+
+        report = {
+            "assets": len(asset_files),
+            "packaged": len(packaged),
+            "referenced_images": len(referenced),
+            "missing_images": len(missing),
+            "duplicates": len(duplicates),
+            "duplicate_bytes": duplicate_bytes,
+            "unreferenced": unreferenced_count,
+            "unreferenced_bytes": unreferenced_bytes,
+            "saved_bytes": duplicate_bytes + unreferenced_bytes,
+            "rewritten_term_banks": rewritten_banks,
+        }
+        Instrumentation.add_section("asset_packing", report)
+
+        saved_bytes = duplicate_bytes + unreferenced_bytes
+        print(f"アセット収録: {len(packaged)}/{len(asset_files)}件 (重複 {len(duplicates)}件, "
+              f"未参照 {unreferenced_count}件, 削減 {saved_bytes:,}バイト / {saved_bytes / (1 << 20):.2f}MB)")
+        if missing:
+            print(f"  アセットが見つからない画像参照: {len(missing)}件 (例: {missing[0]})")
+
+        return packaged
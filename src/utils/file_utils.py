@@ -5,13 +5,21 @@ import zipfile
 import regex as re
 
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from tqdm import tqdm
 from datetime import datetime
 
+from .instrumentation import Instrumentation
+
 bar_format = "「{desc}: {bar:30}」{percentage:3.0f}% | {n_fmt}/{total_fmt} {unit}"
 
 class FileUtils:
+    # Known folder types that should preserve their structure inside the zip
+    PRESERVE_STRUCTURE_FOLDERS = {
+        'gaiji', 'graphics', 'images', 'images2', 'images_column',
+        'images_hitsujun', 'img', 'logos', 'icons', 'formulas',
+        'tables', 'pics', 'svg', 'icon'
+    }
     
     @staticmethod
     def read_xml_files(directory_path: str) -> Dict[str, str]:
@@ -42,7 +50,9 @@ class FileUtils:
     
     
     @staticmethod
-    def gather_files(term_bank_folder: str, assets_folder: str, index_json_path: str, output_path: str) -> List[str]:
+    def gather_files(term_bank_folder: str, assets_folder: str, index_json_path: str, output_path: str,
+                     asset_files: Optional[List[str]] = None) -> List[str]:
+        """Collect the files to package; asset_files replaces the walk of assets_folder when given"""
         file_paths = []
 
         # Collect dictionary files
@@ -51,9 +61,12 @@ class FileUtils:
                 file_paths.append(os.path.join(term_bank_folder, file))
 
         # Collect all files inside assets
-        for root, _, files in os.walk(assets_folder):
-            for f in files:
-                file_paths.append(os.path.join(root, f))
+        if asset_files is not None:
+            file_paths.extend(asset_files)
+        else:
+            for root, _, files in os.walk(assets_folder):
+                for f in files:
+                    file_paths.append(os.path.join(root, f))
                 
         # Collect index file
         if os.path.exists(index_json_path) and os.path.isfile(index_json_path):
@@ -62,6 +75,7 @@ class FileUtils:
         return file_paths
 
     @staticmethod
+    @Instrumentation.timed("zipping")
     def zip_dictionary(file_paths: List[str], name: str, base_path: str, output_path: str,
                        flatten_dict_folder: bool = True) -> str:
         if not file_paths:
@@ -71,13 +85,6 @@ class FileUtils:
         zip_name = name + f"[{date_str}].zip"
         zip_path = os.path.join(output_path, zip_name)
 
-        # Known folder types that should preserve their structure
-        preserve_structure_folders = {
-            'gaiji', 'graphics', 'images', 'images2', 'images_column',
-            'images_hitsujun', 'img', 'logos', 'icons', 'formulas',
-            'tables', 'pics', 'svg', 'icon'
-        }
-
         total_files = len(file_paths)
         with tqdm(total=total_files, desc="辞書圧縮処理",
                   bar_format="「{desc}: {bar:30}」{percentage:3.0f}%{postfix}", ascii="░▒█") as p_bar:
@@ -94,7 +101,7 @@ class FileUtils:
                     folder_match = None
                     folder_index = -1
                     for i, part in enumerate(path_parts):
-                        if part in preserve_structure_folders:
+                        if part in FileUtils.PRESERVE_STRUCTURE_FOLDERS:
                             folder_match = part
                             folder_index = i
                             break
@@ -0,0 +1,154 @@
+import os
+import json
+import time
+import threading
+import functools
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Optional, Any
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class _StageTimer:
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.start_time = 0.0
+
+    def __enter__(self):
+        depth = Instrumentation._depths()
+        if depth[self.stage] == 0:
+            self.start_time = time.perf_counter()
+        depth[self.stage] += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        depth = Instrumentation._depths()
+        depth[self.stage] -= 1
+        # Only the outermost timer of a stage counts, so recursive calls aren't double counted
+        if depth[self.stage] == 0:
+            Instrumentation._timings[self.stage] += time.perf_counter() - self.start_time
+            Instrumentation._calls[self.stage] += 1
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Instrumentation:
+    """
+    Opt-in per-stage timers and counters for a dictionary build.
+    Disabled by default; timers and counters are no-ops until enable() is called.
+    """
+    enabled = False
+    _timings: Dict[str, float] = defaultdict(float)
+    _calls: Dict[str, int] = defaultdict(int)
+    _counters: Dict[str, int] = defaultdict(int)
+    _sections: Dict[str, Any] = {}
+    _local = threading.local()
+    _start_time: Optional[float] = None
+    _started_at: Optional[str] = None
+
+    @classmethod
+    def enable(cls) -> None:
+        cls.reset()
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        cls.enabled = False
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._timings.clear()
+        cls._calls.clear()
+        cls._counters.clear()
+        cls._sections.clear()
+        cls._start_time = time.perf_counter()
+        cls._started_at = datetime.now().isoformat(timespec="seconds")
+
+    @classmethod
+    def _depths(cls) -> Dict[str, int]:
+        depths = getattr(cls._local, "depths", None)
+        if depths is None:
+            depths = cls._local.depths = defaultdict(int)
+        return depths
+
+    @classmethod
+    def timer(cls, stage: str):
+        """Context manager that adds the time spent in the block to a stage"""
+        if not cls.enabled:
+            return _NULL_TIMER
+        return _StageTimer(stage)
+
+    @classmethod
+    def timed(cls, stage: str):
+        """Decorator form of timer()"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not cls.enabled:
+                    return func(*args, **kwargs)
+                with _StageTimer(stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @classmethod
+    def count(cls, name: str, amount: int = 1) -> None:
+        if cls.enabled:
+            cls._counters[name] += amount
+
+    @classmethod
+    def add_section(cls, name: str, data: Any) -> None:
+        """Attach extra structured data (e.g. cache statistics) to the run report"""
+        if cls.enabled:
+            cls._sections[name] = data
+
+    @classmethod
+    def get_report(cls, dict_name: str = "") -> Dict[str, Any]:
+        wall_time = time.perf_counter() - cls._start_time if cls._start_time else 0.0
+        report = {
+            "dictionary": dict_name,
+            "started_at": cls._started_at,
+            "wall_time": round(wall_time, 4),
+            "stages": {
+                stage: {
+                    "seconds": round(seconds, 4),
+                    "calls": cls._calls[stage]
+                }
+                for stage, seconds in sorted(cls._timings.items(), key=lambda x: x[1], reverse=True)
+            },
+            "counters": dict(cls._counters)
+        }
+        report.update(cls._sections)
+        return report
+
+    @classmethod
+    def write_report(cls, output_path: str, dict_name: str = "") -> Dict[str, Any]:
+        report = cls.get_report(dict_name)
+        os.makedirs(os.path.dirname(str(output_path)) or ".", exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+
+    @classmethod
+    def print_summary(cls, report: Dict[str, Any]) -> None:
+        wall_time = report["wall_time"] or 1.0
+
+        print(f"\n{'処理段階':<24}{'秒':>10}{'回数':>12}{'割合':>9}")
+        print("-" * 55)
+        for stage, stats in report["stages"].items():
+            percentage = stats["seconds"] / wall_time * 100
+            print(f"{stage:<24}{stats['seconds']:>10.2f}{stats['calls']:>12}{percentage:>8.1f}%")
+        print("-" * 55)
+        print(f"{'合計時間':<24}{report['wall_time']:>10.2f}")
+
+        for name, value in report["counters"].items():
+            print(f"  {name}: {value}")
@@ -1,11 +1,28 @@
-from .cn_utils import CNUtils
-from .kanji_utils import KanjiUtils
-from .sudachi_tags import sudachi_rules
-from .expression_filter import ExpressionFilter
+import importlib
+
+# Loaded on first access, so only the parsers that need sudachipy, jamdict
+# or dragonmapper pay for importing them
+_LAZY_EXPORTS = {
+    "CNUtils": ".cn_utils",
+    "KanjiUtils": ".kanji_utils",
+    "KanaUtils": ".kana_utils",
+    "sudachi_rules": ".sudachi_tags",
+    "ExpressionFilter": ".expression_filter",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "CNUtils",
     "KanjiUtils",
+    "KanaUtils",
     "sudachi_rules",
     "ExpressionFilter",
-]
\ No newline at end of file
+]
@@ -1,48 +1,111 @@
-import regex as re
+import re
+import zhon.pinyin
 import dragonmapper.transcriptions as dt
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+from . import patterns
 
 class CNUtils:
+	"""
+	Besides the hanzi/pinyin helpers, this holds a memoised layer over dragonmapper: its
+	is_pinyin formats and looks up a ~5k character pattern on every call, and to_zhuyin
+	re-validates the whole string before converting it syllable by syllable. Here both
+	patterns are compiled once from the same zhon definitions with stdlib re and the same
+	flags, so results match dragonmapper's as long as both see the same zhon (pinned in
+	requirements.txt). is_pinyin is cached per string and zhuyin per syllable and per reading.
+	"""
+	PINYIN_PATTERN = re.compile(
+		"(?:{word}|[ \t{punctuation}])+".format(word=zhon.pinyin.word, punctuation=re.escape(zhon.pinyin.punctuation)),
+		re.I
+	)
+	PINYIN_SYLLABLE_PATTERN = re.compile(zhon.pinyin.syllable, re.I | re.U)
+	
+	# Each cache is cleared when it reaches this size
+	CACHE_MAX_SIZE = 1 << 17
+	_is_pinyin_cache: Dict[str, bool] = {}
+	_syllable_zhuyin_cache: Dict[str, str] = {}
+	_zhuyin_cache: Dict[str, str] = {}
+	
+	
+	@staticmethod
+	def _remember(cache: Dict, key: str, value) -> None:
+		if len(cache) >= CNUtils.CACHE_MAX_SIZE:
+			cache.clear()
+		cache[key] = value
+	
+	
+	@staticmethod
+	def clear_cache() -> None:
+		CNUtils._is_pinyin_cache.clear()
+		CNUtils._syllable_zhuyin_cache.clear()
+		CNUtils._zhuyin_cache.clear()
+	
+	
+	@staticmethod
+	def is_pinyin(text: str) -> bool:
+		"""dragonmapper.transcriptions.is_pinyin, memoised"""
+		result = CNUtils._is_pinyin_cache.get(text)
+		if result is None:
+			match = CNUtils.PINYIN_PATTERN.match(text)
+			result = match.group() == text if match else False
+			CNUtils._remember(CNUtils._is_pinyin_cache, text, result)
+		return result
+	
+	
+	@staticmethod
+	def syllable_to_zhuyin(syllable: str) -> str:
+		"""dragonmapper's per-syllable conversion, memoised (invalid syllables still raise ValueError)"""
+		zhuyin = CNUtils._syllable_zhuyin_cache.get(syllable)
+		if zhuyin is None:
+			zhuyin = dt.pinyin_syllable_to_zhuyin(syllable)
+			CNUtils._remember(CNUtils._syllable_zhuyin_cache, syllable, zhuyin)
+		return zhuyin
+	
+	
+	@staticmethod
+	def to_zhuyin(text: str) -> str:
+		"""
+		dragonmapper.transcriptions.to_zhuyin with the pinyin path on the memoised layer.
+		Zhuyin, IPA and invalid input (rare in the dictionaries) still go through dragonmapper.
+		"""
+		if not CNUtils.is_pinyin(text):
+			return dt.to_zhuyin(text)
+		
+		# Same walk as dragonmapper's _convert: syllables separated by spaces, apostrophes between them dropped
+		remaining = text
+		converted = ""
+		while remaining:
+			match = CNUtils.PINYIN_SYLLABLE_PATTERN.search(remaining)
+			if match is None:
+				converted += remaining
+				break
+			
+			start, end = match.span()
+			if start > 0:
+				if converted and start == 1 and remaining[0] == "'":
+					converted += " "
+				else:
+					converted += remaining[:start]
+			elif converted:
+				converted += " "
+			
+			converted += CNUtils.syllable_to_zhuyin(match.group())
+			remaining = remaining[end:]
+		
+		return converted
+	
 	
 	@staticmethod
 	def normalize_pinyin(text):
-		text = re.sub(r'\d', '', text)
-		text = re.sub(r'\s+', '', text)
-		text = text.lower()
-		text = re.sub(r'[^a-z0-9]', '', text)
+		# Lowercase, keep ASCII letters only (drops tone numbers and spaces), ü written as v -> u
+		text = patterns.NON_PINYIN_LETTER_PATTERN.sub('', text.lower())
 		text = text.replace('v', 'u')
 		return text
 	
 	
 	@staticmethod
 	def is_hanzi(text: str) -> bool:
-		cjk_unified = r'\p{Han}'
-		
-		cjk_compat = r'\p{InCJK_Compatibility_Ideographs}'
-		cjk_compat_supp = r'\p{InCJK_Compatibility_Ideographs_Supplement}'
-		
-		cjk_ext_a = r'\p{InCJK_Unified_Ideographs_Extension_A}'
-		cjk_ext_b = r'\p{InCJK_Unified_Ideographs_Extension_B}'
-		cjk_ext_c = r'\p{InCJK_Unified_Ideographs_Extension_C}'
-		cjk_ext_d = r'\p{InCJK_Unified_Ideographs_Extension_D}'
-		cjk_ext_e = r'\p{InCJK_Unified_Ideographs_Extension_E}'
-		cjk_ext_f = r'\p{InCJK_Unified_Ideographs_Extension_F}'
-		cjk_ext_g = r'\p{InCJK_Unified_Ideographs_Extension_G}'
-		cjk_ext_h = r'\p{InCJK_Unified_Ideographs_Extension_H}'
-		cjk_ext_i = r'\p{InCJK_Unified_Ideographs_Extension_I}'
-		
-		cjk_radicals = r'\p{InCJK_Radicals_Supplement}'
-		kangxi_radicals = r'\p{InKangxi_Radicals}'
-		ideographic_desc = r'\p{InIdeographic_Description_Characters}'
-		
-		pattern = '|'.join([
-			cjk_unified, cjk_compat, cjk_compat_supp,
-			cjk_ext_a, cjk_ext_b, cjk_ext_c, cjk_ext_d, 
-			cjk_ext_e, cjk_ext_f, cjk_ext_g, cjk_ext_h, cjk_ext_i,
-			cjk_radicals, kangxi_radicals, ideographic_desc
-		])
-
-		return bool(re.search(f'({pattern})', text))
+		return patterns.HANZI_PATTERN.search(text) is not None
 	
 	
 	@staticmethod
@@ -54,8 +117,8 @@ class CNUtils:
 			return []
 		
 		# Identify Pinyin entries
-		numbered_pinyin = [k for k in entry_keys if dt.is_pinyin(k) and any(c.isdigit() for c in k)]
-		unnumbered_pinyin = [k for k in entry_keys if dt.is_pinyin(k) and not any(c.isdigit() for c in k)]
+		numbered_pinyin = [k for k in entry_keys if CNUtils.is_pinyin(k) and any(c.isdigit() for c in k)]
+		unnumbered_pinyin = [k for k in entry_keys if CNUtils.is_pinyin(k) and not any(c.isdigit() for c in k)]
 		
 		# Find unclassified entries (neither Hanzi nor recognized Pinyin)
 		all_classified = set(hanzi_entries + numbered_pinyin + unnumbered_pinyin)
@@ -94,13 +157,20 @@ class CNUtils:
 				
 		return mappings
 	
-	import dragonmapper.transcriptions as dt
-	
 	@staticmethod
 	def pinyin_to_zhuyin(pinyin: str) -> str:
 		if not pinyin or not pinyin.strip():
 			return ""
 		
+		zhuyin = CNUtils._zhuyin_cache.get(pinyin)
+		if zhuyin is None:
+			zhuyin = CNUtils._convert_pinyin_to_zhuyin(pinyin)
+			CNUtils._remember(CNUtils._zhuyin_cache, pinyin, zhuyin)
+		return zhuyin
+	
+	
+	@staticmethod
+	def _convert_pinyin_to_zhuyin(pinyin: str) -> str:
 		special_cases = {
 			"hsk": "hsk", # abbrev.
 			"ktv": "ktv",
@@ -149,7 +219,7 @@ class CNUtils:
 					part = part.lower()
 					
 					try:
-						zhuyin = dt.to_zhuyin(part)
+						zhuyin = CNUtils.to_zhuyin(part)
 						result_parts.append(zhuyin)
 					except Exception:
 						if part.lower() in special_cases:
@@ -163,7 +233,7 @@ class CNUtils:
 		# Regular pinyin conversion for standard pinyin terms
 		try:
 			fixed_pinyin = pinyin.lower()
-			zhuyin = dt.to_zhuyin(pinyin.lower())
+			zhuyin = CNUtils.to_zhuyin(pinyin.lower())
 			return zhuyin
 		except Exception as e:
 			print(f"\nFailed to convert to zhuyin: {fixed_pinyin}")
@@ -1,21 +1,37 @@
-from typing import List, Tuple, Optional
-from sudachipy import tokenizer
-from sudachipy import dictionary
-import jamdict
-import jaconv
+import os
+import json
+import sqlite3
+from pathlib import Path
+from typing import List, Tuple, Optional, Dict
 
-from utils.lang import KanjiUtils
+from utils.lang import KanjiUtils, KanaUtils
 
 
 class ExpressionFilter:
+    KANJI_READINGS_CACHE_PATH = Path(__file__).parent.parent.parent.parent / "resources" / "cache" / "kanjidic_readings.json"
+    KANJI_READINGS_CACHE_VERSION = 1
+
     _tokenizer_obj = None
+    _split_mode = None
+    _jamdict_obj = None
+    _kanji_readings: Optional[Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]] = None
+    _word_readings: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
 
     @classmethod
     def _get_tokenizer(cls):
         if cls._tokenizer_obj is None:
+            from sudachipy import tokenizer, dictionary
             cls._tokenizer_obj = dictionary.Dictionary(dict="full").create()
+            cls._split_mode = tokenizer.Tokenizer.SplitMode
         return cls._tokenizer_obj
 
+    @classmethod
+    def _get_jamdict(cls):
+        if cls._jamdict_obj is None:
+            import jamdict
+            cls._jamdict_obj = jamdict.Jamdict()
+        return cls._jamdict_obj
+
     @staticmethod
     def filter_full_forms(kanji_forms: List[str], reading_forms: List[str]) -> List[Tuple[str, str]]:
         """
@@ -69,7 +85,7 @@ class ExpressionFilter:
         max_kanji_tokens = 0
 
         for form in filtered_forms:
-            tokens = tokenizer_obj.tokenize(form, tokenizer.Tokenizer.SplitMode.C)
+            tokens = tokenizer_obj.tokenize(form, ExpressionFilter._split_mode.C)
 
             # Count tokens that contain at least one kanji character
             kanji_count = sum(1 for char in form if KanjiUtils.is_kanji(char))
@@ -105,7 +121,7 @@ class ExpressionFilter:
             return filtered_readings
 
         tokenizer_obj = ExpressionFilter._get_tokenizer()
-        kanji_tokens = tokenizer_obj.tokenize(kanji_form, tokenizer.Tokenizer.SplitMode.C)
+        kanji_tokens = tokenizer_obj.tokenize(kanji_form, ExpressionFilter._split_mode.C)
         tokenized_reading = ''.join(token.reading_form() for token in kanji_tokens)
 
         scored_readings = []
@@ -169,7 +185,7 @@ class ExpressionFilter:
         focusing on coverage and relevance.
         """
         tokenizer_obj = ExpressionFilter._get_tokenizer()
-        kanji_tokens = tokenizer_obj.tokenize(kanji_form, tokenizer.Tokenizer.SplitMode.B)
+        kanji_tokens = tokenizer_obj.tokenize(kanji_form, ExpressionFilter._split_mode.B)
 
         if not kanji_tokens:
             return 0.0
@@ -191,7 +207,7 @@ class ExpressionFilter:
                 continue
 
             # Handle kanji parts
-            on_readings, kun_readings = ExpressionFilter.get_kanji_readings_jamdict(surface)
+            on_readings, kun_readings = ExpressionFilter.get_kanji_readings(surface)
             all_readings = on_readings + kun_readings
 
             if not all_readings:
@@ -243,9 +259,143 @@ class ExpressionFilter:
         return False
 
 
+    @classmethod
+    def get_kanji_readings(cls, kanji_char: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Cached (on, kun) readings. Single kanji come from the preloaded KANJIDIC table,
+        longer surfaces fall back to a JMdict lookup that is memoised for the run.
+        """
+        if len(kanji_char) == 1:
+            readings = cls.load_kanji_readings()
+            if readings:
+                return readings.get(kanji_char, ((), ()))
+
+        cached = cls._word_readings.get(kanji_char)
+        if cached is None:
+            on_readings, kun_readings = cls.get_kanji_readings_jamdict(kanji_char)
+            cached = (tuple(on_readings), tuple(kun_readings))
+            cls._word_readings[kanji_char] = cached
+
+        return cached
+
+    @classmethod
+    def load_kanji_readings(cls) -> Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """
+        Load the kanji -> (on, kun) table, from the local cache file if it matches the
+        current jamdict database, otherwise built once from KANJIDIC and written back.
+        """
+        if cls._kanji_readings is not None:
+            return cls._kanji_readings
+
+        db_path = cls._get_kanjidic_db_path()
+        source_key = cls._get_source_key(db_path)
+
+        readings = cls._read_kanji_readings_cache(source_key)
+        if readings is None:
+            readings = cls._build_kanji_readings(db_path)
+            if readings:
+                cls._write_kanji_readings_cache(readings, source_key)
+
+        cls._kanji_readings = readings
+        return readings
+
+    @classmethod
+    def _get_kanjidic_db_path(cls) -> Optional[str]:
+        jmd = cls._get_jamdict()
+        db_path = jmd.kd2_file or jmd.db_file
+        if db_path and os.path.isfile(db_path):
+            return db_path
+
+        return None
+
+    @staticmethod
+    def _get_source_key(db_path: Optional[str]) -> Optional[Dict]:
+        if not db_path:
+            return None
+
+        stat = os.stat(db_path)
+        return {
+            "version": ExpressionFilter.KANJI_READINGS_CACHE_VERSION,
+            "path": os.path.abspath(db_path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size
+        }
+
+    @classmethod
+    def _read_kanji_readings_cache(cls, source_key: Optional[Dict]) -> Optional[Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]]:
+        cache_path = cls.KANJI_READINGS_CACHE_PATH
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"漢字読みキャッシュを読み込めませんでした: {e}")
+            return None
+
+        # Without a database to compare against, any existing cache is better than nothing
+        if source_key is not None and data.get("source") != source_key:
+            return None
+
+        return {
+            kanji: (tuple(on_readings), tuple(kun_readings))
+            for kanji, (on_readings, kun_readings) in data.get("readings", {}).items()
+        }
+
+    @classmethod
+    def _write_kanji_readings_cache(cls, readings: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]],
+                                    source_key: Optional[Dict]) -> None:
+        cache_path = cls.KANJI_READINGS_CACHE_PATH
+        try:
+            os.makedirs(cache_path.parent, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"source": source_key, "readings": readings}, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"漢字読みキャッシュを書き込めませんでした: {e}")
+
+    @staticmethod
+    def _build_kanji_readings(db_path: Optional[str]) -> Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """Read every ja_on/ja_kun reading of the first reading group of each KANJIDIC character"""
+        if not db_path:
+            return {}
+
+        query = """
+            SELECT c.literal, r.r_type, r.value
+            FROM character c
+            JOIN rm_group g ON g.ID = (SELECT MIN(ID) FROM rm_group WHERE cid = c.ID)
+            JOIN reading r ON r.gid = g.ID
+            WHERE r.r_type IN ('ja_on', 'ja_kun')
+            ORDER BY c.ID, r.rowid
+        """
+
+        grouped: Dict[str, Tuple[List[str], List[str]]] = {}
+        try:
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            try:
+                for literal, reading_type, reading_value in conn.execute(query):
+                    reading_value = KanaUtils.hira2kata(KanjiUtils.clean_reading(reading_value))
+                    if not reading_value:
+                        continue
+
+                    on_readings, kun_readings = grouped.setdefault(literal, ([], []))
+                    if reading_type == "ja_on":
+                        on_readings.append(reading_value)
+                    else:
+                        kun_readings.append(reading_value)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"KANJIDICから漢字読みを読み込めませんでした: {e}")
+            return {}
+
+        return {kanji: (tuple(on), tuple(kun)) for kanji, (on, kun) in grouped.items()}
+
     @staticmethod
     def get_kanji_readings_jamdict(kanji_char: str) -> Optional[Tuple[List[str], List[str]]]:
-        jmd = jamdict.Jamdict()
+        jmd = ExpressionFilter._get_jamdict()
         result = jmd.lookup(kanji_char)
         if not result:
             return [], []
@@ -261,7 +411,7 @@ class ExpressionFilter:
                     for kana_entry in kana_entries:
                         kana_text = kana_entry.get('text', '')
                         kana_text = KanjiUtils.clean_reading(kana_text)
-                        kana_text = jaconv.hira2kata(kana_text)
+                        kana_text = KanaUtils.hira2kata(kana_text)
                         kana_readings.append(kana_text)
             except Exception:
                 return [], []
@@ -281,7 +431,7 @@ class ExpressionFilter:
                 reading_type = reading_entry.get('type', '')
                 reading_value = reading_entry.get('value', '')
                 reading_value = KanjiUtils.clean_reading(reading_value)
-                reading_value = jaconv.hira2kata(reading_value)
+                reading_value = KanaUtils.hira2kata(reading_value)
 
                 if reading_value and reading_type == "ja_on":
                     on_readings.append(reading_value)
@@ -347,3 +497,32 @@ if __name__ == "__main__":
 
         count += 1
 
+    # Benchmark filter_full_forms with per-call jamdict queries against the cached reading table
+    import time
+
+    def run_cases(rounds: int) -> Tuple[float, List]:
+        start = time.perf_counter()
+        outputs = []
+        for _ in range(rounds):
+            outputs = [ExpressionFilter.filter_full_forms(k, r) for k, r in zip(kanji_test_cases, reading_test_cases)]
+        return time.perf_counter() - start, outputs
+
+    rounds = 5
+    calls = rounds * len(kanji_test_cases)
+
+    cached_lookup = ExpressionFilter.get_kanji_readings
+    ExpressionFilter.get_kanji_readings = staticmethod(ExpressionFilter.get_kanji_readings_jamdict)
+    uncached_time, uncached_results = run_cases(rounds)
+    ExpressionFilter.get_kanji_readings = cached_lookup
+
+    load_start = time.perf_counter()
+    ExpressionFilter.load_kanji_readings()
+    load_time = time.perf_counter() - load_start
+    cached_time, cached_results = run_cases(rounds)
+
+    print("\n---- Benchmark ----")
+    print(f"  Reading table load: {load_time:.2f}s ({len(ExpressionFilter._kanji_readings)} kanji)")
+    print(f"  jamdict per call:   {calls / uncached_time:.1f} calls/s")
+    print(f"  Cached table:       {calls / cached_time:.1f} calls/s")
+    print(f"  Identical results:  {uncached_results == cached_results}")
+
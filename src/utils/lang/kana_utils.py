@@ -0,0 +1,53 @@
+from typing import Dict
+
+# Katakana ァ (U+30A1) to ヶ (U+30F6) and ヽヾ sit exactly 0x60 above their hiragana.
+# ヷヸヹヺ have no hiragana form and are left as they are, as jaconv does.
+_KATAKANA_CODEPOINTS = list(range(0x30A1, 0x30F7)) + [0x30FD, 0x30FE]
+
+
+class KanaUtils:
+    """
+    Hiragana/katakana conversion on precomputed str.translate tables, with the same mapping
+    as jaconv.kata2hira / hira2kata. Readings and keys repeat a lot (every kanji of a page,
+    every page of an idiom family), so short inputs are memoised per direction.
+    """
+    KATA_TO_HIRA_TABLE = {code: chr(code - 0x60) for code in _KATAKANA_CODEPOINTS}
+    HIRA_TO_KATA_TABLE = {code - 0x60: chr(code) for code in _KATAKANA_CODEPOINTS}
+
+    # Only keys up to this length are memoised, and each memo is cleared when it fills up
+    MEMO_MAX_KEY_LENGTH = 32
+    MEMO_MAX_SIZE = 1 << 16
+    _kata2hira_memo: Dict[str, str] = {}
+    _hira2kata_memo: Dict[str, str] = {}
+
+    @staticmethod
+    def kata2hira(text: str) -> str:
+        result = KanaUtils._kata2hira_memo.get(text)
+        if result is None:
+            result = text.translate(KanaUtils.KATA_TO_HIRA_TABLE)
+            KanaUtils._remember(KanaUtils._kata2hira_memo, text, result)
+        return result
+
+
+    @staticmethod
+    def hira2kata(text: str) -> str:
+        result = KanaUtils._hira2kata_memo.get(text)
+        if result is None:
+            result = text.translate(KanaUtils.HIRA_TO_KATA_TABLE)
+            KanaUtils._remember(KanaUtils._hira2kata_memo, text, result)
+        return result
+
+
+    @staticmethod
+    def _remember(memo: Dict[str, str], text: str, result: str) -> None:
+        if len(text) > KanaUtils.MEMO_MAX_KEY_LENGTH:
+            return
+        if len(memo) >= KanaUtils.MEMO_MAX_SIZE:
+            memo.clear()
+        memo[text] = result
+
+
+    @staticmethod
+    def clear_cache() -> None:
+        KanaUtils._kata2hira_memo.clear()
+        KanaUtils._hira2kata_memo.clear()
@@ -1,24 +1,12 @@
 import regex as re
 from typing import List, Tuple, Optional
 
+from utils.instrumentation import Instrumentation
+from . import patterns
+
 
 class KanjiUtils:
-    CJK_IDEOGRAPH_PATTERN = re.compile(r'[\p{Han}'
-                                     r'\p{InCJK_Compatibility_Ideographs}'
-                                     r'\p{InCJK_Compatibility_Ideographs_Supplement}'
-                                     r'\p{InCJK_Unified_Ideographs_Extension_A}'
-                                     r'\p{InCJK_Unified_Ideographs_Extension_B}'
-                                     r'\p{InCJK_Unified_Ideographs_Extension_C}'
-                                     r'\p{InCJK_Unified_Ideographs_Extension_D}'
-                                     r'\p{InCJK_Unified_Ideographs_Extension_E}'
-                                     r'\p{InCJK_Unified_Ideographs_Extension_F}'
-                                     r'\p{InCJK_Unified_Ideographs_Extension_G}'
-                                     r'\p{InCJK_Unified_Ideographs_Extension_H}'
-                                     r'\p{InCJK_Unified_Ideographs_Extension_I}'
-                                     r'\p{InCJK_Radicals_Supplement}'
-                                     r'\p{InKangxi_Radicals}'
-                                     r'\p{InIdeographic_Description_Characters}'
-                                     r'々〇〻]') 
+    CJK_IDEOGRAPH_PATTERN = patterns.CJK_IDEOGRAPH_PATTERN
     IS_NOT_JAPANESE_PATTERN = re.compile(r'[^\p{N}○◯々-〇〻ぁ-ゖゝ-ゞァ-ヺー０-９Ａ-Ｚｦ-ﾝ\p{Radical}\p{Unified_Ideograph}]+')
     JAPANESE_PATTERN = re.compile(r"[\p{Hiragana}\p{Katakana}\p{Unified_Ideograph}]+", re.UNICODE)
     
@@ -40,9 +28,8 @@ class KanjiUtils:
         if len(char) != 1:
             raise ValueError("This function checks a single character only")
             
-        # Using a regex pattern that includes all Katakana blocks
-        pattern = r'[ー\p{Katakana}\p{Block: Katakana_Phonetic_Extensions}]'
-        return bool(re.fullmatch(pattern, char))
+        # Includes all Katakana blocks
+        return bool(patterns.KATAKANA_CHAR_PATTERN.fullmatch(char))
     
     
     @staticmethod
@@ -51,23 +38,22 @@ class KanjiUtils:
             raise ValueError("This function checks a single character only")
             
         # ひらがな拡張Aから
-        pattern = r'[\p{Hiragana}\U0001B11F\U0001B120\U0001B121\U0001B122]'
-        return bool(re.fullmatch(pattern, char))
+        return bool(patterns.HIRAGANA_CHAR_PATTERN.fullmatch(char))
     
     
     @staticmethod
     def is_only_katakana(text: str) -> bool:
-        return bool(re.fullmatch(r'[ー\p{Katakana}\p{Block: Katakana_Phonetic_Extensions}]+', text))
+        return bool(patterns.KATAKANA_ONLY_PATTERN.fullmatch(text))
     
     
     @staticmethod
     def is_only_hiragana(text: str) -> bool:
-        return bool(re.fullmatch(r'[\p{Hiragana}]+', text))
+        return bool(patterns.HIRAGANA_ONLY_PATTERN.fullmatch(text))
     
     
     @staticmethod
     def is_only_kana(text: str) -> bool:
-        return bool(re.fullmatch(r'[ー\p{Hiragana}\p{Katakana}\p{Block: Kana_Extended_A}\p{Block: Kana_Extended_B}\p{Block: Kana_Supplement}\p{Block: Katakana_Phonetic_Extensions}]+', text))
+        return bool(patterns.KANA_ONLY_PATTERN.fullmatch(text))
     
     
     @staticmethod
@@ -78,12 +64,12 @@ class KanjiUtils:
     
     @staticmethod
     def clean_reading(reading: str) -> str:
-        return re.sub(r'[^ー\p{Hiragana}\p{Katakana}\p{Block: Kana_Extended_A}\p{Block: Kana_Extended_B}\p{Block: Kana_Supplement}\p{Block: Katakana_Phonetic_Extensions}]', "", reading)
+        return patterns.NON_READING_PATTERN.sub("", reading)
     
     
     @staticmethod
     def clean_headword(head_word: str) -> str:
-        return re.sub(r'[^・\p{Unified_Ideograph}ー\p{Hiragana}\p{Katakana}\p{Block: Kana_Extended_A}\p{Block: Kana_Extended_B}\p{Block: Kana_Supplement}\p{Block: Katakana_Phonetic_Extensions}]', "", head_word)
+        return patterns.NON_HEADWORD_PATTERN.sub("", head_word)
     
     
     """
@@ -99,6 +85,7 @@ class KanjiUtils:
     (None, 'かなしぶ')
     """
     @staticmethod
+    @Instrumentation.timed("kana_kanji_matching")
     def match_kana_with_kanji(entries: List[str], recursion_level: int = 0) -> List[Tuple[Optional[str], Optional[str]]]:
         # Returns: List of DicEntry objects with paired kanji and kana matches
             
@@ -0,0 +1,72 @@
+"""
+Precompiled patterns and str.translate tables for the hot text helpers.
+
+Helpers used to pass raw pattern strings to re.sub/re.fullmatch (or build them per call),
+which costs a pattern-cache lookup, and for long alternations a string build, on every
+character or headword. Everything here is compiled once at import.
+"""
+import regex as re
+
+# ----- Character classes ----- #
+
+# Body of a character class matching every CJK ideograph block, radicals and ideographic description characters
+CJK_IDEOGRAPH_CLASS = (
+    r'\p{Han}'
+    r'\p{InCJK_Compatibility_Ideographs}'
+    r'\p{InCJK_Compatibility_Ideographs_Supplement}'
+    r'\p{InCJK_Unified_Ideographs_Extension_A}'
+    r'\p{InCJK_Unified_Ideographs_Extension_B}'
+    r'\p{InCJK_Unified_Ideographs_Extension_C}'
+    r'\p{InCJK_Unified_Ideographs_Extension_D}'
+    r'\p{InCJK_Unified_Ideographs_Extension_E}'
+    r'\p{InCJK_Unified_Ideographs_Extension_F}'
+    r'\p{InCJK_Unified_Ideographs_Extension_G}'
+    r'\p{InCJK_Unified_Ideographs_Extension_H}'
+    r'\p{InCJK_Unified_Ideographs_Extension_I}'
+    r'\p{InCJK_Radicals_Supplement}'
+    r'\p{InKangxi_Radicals}'
+    r'\p{InIdeographic_Description_Characters}'
+)
+KATAKANA_CLASS = r'ー\p{Katakana}\p{Block: Katakana_Phonetic_Extensions}'
+# ひらがな拡張Aから
+HIRAGANA_CLASS = r'\p{Hiragana}\U0001B11F\U0001B120\U0001B121\U0001B122'
+KANA_CLASS = (
+    r'ー\p{Hiragana}\p{Katakana}\p{Block: Kana_Extended_A}\p{Block: Kana_Extended_B}'
+    r'\p{Block: Kana_Supplement}\p{Block: Katakana_Phonetic_Extensions}'
+)
+
+HANZI_PATTERN = re.compile(f'[{CJK_IDEOGRAPH_CLASS}]')
+CJK_IDEOGRAPH_PATTERN = re.compile(f'[{CJK_IDEOGRAPH_CLASS}々〇〻]')
+KATAKANA_CHAR_PATTERN = re.compile(f'[{KATAKANA_CLASS}]')
+HIRAGANA_CHAR_PATTERN = re.compile(f'[{HIRAGANA_CLASS}]')
+KATAKANA_ONLY_PATTERN = re.compile(f'[{KATAKANA_CLASS}]+')
+HIRAGANA_ONLY_PATTERN = re.compile(r'[\p{Hiragana}]+')
+KANA_ONLY_PATTERN = re.compile(f'[{KANA_CLASS}]+')
+NON_READING_PATTERN = re.compile(f'[^{KANA_CLASS}]')
+NON_HEADWORD_PATTERN = re.compile(f'[^・\\p{{Unified_Ideograph}}{KANA_CLASS}]')
+
+# ----- Pinyin ----- #
+
+# Digits and whitespace are covered too: after lower() only ASCII letters survive
+NON_PINYIN_LETTER_PATTERN = re.compile(r'[^a-z]')
+
+# ----- Headword punctuation ----- #
+
+# 【】〖〗△［］ around 熟語 headwords (漢字源)
+JUKUGO_HEADWORD_STRIP_TABLE = str.maketrans('', '', '【】〗〖△［］')
+
+# ----- Ruby markup in index strings ({RB:漢字:かんじ}) ----- #
+
+RB_TAG_PATTERN = re.compile(r'\{RB:([^:]+):([^}]+)\}')
+RB_ANY_TAG_PATTERN = re.compile(r'\{RB:[^}]+\}')
+# Grammar labels written as ruby (活用, 関連, 敬語, 参考) that aren't part of the headword
+RB_LABEL_PATTERN = re.compile(r'\{RB:(?:活:かつ|用:よう|関:かん|連:れん|敬:けい|語:ご|参:さん|考:こう)\}')
+
+# ----- Furigana written inline in definitions ----- #
+
+# カタカナ漢字 at the start of a definition
+LEADING_FURIGANA_PATTERN = re.compile(r'^(?<furigana>\p{Katakana}+)(?<kanji>\p{Han}+)')
+# 「漢字カタカナ」, 「鸒𪆁・鸒斯イシ」, 「髻タブサ・モトドリ」
+QUOTED_FURIGANA_PATTERN = re.compile(r'[「・](?<kanji>\p{Han}+(?:・\p{Han}+)?)(?<furigana>\p{Katakana}+(?:・\p{Katakana}+)?)(?:」)?')
+# 漢字(かな)
+PARENTHESISED_FURIGANA_PATTERN = re.compile(r'([^()]+)\(([^)]+)\)')
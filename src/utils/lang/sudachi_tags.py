@@ -1,5 +1,4 @@
 from typing import List, Dict
-from sudachipy import tokenizer, dictionary, SplitMode
 
 __U_KANA_LIST = ["う", "く", "す", "つ", "ぬ", "ふ", "む",
                  "ゆ", "る", "ぐ", "ず", "づ", "ぶ", "ぷ"]
@@ -9,6 +8,7 @@ __SUDACHI_DICTIONARY = None
 
 def sudachi_rules(expression: str) -> str:
     global __SUDACHI_DICTIONARY
+    from sudachipy import tokenizer, dictionary
     if __SUDACHI_DICTIONARY is None:
         __SUDACHI_DICTIONARY = dictionary.Dictionary(dict="full").create()
     # categories = load_yomichan_inflection_categories()
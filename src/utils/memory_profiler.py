@@ -0,0 +1,144 @@
+import os
+import sys
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+# Source root (src/), used to attribute allocations to this project's modules
+_SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Wrapper frames that would otherwise take the blame for the functions they time
+_SKIPPED_FILES = {
+    os.path.join(_SOURCE_ROOT, "utils", "instrumentation.py"),
+    os.path.join(_SOURCE_ROOT, "utils", "memory_profiler.py"),
+}
+
+
+class MemoryProfiler:
+    """
+    Opt-in memory high-water tracking. At each stage boundary the RSS and tracemalloc
+    usage are sampled; the peak is attributed to the modules that allocated the most,
+    taken from the snapshot of the heaviest checkpoint.
+    """
+    enabled = False
+    top_n = 10
+    traceback_frames = 8
+
+    _checkpoints: List[Dict[str, Any]] = []
+    _peak_snapshot: Optional[tracemalloc.Snapshot] = None
+    _peak_checkpoint: Optional[str] = None
+    _peak_traced = 0
+
+    @classmethod
+    def enable(cls, top_n: int = 10) -> None:
+        cls.enabled = True
+        cls.top_n = top_n
+        cls._checkpoints = []
+        cls._peak_snapshot = None
+        cls._peak_checkpoint = None
+        cls._peak_traced = 0
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(cls.traceback_frames)
+        cls.checkpoint("start")
+
+    @classmethod
+    def checkpoint(cls, stage: str) -> None:
+        if not cls.enabled:
+            return
+
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        cls._checkpoints.append({
+            "stage": stage,
+            "rss_mb": round(cls.get_rss() / (1 << 20), 1),
+            "traced_mb": round(current / (1 << 20), 1),
+            "traced_peak_mb": round(peak / (1 << 20), 1)
+        })
+
+        if current > cls._peak_traced:
+            cls._peak_traced = current
+            cls._peak_checkpoint = stage
+            cls._peak_snapshot = tracemalloc.take_snapshot()
+
+    @classmethod
+    def finish(cls) -> Optional[Dict[str, Any]]:
+        """Stop tracing, print the summary and return the memory section of the run report"""
+        if not cls.enabled:
+            return None
+
+        cls.checkpoint("end")
+        report = {
+            "checkpoints": cls._checkpoints,
+            "peak_rss_mb": max(c["rss_mb"] for c in cls._checkpoints),
+            "peak_traced_mb": max(c["traced_peak_mb"] for c in cls._checkpoints),
+            "peak_checkpoint": cls._peak_checkpoint,
+            "top_modules": cls._top_modules(cls._peak_snapshot) if cls._peak_snapshot else []
+        }
+
+        tracemalloc.stop()
+        cls._peak_snapshot = None
+        cls.enabled = False
+
+        print(f"\n{'メモリ計測点':<32}{'RSS(MB)':>10}{'追跡(MB)':>10}{'区間最大(MB)':>14}")
+        for checkpoint in report["checkpoints"]:
+            print(f"{checkpoint['stage']:<32}{checkpoint['rss_mb']:>10.1f}{checkpoint['traced_mb']:>10.1f}"
+                  f"{checkpoint['traced_peak_mb']:>14.1f}")
+        print(f"最大使用時点: {report['peak_checkpoint']}")
+        for module in report["top_modules"]:
+            print(f"  {module['module']}: {module['mb']:.1f}MB ({module['blocks']}ブロック)")
+
+        return report
+
+    @staticmethod
+    def get_rss() -> int:
+        """Resident set size in bytes (psutil when installed, otherwise /proc or getrusage)"""
+        try:
+            import psutil
+            return psutil.Process().memory_info().rss
+        except ImportError:
+            pass
+
+        try:
+            with open("/proc/self/statm", "r") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            pass
+
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+    @classmethod
+    def _top_modules(cls, snapshot: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        """Group live allocations by the innermost project module on their traceback"""
+        sizes = defaultdict(int)
+        blocks = defaultdict(int)
+
+        for stat in snapshot.statistics("traceback"):
+            module = cls._attribute(stat.traceback)
+            sizes[module] += stat.size
+            blocks[module] += stat.count
+
+        top = sorted(sizes.items(), key=lambda x: x[1], reverse=True)[:cls.top_n]
+        return [
+            {"module": module, "mb": round(size / (1 << 20), 2), "blocks": blocks[module]}
+            for module, size in top
+        ]
+
+    @staticmethod
+    def _attribute(traceback: tracemalloc.Traceback) -> str:
+        # Frames are ordered oldest first; prefer the most recent frame inside the project
+        frames = list(traceback)
+        for frame in reversed(frames):
+            if frame.filename.startswith(_SOURCE_ROOT) and frame.filename not in _SKIPPED_FILES:
+                relative = os.path.relpath(frame.filename, _SOURCE_ROOT)
+                return os.path.splitext(relative)[0].replace(os.sep, ".")
+
+        filename = frames[-1].filename if frames else "<unknown>"
+        if filename.startswith("<"):
+            return filename
+        if "site-packages" in filename:
+            return filename.split("site-packages" + os.sep, 1)[1].split(os.sep, 1)[0]
+        return os.path.splitext(os.path.basename(filename))[0]
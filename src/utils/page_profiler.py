@@ -0,0 +1,164 @@
+import os
+import json
+import heapq
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class PageProfiler:
+    """
+    Opt-in per-page cost tracking. Every _process_file call is recorded with its wall time,
+    entry count, converted node count and output bytes. Records are streamed to page_profile.tsv,
+    and a top-N slowest-pages report plus a time histogram are written to page_profile.json.
+    """
+    # Upper bounds (ms) of the histogram buckets; the last bucket is open-ended
+    HISTOGRAM_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+    enabled = False
+    top_n = 50
+    output_folder: Optional[str] = None
+
+    _tsv_file = None
+    _slowest: List[Tuple[float, int, Dict[str, Any]]] = []
+    _histogram: List[int] = []
+    _totals: Dict[str, float] = {}
+    _page_count = 0
+
+    _current_page: Optional[str] = None
+    _page_start = 0.0
+    _page_nodes = 0
+    _page_bytes = 0
+    _page_overhead = 0.0
+
+    @classmethod
+    def enable(cls, output_folder: str, top_n: int = 50) -> None:
+        cls.enabled = True
+        cls.top_n = top_n
+        cls.output_folder = output_folder
+        cls._slowest = []
+        cls._histogram = [0] * (len(cls.HISTOGRAM_BOUNDS_MS) + 1)
+        cls._totals = {"seconds": 0.0, "entries": 0, "nodes": 0, "bytes": 0}
+        cls._page_count = 0
+
+        os.makedirs(output_folder, exist_ok=True)
+        cls._tsv_file = open(os.path.join(output_folder, "page_profile.tsv"), "w", encoding="utf-8")
+        cls._tsv_file.write("file\tms\tentries\tnodes\tbytes\n")
+
+    @classmethod
+    def start_page(cls, filename: str) -> None:
+        cls._current_page = filename
+        cls._page_nodes = 0
+        cls._page_bytes = 0
+        cls._page_overhead = 0.0
+        cls._page_start = time.perf_counter()
+
+    @classmethod
+    def record_entry(cls, entry) -> None:
+        """Add an entry's converted node count and serialised size to the current page"""
+        if cls._current_page is None:
+            return
+
+        start_time = time.perf_counter()
+        cls._page_nodes += PageProfiler._count_nodes(entry.content)
+        cls._page_bytes += len(json.dumps(entry.to_list(), ensure_ascii=False).encode("utf-8"))
+        # Measuring the entry shouldn't count towards the page's cost
+        cls._page_overhead += time.perf_counter() - start_time
+
+    @classmethod
+    def end_page(cls, entry_count: int) -> None:
+        if cls._current_page is None:
+            return
+
+        elapsed = time.perf_counter() - cls._page_start - cls._page_overhead
+        elapsed_ms = elapsed * 1000
+        record = {
+            "file": cls._current_page,
+            "ms": round(elapsed_ms, 3),
+            "entries": entry_count or 0,
+            "nodes": cls._page_nodes,
+            "bytes": cls._page_bytes
+        }
+        cls._current_page = None
+
+        cls._tsv_file.write(f"{record['file']}\t{record['ms']}\t{record['entries']}\t{record['nodes']}\t{record['bytes']}\n")
+
+        # Min-heap of the slowest pages; the counter breaks ties without comparing dicts
+        cls._page_count += 1
+        item = (elapsed, cls._page_count, record)
+        if len(cls._slowest) < cls.top_n:
+            heapq.heappush(cls._slowest, item)
+        elif elapsed > cls._slowest[0][0]:
+            heapq.heapreplace(cls._slowest, item)
+
+        bucket = len(cls.HISTOGRAM_BOUNDS_MS)
+        for i, bound in enumerate(cls.HISTOGRAM_BOUNDS_MS):
+            if elapsed_ms < bound:
+                bucket = i
+                break
+        cls._histogram[bucket] += 1
+
+        cls._totals["seconds"] += elapsed
+        cls._totals["entries"] += record["entries"]
+        cls._totals["nodes"] += record["nodes"]
+        cls._totals["bytes"] += record["bytes"]
+
+    @classmethod
+    def get_report(cls) -> Dict[str, Any]:
+        labels = []
+        lower = 0
+        for bound in cls.HISTOGRAM_BOUNDS_MS:
+            labels.append(f"{lower}-{bound}ms")
+            lower = bound
+        labels.append(f"{lower}ms+")
+
+        return {
+            "pages": cls._page_count,
+            "total_seconds": round(cls._totals.get("seconds", 0.0), 4),
+            "total_entries": cls._totals.get("entries", 0),
+            "total_nodes": cls._totals.get("nodes", 0),
+            "total_bytes": cls._totals.get("bytes", 0),
+            "histogram": dict(zip(labels, cls._histogram)),
+            "slowest_pages": [record for _, _, record in sorted(cls._slowest, key=lambda x: x[0], reverse=True)]
+        }
+
+    @classmethod
+    def finish(cls, print_top: int = 10) -> Optional[Dict[str, Any]]:
+        """Write page_profile.json, print the slowest pages and disable the profiler"""
+        if not cls.enabled:
+            return None
+
+        report = cls.get_report()
+        with open(os.path.join(cls.output_folder, "page_profile.json"), "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        cls._tsv_file.close()
+        cls._tsv_file = None
+        cls.enabled = False
+
+        print(f"\n処理時間が長いページ (上位{min(print_top, len(report['slowest_pages']))}件):")
+        for record in report["slowest_pages"][:print_top]:
+            print(f"  {record['file']}: {record['ms']:.1f}ms, {record['entries']}項目, "
+                  f"{record['nodes']}ノード, {record['bytes']}バイト")
+
+        print("ページ処理時間の分布:")
+        max_count = max(report["histogram"].values()) or 1
+        for label, count in report["histogram"].items():
+            if count:
+                print(f"  {label:>12}: {'█' * max(1, round(count / max_count * 30))} {count}")
+
+        return report
+
+    @staticmethod
+    def _count_nodes(content) -> int:
+        count = 0
+        stack = [content]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                count += 1
+                child = item.get("content")
+                if child is not None and not isinstance(child, str):
+                    stack.append(child)
+            elif isinstance(item, list):
+                stack.extend(item)
+        return count
@@ -0,0 +1,30 @@
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+# core has to be imported before the parser modules pull in config and the strategies
+import core  # noqa: E402,F401
+
+BUILD_SCRIPT = Path(__file__).parent / "synthetic_build.py"
+
+
+def run_build(base_dir: Path, *args: str, hash_seed: int = 0) -> subprocess.CompletedProcess:
+    """Run test/synthetic_build.py in its own process; each build gets its own hash seed, as separate runs would"""
+    env = {**os.environ, "PYTHONHASHSEED": str(hash_seed)}
+    return subprocess.run([sys.executable, str(BUILD_SCRIPT), str(base_dir), *args],
+                          env=env, capture_output=True, text=True)
+
+
+def build_folder(base_dir: Path, *args: str, hash_seed: int = 0) -> Path:
+    """Run a build that has to succeed and return its term bank folder"""
+    result = run_build(base_dir, *args, hash_seed=hash_seed)
+    assert result.returncode == 0, result.stderr
+    return Path(result.stdout.strip().splitlines()[-1])
+
+
+def read_term_banks(folder: Path) -> dict:
+    return {path.name: path.read_bytes() for path in sorted(folder.glob("term_bank_*.json"))}
@@ -1,79 +1,40 @@
-import subprocess
+import sys
 import argparse
 from pathlib import Path
 
-def convert_svg_to_png(svg_file, output_dir=None, dpi=96):
-    svg_path = Path(svg_file)
-    
-    if output_dir:
-        output_path = Path(output_dir) / f"{svg_path.stem}.png"
-    else:
-        output_path = svg_path.with_suffix('.png')
-    
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Build the Inkscape command
-    cmd = [
-        'inkscape',
-        '--export-filename', str(output_path),
-        '--export-dpi', str(dpi),
-        str(svg_path)
-    ]
-    
-    try:
-        # Run Inkscape to convert the file
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        
-        if result.returncode == 0:
-            print(f"Converted: {svg_file} -> {output_path}")
-            return str(output_path)
-        else:
-            print(f"Error converting {svg_file}:")
-            print(result.stderr)
-            return None
-            
-    except Exception as e:
-        print(f"Exception while converting {svg_file}: {str(e)}")
-        return None
+# The conversion stage lives in src/utils so the pipeline and this script share it
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from utils.asset_converter import AssetConverter, BACKENDS
 
-def batch_convert_svgs(input_dir, output_dir=None, dpi=96):
-    input_path = Path(input_dir)
-    
-    svg_files = list(input_path.glob('*.svg'))
-    
-    if not svg_files:
-        print(f"No SVG files found in {input_dir}")
-        return []
-    
-    print(f"Found {len(svg_files)} SVG files in {input_dir}")
-    
-    converted_files = []
-    for svg_file in svg_files:
-        png_file = convert_svg_to_png(svg_file, output_dir, dpi)
-        if png_file:
-            converted_files.append(png_file)
-    
-    print(f"Successfully converted {len(converted_files)} of {len(svg_files)} files")
-    return converted_files
 
 def main():
-    parser = argparse.ArgumentParser(description='Convert SVG files to PNG using Inkscape')
+    parser = argparse.ArgumentParser(description='Convert SVG (and PDF/TIFF) assets to PNG in parallel')
     parser.add_argument('input_dir', help='Directory containing SVG files')
     parser.add_argument('-o', '--output-dir', help='Directory to save PNG files (default: same as input)')
     parser.add_argument('-d', '--dpi', type=int, default=96, help='Output resolution in DPI')
-    
+    parser.add_argument('-e', '--extensions', nargs='+', default=['svg'], help='Source extensions to convert')
+    parser.add_argument('-b', '--backend', choices=BACKENDS, default='auto',
+                        help='inkscape, or python (cairosvg for SVG, Pillow for TIFF); auto prefers inkscape')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='Parallel conversions (default: CPU count)')
+    parser.add_argument('-m', '--manifest', default=None,
+                        help='Content-hash manifest used to skip unchanged files (default: <output dir>/../asset_manifest.json)')
+    parser.add_argument('--no-recursive', action='store_true', help='Only convert files directly inside input_dir')
+
     args = parser.parse_args()
-    
-    # Check if Inkscape is available
+
+    output_dir = Path(args.output_dir or args.input_dir)
+    manifest_path = args.manifest or str(output_dir.parent / "asset_manifest.json")
+
     try:
-        subprocess.run(['inkscape', '--version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-    except (subprocess.SubprocessError, FileNotFoundError):
-        print("Error: Inkscape is not installed or not available in PATH.")
-        print("Please install Inkscape and ensure it's accessible from the command line.")
-        return
-    
-    # Convert SVG files
-    batch_convert_svgs(args.input_dir, args.output_dir, args.dpi)
+        report = AssetConverter.convert_directory(
+            args.input_dir, args.output_dir, args.extensions, args.backend, args.dpi,
+            args.workers, manifest_path, recursive=not args.no_recursive
+        )
+    except (ValueError, RuntimeError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    return 1 if report["failed"] else 0
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Builds the synthetic benchmark dictionary in a separate process, so tests can run builds
+under different PYTHONHASHSEED values and kill them partway through.
+
+    python test/synthetic_build.py <base dir> --generate --pages 300
+    python test/synthetic_build.py <base dir> --chunk-size 7 --crash-after 200
+    python test/synthetic_build.py <base dir> --chunk-size 7 --resume
+"""
+import os
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import core  # noqa: E402,F401
+import core.yomitan  # noqa: E402
+from config import PathManager  # noqa: E402
+from index import IndexRegistry  # noqa: E402
+from benchmark.corpus_generator import SyntheticCorpusGenerator  # noqa: E402
+from benchmark.run_benchmark import create_benchmark_config  # noqa: E402
+
+CRASH_EXIT_CODE = 3
+
+
+def use_test_dictionary(chunk_size: int, crash_after: int) -> None:
+    """Swap in a YomitanDictionary with small chunks that exits without cleanup after crash_after entries"""
+    base_class = core.yomitan.YomitanDictionary
+
+    class TestDictionary(base_class):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.chunk_size = chunk_size
+
+        def _load_checkpoint(self):
+            self.chunk_size = chunk_size
+            return super()._load_checkpoint()
+
+        def add_entry(self, entry) -> bool:
+            if crash_after and self.total_entries >= crash_after:
+                # Like a killed process: no flush, no writer shutdown
+                os._exit(CRASH_EXIT_CODE)
+            return super().add_entry(entry)
+
+    core.yomitan.YomitanDictionary = TestDictionary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the synthetic test dictionary")
+    parser.add_argument("base_dir", type=str)
+    parser.add_argument("--generate", action="store_true", help="Write the synthetic corpus instead of building")
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--crash-after", type=int, default=0, help="Exit abruptly once this many entries were added")
+    parser.add_argument("--resume", action="store_true")
+    parser.add_argument("--shard", type=str, default=None, metavar="I/N")
+    args = parser.parse_args()
+
+    generator = SyntheticCorpusGenerator(args.base_dir, "BENCH", page_count=args.pages, idiom_ratio=0.0, seed=args.seed)
+    if args.generate:
+        generator.generate()
+        return 0
+
+    use_test_dictionary(args.chunk_size, args.crash_after)
+
+    config = create_benchmark_config("BENCH")
+    paths = PathManager(args.base_dir).get_paths(config)
+    if args.shard:
+        from core.sharding import ShardSpec
+        config.shard = ShardSpec.parse(args.shard)
+        paths["term_bank_folder"] = paths["output_path"] / f"{config.dict_name}.shards" / config.shard.folder_name
+    config.resume = args.resume
+    config.set_paths(paths)
+    config.validate_required_paths()
+    config.tag_map_path = str(generator.tag_map_path)
+
+    IndexRegistry.clear()
+    dictionary_parser = config.get_parser_class()(config)
+    dictionary_parser.parse()
+    dictionary_parser.export(paths["output_path"])
+    print(paths["term_bank_folder"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
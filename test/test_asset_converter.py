@@ -0,0 +1,30 @@
+import importlib.util
+
+from utils.asset_converter import AssetConverter
+
+
+def hide_modules(monkeypatch, *modules: str) -> None:
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name, *args: None if name in modules else find_spec(name, *args))
+
+
+def test_missing_converter_module_skips_with_warning(tmp_path, monkeypatch, capsys):
+    (tmp_path / "img").mkdir()
+    (tmp_path / "img" / "scan.tif").write_bytes(b"II*\x00")
+    (tmp_path / "img" / "chart.pdf").write_bytes(b"%PDF-1.4")
+    hide_modules(monkeypatch, "PIL", "cairosvg")
+
+    report = AssetConverter.convert_directory(str(tmp_path), extensions=["tif", "pdf"], backend="python",
+                                              manifest_path=str(tmp_path / "manifest.json"))
+
+    assert report["converted"] == 0
+    assert report["failed"] == {}
+    assert report["missing_modules"] == {"img/scan.tif": "Pillow"}
+    assert report["unsupported"] == ["img/chart.pdf"]
+    assert not (tmp_path / "img" / "scan.png").exists()
+
+    output = capsys.readouterr().out
+    assert "警告: Pillowがインストールされていない" in output
+    assert "img/scan.tif" in output
+    assert "警告: pythonバックエンドでは変換できない" in output
+    assert "img/chart.pdf" in output
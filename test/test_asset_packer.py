@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+
+from utils.asset_packer import AssetPacker
+
+
+def img(path):
+    return {"tag": "img", "path": path}
+
+
+def packaged_paths(packaged, assets):
+    return sorted(Path(path).relative_to(assets).as_posix() for path in packaged)
+
+
+def write_bank(folder, name, rows):
+    (folder / name).write_text(json.dumps(rows, ensure_ascii=False), encoding="utf-8")
+
+
+def test_prepare_prunes_and_rewrites(tmp_path):
+    assets = tmp_path / "assets"
+    (assets / "img").mkdir(parents=True)
+    (assets / "img" / "a.png").write_bytes(b"png a")
+    (assets / "img" / "a_copy.png").write_bytes(b"png a")
+    (assets / "img" / "unused.png").write_bytes(b"png unused")
+    (assets / "img" / "chart.pdf").write_bytes(b"%PDF-1.4")
+    (assets / "img" / "chart.png").write_bytes(b"png chart")
+    (assets / "img" / "figure.eps").write_bytes(b"%!PS-Adobe")
+    (assets / "style.css").write_text("div {}", encoding="utf-8")
+
+    banks = tmp_path / "term_bank"
+    banks.mkdir()
+    content = {"type": "structured-content", "content": [img("img/a.png"), img("img/chart.png")]}
+    write_bank(banks, "term_bank_1.json", [["語", "", "", "", 0, [content], 1, ""]])
+    copy_content = {"type": "structured-content", "content": {"tag": "div", "content": img("img/a_copy.png")}}
+    write_bank(banks, "term_bank_2.json", [["写", "", "", "", 0, [copy_content], 2, ""]])
+    untouched = (banks / "term_bank_1.json").read_bytes()
+
+    packaged = AssetPacker.prepare(str(banks), str(assets), ["pdf", "tif"])
+
+    # Unreferenced images, the duplicate, the converted PDF and the EPS are dropped
+    assert packaged_paths(packaged, assets) == ["img/a.png", "img/chart.png", "style.css"]
+    rewritten = json.loads((banks / "term_bank_2.json").read_text(encoding="utf-8"))
+    assert rewritten[0][5][0]["content"]["content"] == img("img/a.png")
+    assert (banks / "term_bank_1.json").read_bytes() == untouched
+
+
+def test_prepare_keeps_referenced_conversion_sources(tmp_path):
+    assets = tmp_path / "assets"
+    (assets / "img").mkdir(parents=True)
+    (assets / "img" / "doc.pdf").write_bytes(b"%PDF-1.4")
+    (assets / "img" / "other.pdf").write_bytes(b"%PDF-1.5")
+
+    banks = tmp_path / "term_bank"
+    banks.mkdir()
+    write_bank(banks, "term_bank_1.json", [["語", "", "", "", 0, [{"type": "image", "path": "img/doc.pdf"}], 1, ""]])
+
+    packaged = AssetPacker.prepare(str(banks), str(assets), [".PDF"])
+
+    assert packaged_paths(packaged, assets) == ["img/doc.pdf"]
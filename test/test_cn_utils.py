@@ -0,0 +1,37 @@
+import random
+
+import dragonmapper.transcriptions as dt
+import pytest
+
+from utils.lang import CNUtils
+
+SYLLABLES = [syllable for syllable in dt._PINYIN_MAP if syllable != "Pinyin"]
+
+
+def convert(function, text):
+    try:
+        return function(text)
+    except ValueError:
+        return ValueError
+
+
+@pytest.fixture(scope="module")
+def samples():
+    rng = random.Random(0)
+    samples = ["Xi'an", "xi'an", "Zhong1guo2", "zhōng guó", "ni3 hao3", "lǜ", "lv4", "nü3", "hello", "", "r",
+               "er5", "ABC", "zhong-guo", "Nǐ hǎo!", "yi1 ge4", "ㄓㄨㄥ ㄍㄨㄛˊ"]
+    for _ in range(2000):
+        numbered = "".join(rng.choice(SYLLABLES) + str(rng.randint(1, 5)) for _ in range(rng.randint(1, 4)))
+        samples += [numbered, dt.numbered_to_accented(numbered), numbered.capitalize(), numbered.replace("5", "'")]
+    CNUtils.clear_cache()
+    return samples
+
+
+def test_is_pinyin_matches_dragonmapper(samples):
+    assert [CNUtils.is_pinyin(text) for text in samples] == [dt.is_pinyin(text) for text in samples]
+
+
+def test_to_zhuyin_matches_dragonmapper(samples):
+    # Twice, so cached syllables are checked as well
+    for _ in range(2):
+        assert [convert(CNUtils.to_zhuyin, text) for text in samples] == [convert(dt.to_zhuyin, text) for text in samples]
@@ -0,0 +1,98 @@
+import copy
+
+import bs4
+import pytest
+
+from core import HTMLToYomitanConverter
+from core.yomitan import ContentMinifier
+
+
+def span(content, **attributes):
+    return {"tag": "span", "content": content, **attributes}
+
+
+# (name, structured content, expected minified content)
+CASES = [
+    ("bare span unwrapped into its parent",
+     {"tag": "div", "data": {"x": ""}, "content": [span("a"), span([span("b")])]},
+     {"tag": "div", "data": {"x": ""}, "content": "ab"}),
+
+    ("bare span kept under tr",
+     {"tag": "tr", "content": [span("cell text"), {"tag": "td", "content": [span("1")]}]},
+     {"tag": "tr", "content": [span("cell text"), {"tag": "td", "content": "1"}]}),
+
+    ("bare span kept under ul",
+     {"tag": "ul", "content": [span([span("a")]), {"tag": "li", "content": [span("b")]}]},
+     {"tag": "ul", "content": [span("a"), {"tag": "li", "content": "b"}]}),
+
+    ("bare spans unwrapped inside ruby and rt",
+     {"tag": "ruby", "content": [span("漢"), {"tag": "rt", "content": [span("かん")]},
+                                 span("字"), {"tag": "rt", "content": [span("じ")]}]},
+     {"tag": "ruby", "content": ["漢", {"tag": "rt", "content": "かん"}, "字", {"tag": "rt", "content": "じ"}]}),
+
+    ("empty data, style and title dropped",
+     {"tag": "div", "data": {}, "style": {}, "title": "", "content": [span("x", data={}, style={})]},
+     {"tag": "div", "content": "x"}),
+
+    ("empty content dropped",
+     {"tag": "td", "content": [], "rowSpan": 2},
+     {"tag": "td", "rowSpan": 2}),
+
+    ("one-item lists stored as the item",
+     {"tag": "div", "data": {"a": ""}, "content": [span(["t"], data={"b": ""})]},
+     {"tag": "div", "data": {"a": ""}, "content": span("t", data={"b": ""})}),
+
+    ("data naming only the tag is kept",
+     span([span("x")], data={"span": ""}),
+     span("x", data={"span": ""})),
+
+    ("adjacent text spans with the same data joined",
+     [span([span("bo")], data={"b": ""}), span([span("ld")], data={"b": ""}), span("!", data={"i": ""})],
+     [span("bold", data={"b": ""}), span("!", data={"i": ""})]),
+
+    ("spans with other attributes are not joined",
+     [span("a", data={"b": ""}, title="t"), span("b", data={"b": ""}, title="t")],
+     [span("a", data={"b": ""}, title="t"), span("b", data={"b": ""}, title="t")]),
+
+    ("text is not joined across other elements",
+     ["a", {"tag": "br"}, span("b")],
+     ["a", {"tag": "br"}, "b"]),
+
+    ("href kept even when empty",
+     {"tag": "a", "href": "", "content": [span("link")]},
+     {"tag": "a", "href": "", "content": "link"}),
+
+    ("img path kept, false flags kept, empty attributes dropped",
+     {"tag": "img", "path": "", "collapsed": False, "data": {}, "title": ""},
+     {"tag": "img", "path": "", "collapsed": False}),
+]
+
+
+@pytest.mark.parametrize("content, expected", [case[1:] for case in CASES], ids=[case[0] for case in CASES])
+def test_minify_content(content, expected):
+    original = copy.deepcopy(content)
+    assert ContentMinifier.minify_content(content) == expected
+    assert content == original
+
+
+def test_minify_converter_output():
+    soup = bs4.BeautifulSoup('<div class="meaning">a<b>bold</b><ruby>漢<rt>かん</rt></ruby></div>', "html.parser")
+    element = HTMLToYomitanConverter().convert_element_to_yomitan(soup.div)
+
+    assert ContentMinifier.minify_content([element]) == {
+        "tag": "div",
+        "data": {"div": "", "meaning": ""},
+        "content": [
+            "a",
+            span("bold", data={"b": ""}),
+            {"tag": "ruby", "data": {"ruby": ""}, "content": ["漢", {"tag": "rt", "data": {"rt": ""}, "content": "かん"}]},
+        ],
+    }
+
+
+def test_minify_definitions_only_touches_structured_content():
+    definitions = ["plain text", {"type": "structured-content", "content": [span("x")]}, {"type": "image", "path": "a.png"}]
+
+    assert ContentMinifier.minify_definitions(definitions) == [
+        "plain text", {"type": "structured-content", "content": "x"}, {"type": "image", "path": "a.png"}
+    ]
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from core.mdx_json_iterator import MdxJsonIterator
+from parsers.NANMED20 import html_fixer
+
+# (name, entry html, fixed html)
+CASES = [
+    ("isolated punctuation span",
+     '<span lang="ja">心臓</span><span lang="ja">.</span><span lang="ja">肺</span>',
+     '<span lang="ja">心臓</span><span lang="ja">。</span><span lang="ja">肺</span>'),
+
+    ("lone punctuation between elements",
+     '<p>心臓<b>弁膜</b>,<b>肺動脈</b></p>',
+     '<p>心臓<b>弁膜</b>、<b>肺動脈</b></p>'),
+
+    ("entities kept through the fix",
+     '<p>左右&vBar;対称,両側性.</p>',
+     '<p>左右&vBar;対称、両側性。</p>'),
+
+    ("text inside links left alone",
+     '<p><a href="x">心臓.肺</a>.心臓</p>',
+     '<p><a href="x">心臓.肺</a>。心臓</p>'),
+
+    ("full-width space between Latin words",
+     '<p>heart　disease, 心臓病.</p>',
+     '<p>heart disease, 心臓病。</p>'),
+
+    ("Latin-only text unchanged",
+     '<p>English text, only.</p>',
+     '<p>English text, only.</p>'),
+]
+
+
+@pytest.mark.parametrize("html, expected", [case[1:] for case in CASES], ids=[case[0] for case in CASES])
+def test_process_html_content(html, expected):
+    assert html_fixer.process_html_content(html)[0] == expected
+
+
+def test_rerun_is_served_from_cache(tmp_path, monkeypatch):
+    entries = [(f"key{i}", html) for i, (_, html, _) in enumerate(CASES)]
+    cache_path = str(tmp_path / "fixes.sqlite")
+
+    stats = {}
+    first = list(html_fixer.fix_entries(entries, workers=1, cache_path=cache_path, stats=stats))
+    assert stats == {"entries": len(CASES), "changed": len(CASES) - 1, "cached": 0}
+    assert first == [(key, expected) for (key, _), (_, _, expected) in zip(entries, CASES)]
+
+    def not_cached(html):
+        raise AssertionError(f"fixed again instead of read from the cache: {html}")
+
+    monkeypatch.setattr(html_fixer, "_fix_entry", not_cached)
+    stats = {}
+    second = list(html_fixer.fix_entries(entries, workers=1, cache_path=cache_path, stats=stats))
+    assert stats["cached"] == len(CASES)
+    assert second == first
+
+
+def test_fix_directory_writes_pages_for_the_parser(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "dictionary.json").write_text(json.dumps({key: html for key, html, _ in CASES}, ensure_ascii=False),
+                                         encoding="utf-8")
+
+    pages = tmp_path / "pages"
+    stats = html_fixer.fix_directory(str(raw), str(pages), workers=1, cache_path=None)
+
+    assert stats["entries"] == len(CASES)
+    assert [path.name for path in pages.iterdir()] == ["dictionary.jsonl"]
+    iterator = MdxJsonIterator(str(pages))
+    assert iterator.get_next_batch(len(CASES) + 1) == [(key, expected) for key, _, expected in CASES]
@@ -0,0 +1,49 @@
+import json
+
+import bs4
+
+from parsers.KJT.kjt_strategies import KJTImageHandlingStrategy
+from strategies.image import HashedImageStrategy
+
+IMAGE_MAP = {"SJ57301.png": "607106bc40.png", "U081a2.svg": "2cecfc6df3.svg"}
+
+
+def make_image(src: str) -> bs4.element.Tag:
+    return bs4.BeautifulSoup(f'<img src="{src}"/>', "html.parser").img
+
+
+def write_image_map(tmp_path) -> str:
+    path = tmp_path / "image_map.json"
+    path.write_text(json.dumps(IMAGE_MAP), encoding="utf-8")
+    return str(path)
+
+
+def test_kjt_resolved_images_are_not_reported(tmp_path):
+    strategy = KJTImageHandlingStrategy(write_image_map(tmp_path))
+
+    png = strategy.handle_image_element(make_image("../img/SJ57301.png"), [], {}, [])
+    svg = strategy.handle_image_element(make_image("../img/U081a2.svg"), [], {}, [])
+
+    assert png["content"][0]["path"] == "img/607106bc40.avif"
+    assert svg["content"][0]["path"] == "img/2cecfc6df3.svg"
+    assert strategy.unresolved_references == 0
+    assert strategy.unresolved_files == set()
+
+
+def test_kjt_missing_image_is_reported_once_per_reference(tmp_path):
+    strategy = KJTImageHandlingStrategy(write_image_map(tmp_path))
+
+    for _ in range(2):
+        strategy.handle_image_element(make_image("../img/missing.png"), [], {}, [])
+
+    assert strategy.unresolved_references == 2
+    assert strategy.unresolved_files == {"missing.png"}
+
+
+def test_hashed_strategy_counts_misses(tmp_path):
+    strategy = HashedImageStrategy(write_image_map(tmp_path))
+
+    assert strategy.get_src_path(make_image("img/U081a2.svg")) == "img/2cecfc6df3.svg"
+    assert strategy.get_src_path(make_image("img/other.svg")) == "img/other.svg"
+    assert strategy.unresolved_references == 1
+    assert strategy.unresolved_files == {"other.svg"}
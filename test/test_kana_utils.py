@@ -0,0 +1,44 @@
+import random
+
+import jaconv
+import pytest
+
+from utils.lang import KanaUtils
+
+# CJK symbols, hiragana, katakana, katakana phonetic extensions, half-width forms, kana supplement/extensions
+KANA_RANGES = [(0x3000, 0x3100), (0x31F0, 0x3200), (0xFF00, 0xFFF0), (0x1AFF0, 0x1B170)]
+CHARACTERS = [chr(code) for start, end in KANA_RANGES for code in range(start, end)]
+
+
+@pytest.fixture(autouse=True)
+def empty_memo():
+    KanaUtils.clear_cache()
+    yield
+    KanaUtils.clear_cache()
+
+
+@pytest.mark.parametrize("direction", ["kata2hira", "hira2kata"])
+def test_every_kana_code_point_matches_jaconv(direction):
+    convert, expected = getattr(KanaUtils, direction), getattr(jaconv, direction)
+    mismatches = [char for char in CHARACTERS if convert(char) != expected(char)]
+    assert mismatches == []
+
+
+@pytest.mark.parametrize("direction", ["kata2hira", "hira2kata"])
+def test_mixed_strings_match_jaconv(direction):
+    rng = random.Random(0)
+    pool = CHARACTERS + list("abc漢字 ")
+    samples = ["".join(rng.choice(pool) for _ in range(rng.randint(1, 40))) for _ in range(5000)]
+
+    convert, expected = getattr(KanaUtils, direction), getattr(jaconv, direction)
+    # Twice, so memoised results are checked as well
+    for _ in range(2):
+        assert [convert(text) for text in samples] == [expected(text) for text in samples]
+
+
+def test_memo_is_bounded(monkeypatch):
+    monkeypatch.setattr(KanaUtils, "MEMO_MAX_SIZE", 4)
+    for text in ["ア", "イ", "ウ", "エ", "オ", "カ" * (KanaUtils.MEMO_MAX_KEY_LENGTH + 1)]:
+        assert KanaUtils.kata2hira(text) == jaconv.kata2hira(text)
+    assert len(KanaUtils._kata2hira_memo) <= 4
+    assert "カ" * (KanaUtils.MEMO_MAX_KEY_LENGTH + 1) not in KanaUtils._kata2hira_memo
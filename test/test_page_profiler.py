@@ -0,0 +1,29 @@
+import pytest
+
+from core.parser_module.base_parser import BaseParser
+from utils import PageProfiler
+
+
+class FailingParser(BaseParser):
+    def __init__(self):
+        pass
+
+    def _process_file(self, filename, file_content):
+        if filename == "bad.html":
+            raise ValueError(filename)
+        return 1
+
+
+def test_failing_page_is_recorded_and_profile_written(tmp_path):
+    PageProfiler.enable(str(tmp_path))
+    try:
+        with pytest.raises(ValueError):
+            FailingParser()._process_batch([("good.html", ""), ("bad.html", "")])
+    finally:
+        report = PageProfiler.finish()
+
+    assert not PageProfiler.enabled
+    assert report["pages"] == 2
+    lines = (tmp_path / "page_profile.tsv").read_text(encoding="utf-8").splitlines()
+    assert [line.split("\t")[0] for line in lines[1:]] == ["good.html", "bad.html"]
+    assert (tmp_path / "page_profile.json").exists()
@@ -0,0 +1,16 @@
+import pytest
+
+import main
+from benchmark.run_benchmark import create_benchmark_config
+
+
+@pytest.mark.parametrize("options", [{"resume": True}, {"shard": "1/2"}])
+def test_audio_dictionaries_reject_partial_builds(tmp_path, options):
+    config = create_benchmark_config("BENCH")
+    config.has_audio = True
+
+    with pytest.raises(ValueError, match="audio index"):
+        main.process_dictionary(config, str(tmp_path), **options)
+    # Rejected before the paths are resolved or anything is parsed
+    assert config.shard is None and not config.resume
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,44 @@
+import json
+import shutil
+
+import pytest
+
+from conftest import build_folder, read_term_banks, run_build
+from core.checkpoint import BuildCheckpoint
+
+CHUNK_SIZE = 7
+CRASH_EXIT_CODE = 3
+
+
+@pytest.fixture(scope="module")
+def reference_build(tmp_path_factory):
+    base_dir = tmp_path_factory.mktemp("resume")
+    assert run_build(base_dir, "--generate").returncode == 0
+
+    folder = build_folder(base_dir, "--chunk-size", str(CHUNK_SIZE), hash_seed=1)
+    reference = read_term_banks(folder)
+    assert reference
+    return base_dir, folder, reference
+
+
+@pytest.mark.parametrize("crash_after", [100, 200, 300])
+def test_resume_after_crash_mid_page(reference_build, crash_after):
+    base_dir, folder, reference = reference_build
+    shutil.rmtree(folder)
+
+    crashed = run_build(base_dir, "--chunk-size", str(CHUNK_SIZE), "--crash-after", str(crash_after), hash_seed=2)
+    assert crashed.returncode == CRASH_EXIT_CODE, crashed.stderr
+
+    # The last durable flush has to land inside a page for this to test anything
+    checkpoint = BuildCheckpoint.load(str(folder))
+    assert checkpoint is not None
+    assert checkpoint["page_entries"] > 0
+
+    resumed = run_build(base_dir, "--chunk-size", str(CHUNK_SIZE), "--resume", hash_seed=3)
+    assert resumed.returncode == 0, resumed.stderr
+    assert "チェックポイントから再開します" in resumed.stdout
+
+    assert read_term_banks(folder) == reference
+    assert BuildCheckpoint.load(str(folder)) is None
+    entries = sum(len(json.loads(data)) for data in reference.values())
+    assert entries > crash_after
@@ -0,0 +1,21 @@
+from conftest import build_folder, read_term_banks, run_build
+from core.sharding import ShardMerger
+
+CHUNK_SIZE = 50
+SHARD_COUNT = 3
+
+
+def test_merged_shards_match_single_build(tmp_path):
+    assert run_build(tmp_path, "--generate").returncode == 0
+    single_folder = build_folder(tmp_path, "--chunk-size", str(CHUNK_SIZE), hash_seed=1)
+    reference = read_term_banks(single_folder)
+    assert len(reference) > 1
+
+    shard_folders = [
+        str(build_folder(tmp_path, "--shard", f"{i}/{SHARD_COUNT}", hash_seed=1 + i))
+        for i in range(1, SHARD_COUNT + 1)
+    ]
+    merged_folder = tmp_path / "merged"
+    ShardMerger.merge(shard_folders, str(merged_folder), chunk_size=CHUNK_SIZE)
+
+    assert read_term_banks(merged_folder) == reference